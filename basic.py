@@ -1,9 +1,13 @@
+import functools
 import getopt
+import mmap
+import os
 import select
 import sys
 import tty
 import termios
 
+from lib import exception
 from lib import parser
 from lib import runtime
 from lib import system
@@ -12,19 +16,34 @@ from lib import value
 # The default command prompt.
 PROMPT = 'READY'
 
+# The engines that RUN can run programs with, by the name given on the command
+# line.  The tree walker is the reference; the machine compiles to bytecode,
+# with its expressions either as closures or as operations of their own; and
+# the transpiler translates the whole program into Python.
+ENGINES = {
+    'closure': functools.partial(runtime.Machine, closures=True),
+    'python': runtime.Transpiler,
+    'tree': runtime.Interpreter,
+    'vm': runtime.Machine,
+}
+
 class Basic:
     """Encapsulates the running state of the whole interpreter."""
     
-    def __init__(self, input_mode='line'):
+    def __init__(self, input_mode='line', engine='tree'):
         self.input_mode = input_mode
+        self.engine = engine
         self.Boot()
         self.REPL()
 
     def Boot(self):
         # Initialize state.
         self.folder = 'default'  # current directory for file operations
-        self.screen = system.Screen()  # tracks texels for full screen
+        self.screen = system.Screen(parser.TokenLine)  # tracks texels
         self.rt = runtime.Runtime(runtime.Program(), runtime.Environment())
+        self.rt.engine = ENGINES[self.engine]()
+        self.rt.files = self  # see Load and Save
+        self.parse_cache = parser.ParseCache()  # recently parsed lines
         self.timer = None  # used in JS version
 
         # Display the initial splash screen.
@@ -49,9 +68,8 @@ class Basic:
             try:
                 tty.setcbreak(sys.stdin.fileno())
                 while True:
-                    ch = self.KeyboardHasData(timeout=0.250)
-                    if ch:
-                        self.KeyPressed(ch)
+                    if self.KeyboardHasData(timeout=0.250):
+                        self.KeyPressed(sys.stdin.read(1))
                     else:
                         self.KeyReleased()
             finally:
@@ -59,21 +77,24 @@ class Basic:
     
         self.screen.WriteLn('Good-bye.')
 
-    def Execute(self, line):
+    def Execute(self, line, stream=None):
         """Attempts to execute the code in a line of input.
         
-        This is invoked by both the read-eval-print loop and the LOAD command,
-        which basically simulates typing in the program from the REPL.
+        This is invoked by the read-eval-print loop.  (LOAD used to simulate
+        typing in the program here, line by line, but now goes through Load.)
+
+        If the line has already been tokenized, as with lines typed at the
+        full-screen editor, the tokens can be passed in as a stream.
         
         Returns true if the execution was successful.
         """
-        # Build a parser around the input.
-        p = parser.Parser(parser.TokenStream(line))
-
-        # Try to read and evaluate a statement.
+        # Try to read and evaluate a statement.  Parsing goes through the
+        # cache, since the same lines tend to come up over and over.
         try:
-            statement_set = p.Read()
-            if statement_set:
+            line_number, statement_set = self.parse_cache.Read(line, stream)
+            if line_number is not None:
+                self.rt.program.Add(line_number, statement_set)
+            elif statement_set:
                 for statement in statement_set.set:
                     statement.Validate(self.rt).Evaluate(self.rt)
             return True
@@ -82,6 +103,58 @@ class Basic:
             self.screen.WriteLn()
             return False
 
+    def Load(self, filename):
+        """Loads a program from a file in place of the current one, for LOAD.
+
+        The file is memory-mapped and streamed through a single tokenizer and
+        parser, with the lines added to the program in bulk.  Both text and
+        crunched programs are accepted.  The whole file is read before the
+        current program is removed, so a file that cannot be read leaves it as
+        it was.
+
+        Raises:
+            exception.EvalException if the file cannot be read.
+            exception.ParserException if a line cannot be parsed.
+        """
+        lines = []
+        try:
+            with open(os.path.join(system.State.folder, filename), 'rb') as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    source = mmap.mmap(f.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+                    try:
+                        lines = list(parser.ProgramReader(source).Read())
+                    finally:
+                        source.close()
+        except (IOError, OSError):
+            raise exception.EvalException(exception.Error.ERR_FILE)
+        self.rt.program.Delete(runtime.LineRange(0, sys.maxint))
+        self.rt.program.AddAll(lines)
+        self.rt.Reset()
+
+    def Save(self, filename, text=False):
+        """Writes the current program to a file, for SAVE.
+
+        Args:
+            filename (str): The name of the file.
+            text (bool): Whether to write the listing as text, rather than
+                crunched (see parser.Cruncher).
+
+        Raises:
+            exception.EvalException if the file cannot be written.
+            exception.TokenException if the program cannot be crunched.
+        """
+        listing = ''.join(
+            '%d %s\n' % line
+            for line in self.rt.program.Range(runtime.LineRange(0, sys.maxint)))
+        if not text:
+            listing = parser.Cruncher().Crunch(listing)
+        try:
+            with open(os.path.join(system.State.folder, filename), 'wb') as f:
+                f.write(listing)
+        except (IOError, OSError):
+            raise exception.EvalException(exception.Error.ERR_FILE)
+
     def KeyPressed(self, ch):
         """Handles incoming key presses, which may trigger the parser."""
         # Update the INKEY$ variable.
@@ -90,9 +163,10 @@ class Basic:
         # Send the key to the screen.
         line = self.screen.Send(ch)
 
-        # If we have a complete line, execute it.
+        # If we have a complete line, execute it.  The screen has kept its
+        # tokens up to date, so there's no need to tokenize it again.
         if line is not None:
-            self.Execute(line)
+            self.Execute(line.text, line.Stream())
 
     def KeyReleased(self):
         """Called when we detect that a key is no longer being pressed."""
@@ -103,17 +177,25 @@ class Basic:
 def main(argv):
     """Main routine: parse command-line flags and start the REPL."""
     try:
-        opts, args = getopt.getopt(argv, '', ['input_mode='])
+        opts, args = getopt.getopt(argv, '', ['engine=', 'input_mode=',
+                                              'tokenizer='])
     except getopt.GetoptError:
-        print >>sys.stderr, 'basic --input_mode=(line|unbuffered)'
+        print >>sys.stderr, ('basic --input_mode=(line|unbuffered) '
+                             '--tokenizer=(fsm|regex) '
+                             '--engine=(tree|closure|vm|python)')
         sys.exit(1)
 
     mode = 'line'
+    engine = 'tree'
     for opt, arg in opts:
         if opt == '--input_mode' and arg in ('line', 'unbuffered'):
             mode = arg
+        elif opt == '--tokenizer' and arg in ('fsm', 'regex'):
+            parser.TokenStream.default_engine = arg
+        elif opt == '--engine' and arg in ENGINES:
+            engine = arg
 
-    state.basic = Basic(input_mode=mode)
+    state.basic = Basic(input_mode=mode, engine=engine)
     state.basic.Boot()
 
 
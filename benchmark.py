@@ -0,0 +1,544 @@
+import StringIO
+import functools
+import gc
+import getopt
+import random
+import sys
+import time
+
+from lib import expression
+from lib import parser
+from lib import runtime
+from lib import statement
+from lib import value
+
+# Lines typical of the listings in old books and magazines, used to generate
+# large synthetic programs.
+SAMPLE_LINES = (
+    'PRINT "YOUR SCORE IS";S;" OUT OF";T',
+    'FOR I=1 TO 10:FOR J=1 TO 10:A(I,J)=0:NEXT J:NEXT I',
+    'IF X<0 OR X>39 OR Y<0 OR Y>23 THEN 500',
+    'X=X+DX:Y=Y+DY:IF A$="Q" THEN END',
+    'DATA 12,34,56,78,90,-1',
+    'A$=INKEY$:IF A$="" THEN 130',
+    'S=S+INT(RND(1)*6)+1:C%=C%+1',
+    'GOSUB 1000:ON K GOTO 200,300,400',
+    'REM *** MAIN LOOP ***',
+    'Q=(A*B+C)/(D-E)^2+SQR(X*X+Y*Y)',
+)
+
+# Expressions typical of the same listings, used to measure the parser.
+SAMPLE_EXPRESSIONS = (
+    '(A*B+C)/(D-E)^2+X*X+Y*Y',
+    'X<0 OR X>39 OR Y<0 OR Y>23',
+    'S+T*6+1-C%*2 MOD 7',
+    'A$="Q" AND NOT (B$<>"" OR K=3)',
+    '-(X1-X2)^2-(Y1-Y2)^2 >= R*R',
+    'A(I,J)+A(I-1,J)+A(I+1,J)+A(I,J-1)+A(I,J+1)',
+    '&HFF AND (M%/2+&B1010) OR 1.5E3*P',
+)
+
+# Expressions with the constant parts and redundant parentheses that the same
+# listings are full of, used to measure expression simplification.
+FOLDABLE_EXPRESSIONS = (
+    '(A) + 2*3',
+    'X*(3.14159/180)',
+    '(X-1)*(40/2)+(Y)',
+    '"="+"="+"="+B$',
+    '((A+B)) / (2^8-1)',
+    '-(1) * (S) + (100*60)',
+)
+
+# Arithmetic on variables of each type, used to count the values that
+# evaluating an expression allocates.
+ARITHMETIC_EXPRESSIONS = (
+    'S+I*J-K%*2',
+    '(X*X+Y*Y)/2-R*R',
+    'A%*B%+C%-1',
+    'X<0 OR X>39 OR Y<0 OR Y>23',
+    '-(X1-X2)*(Y1-Y2)+N%',
+)
+
+# A loop-heavy program, used to compare the engines that RUN can use.  The
+# outer loop runs the given number of times.
+LOOP_PROGRAM = """10 S=0:T%%=0
+20 FOR I=1 TO %d
+30 FOR J=1 TO 10
+40 S=S+I*J:IF J MOD 3=0 THEN T%%=T%%+1
+50 NEXT J
+60 GOSUB 100
+70 NEXT I
+80 PRINT S;T%%
+90 END
+100 S=S-1:RETURN
+"""
+
+# Programs that build a long string by appending to it, 100 characters at a
+# time, either without looking at it or reading it after every append.
+CONCAT_PROGRAMS = (
+    ('append', """10 A$=""
+20 FOR I=1 TO %%d
+30 A$=A$+"%s"
+40 NEXT I
+""" % ('0123456789' * 10)),
+    ('append+read', """10 A$=""
+20 FOR I=1 TO %%d
+30 A$=A$+"%s":L=LEN(A$)
+40 NEXT I
+""" % ('0123456789' * 10)),
+)
+
+# A loop that sums a polynomial, either through an FN function or with the
+# body of the function written out in place of the call.
+FN_PROGRAMS = (
+    ('fn', """10 DEF FNP(X)=X*X+3*X+1
+20 S=0
+30 FOR I=1 TO %d
+40 S=S+FNP(I)
+50 NEXT I
+"""),
+    ('inline', """10 S=0
+20 FOR I=1 TO %d
+30 S=S+(I*I+3*I+1)
+40 NEXT I
+"""),
+)
+
+# A short program that makes a good many variables and a large array, used to
+# measure RUN being repeated.
+RESET_PROGRAM = """10 DIM A(10000),B$(1000)
+20 FOR I=1 TO 10:A(I)=I:NEXT I
+30 X=1:Y=2:Z=3:N%=4:A$="A":B$="B":C$="C"
+40 S=X+Y+Z+N%+PI
+"""
+
+# A loop that finds lines by number, with a GOTO and an empty WHILE, as the
+# start of a program that is padded out with comments.
+LOOKUP_PROGRAM = """10 FOR I=1 TO 1000
+20 GOTO 30
+30 WHILE 0:WEND
+40 NEXT I
+50 END
+"""
+
+# A loop that does little but jump, with GOSUB, THEN and GOTO.
+JUMP_PROGRAM = """10 FOR I=1 TO %d
+20 GOSUB 100
+30 IF I THEN 50
+40 PRINT "NEVER"
+50 GOTO 60
+60 NEXT I
+70 END
+100 RETURN
+"""
+
+# A loop around a FOR loop and a WHILE loop that never run, as the start of a
+# program whose lines after it are comments, within the loops that are skipped.
+SKIP_PROGRAM = """10 FOR I=1 TO 1000
+20 FOR J=1 TO 0
+30 WHILE 0
+90000 WEND
+90010 NEXT J
+90020 NEXT I
+"""
+
+
+# A loop that goes to subroutines, and runs loops, from inside IF statements,
+# so that each engine has to come back to the middle of a clause.
+NESTED_PROGRAM = """10 FOR I=1 TO %d
+20 IF I>0 THEN GOSUB 100:S=S+1 ELSE PRINT "NEVER"
+30 IF I<0 THEN PRINT "NEVER" ELSE GOSUB 100:GOSUB 100:S=S+1
+40 IF I>0 THEN IF I>1 THEN GOSUB 100:S=S+1 ELSE S=S+2:S=S+3
+50 IF I>0 THEN ON 2 GOSUB 100,110:S=S+1
+60 IF I>0 THEN FOR J=1 TO 2:GOSUB 100:NEXT J:S=S+1
+70 J=0:IF I>0 THEN WHILE J<2:J=J+1:GOSUB 110:WEND:S=S+1
+80 NEXT I
+90 PRINT S;T
+95 END
+100 T=T+1:RETURN
+110 T=T+2:RETURN
+"""
+
+# The engines that RUN can use, by the names basic.py gives them.
+ENGINES = (('tree', runtime.Interpreter),
+           ('closure', functools.partial(runtime.Machine, closures=True)),
+           ('vm', runtime.Machine),
+           ('python', runtime.Transpiler))
+
+
+def MakeListing(count):
+    """Returns a synthetic program with the given number of lines."""
+    lines = []
+    for i in range(count):
+        lines.append('%d %s' % (10 * (i + 1),
+                                SAMPLE_LINES[i % len(SAMPLE_LINES)]))
+    return lines
+
+
+def TokenMemory(tokens):
+    """Returns the bytes used by the distinct token objects in a list."""
+    total = 0
+    for tok in dict((id(tok), tok) for tok in tokens).itervalues():
+        total += sys.getsizeof(tok)
+        if hasattr(tok, '__dict__'):
+            total += sys.getsizeof(tok.__dict__)
+    return total
+
+
+def BenchSkip(count):
+    """Measures the time taken by the tree walker to skip loops that never run.
+
+    The loops skipped span the given number of lines.
+    """
+    comment = statement.StatementSet([statement.SComment('')])
+    program = runtime.Program()
+    program.AddAll(parser.ProgramReader(
+        StringIO.StringIO(SKIP_PROGRAM)).Read())
+    program.AddAll((100 + i, comment) for i in range(count))
+    rt = runtime.Runtime(program, runtime.Environment())
+    rt.engine = runtime.Interpreter()
+    gc.collect()
+    start = time.time()
+    rt.engine.Run(rt)
+    print 'lines:           %d' % count
+    print 'seconds:         %.3f' % (time.time() - start)
+
+
+def BenchTokens(count):
+    """Measures the time and memory taken to tokenize a large LOAD."""
+    lines = MakeListing(count)
+
+    gc.collect()
+    start = time.time()
+    tokens = []
+    for line in lines:
+        stream = parser.TokenStream(line)
+        while True:
+            tok = stream.Get()
+            tokens.append(tok)
+            if tok.IsType(parser.token.TYPE_EOF):
+                break
+    elapsed = time.time() - start
+
+    distinct = len(set(id(tok) for tok in tokens))
+    print 'lines:           %d' % count
+    print 'tokens:          %d' % len(tokens)
+    print 'token objects:   %d' % distinct
+    print 'token bytes:     %d' % TokenMemory(tokens)
+    print 'seconds:         %.3f' % elapsed
+
+
+def BenchJumps(count):
+    """Measures the time taken by the tree walker to make jumps.
+
+    Each of the given number of iterations makes three jumps to constant
+    lines, besides the one made by NEXT.
+    """
+    program = runtime.Program()
+    program.AddAll(parser.ProgramReader(
+        StringIO.StringIO(JUMP_PROGRAM % count)).Read())
+    rt = runtime.Runtime(program, runtime.Environment())
+    rt.engine = runtime.Interpreter()
+    gc.collect()
+    start = time.time()
+    rt.engine.Run(rt)
+    print 'iterations:      %d' % count
+    print 'seconds:         %.3f' % (time.time() - start)
+
+
+def BenchLines(count):
+    """Measures the time taken to edit and run a large program.
+
+    A program of the given number of comment lines is typed in one line at a
+    time, in no particular order.  Then a short loop at the start of a program
+    padded out with as many comments is run, which finds lines by number as it
+    goes.
+    """
+    comment = statement.StatementSet([statement.SComment('')])
+    numbers = [100 + i for i in range(count)]
+    random.Random(0).shuffle(numbers)
+    program = runtime.Program()
+    gc.collect()
+    start = time.time()
+    for line_number in numbers:
+        program.Add(line_number, comment)
+    print 'lines:           %d' % count
+    print 'editing:         %.3f s' % (time.time() - start)
+
+    program = runtime.Program()
+    program.AddAll(parser.ProgramReader(
+        StringIO.StringIO(LOOKUP_PROGRAM)).Read())
+    program.AddAll((line_number, comment) for line_number in numbers)
+    rt = runtime.Runtime(program, runtime.Environment())
+    rt.engine = runtime.Interpreter()
+    gc.collect()
+    start = time.time()
+    rt.engine.Run(rt)
+    print 'running:         %.3f s' % (time.time() - start)
+
+
+def BenchParse(count):
+    """Measures the time taken to parse expression-heavy lines.
+
+    The lines are tokenized up front, so only the parser itself is timed.
+    """
+    streams = []
+    for i in range(count):
+        text = SAMPLE_EXPRESSIONS[i % len(SAMPLE_EXPRESSIONS)]
+        tokens = []
+        stream = parser.TokenStream(text)
+        while True:
+            tokens.append(stream.Get())
+            if tokens[-1].IsType(parser.token.TYPE_EOF):
+                break
+        streams.append(parser.TokenStream.FromTokens(text, tokens))
+
+    gc.collect()
+    start = time.time()
+    for stream in streams:
+        stream.Reset()
+        parser.Parser(stream)._ReadExp()
+    elapsed = time.time() - start
+    print 'lines:           %d' % count
+    print 'parse:           %.3f s, %.0f lines/s' % (elapsed, count / elapsed)
+    print 'specializer:     %s' % parser.Parser._specializer.Stats()
+
+
+def BenchFold(count):
+    """Measures how much simplifying expressions saves when evaluating them.
+
+    The simplified expressions are also timed as closures, as the closure
+    engine runs them.
+    """
+    env = runtime.Environment()
+    rt = runtime.Runtime(None, env)
+    optimizer = expression.Optimizer()
+    trees = []
+    for text in FOLDABLE_EXPRESSIONS:
+        exp = parser.Parser(parser.TokenStream(text))._ReadExp()
+        trees.append((exp, optimizer.Optimize(exp)))
+
+    print 'evaluations:     %d' % (count * len(trees))
+    print 'optimizer:       %s' % optimizer.Stats()
+    for i, name in enumerate(('parsed', 'optimized')):
+        gc.collect()
+        start = time.time()
+        for _ in xrange(count):
+            for tree in trees:
+                tree[i].Evaluate(rt)
+        print '%-16s %.3f s' % (name + ':', time.time() - start)
+
+    # The optimized trees again, compiled to closures.
+    closures = [tree[1].Compiled() for tree in trees]
+    gc.collect()
+    start = time.time()
+    for _ in xrange(count):
+        for closure in closures:
+            closure(rt)
+    print '%-16s %.3f s' % ('compiled:', time.time() - start)
+
+
+def BenchAlloc(count):
+    """Measures the values allocated by walking arithmetic expression trees.
+
+    Every value.Value built while evaluating is counted, by wrapping the
+    constructor of the base class.
+    """
+    env = runtime.Environment()
+    for name, val in (('s', 1.5), ('i', 2.0), ('j', 3.0), ('x', 4.0),
+                      ('y', 5.0), ('r', 6.0), ('x1', 7.0), ('x2', 8.0),
+                      ('y1', 9.0), ('y2', 10.0)):
+        env.Set(name, value.VFloat(val))
+    for name, val in (('k%', 2), ('a%', 3), ('b%', 4), ('c%', 5), ('n%', 6)):
+        env.Set(name, value.VInt(val))
+    rt = runtime.Runtime(None, env)
+    trees = [parser.Parser(parser.TokenStream(text))._ReadExp()
+             for text in ARITHMETIC_EXPRESSIONS]
+
+    gc.collect()
+    start = time.time()
+    for _ in xrange(count):
+        for tree in trees:
+            tree.Evaluate(rt)
+    elapsed = time.time() - start
+
+    # Evaluate each tree once more, counting the values it builds.
+    allocated = [0]
+    new = value.Value.__new__
+    def CountingNew(cls, *args):
+        allocated[0] += 1
+        return new(cls, *args)
+
+    value.Value.__new__ = staticmethod(CountingNew)
+    try:
+        for tree in trees:
+            tree.Evaluate(rt)
+    finally:
+        value.Value.__new__ = staticmethod(new)
+
+    print 'evaluations:     %d' % (count * len(trees))
+    print 'values:          %.2f per evaluation' % (
+        float(allocated[0]) / len(trees))
+    print 'seconds:         %.3f' % elapsed
+
+
+def BenchConcat(count):
+    """Measures the time taken to build a string by appending to it in a loop.
+
+    The string is built by the tree walker, 100 characters per iteration, so
+    the default of 10000 iterations builds a string of 1 MB.  It is built
+    twice: once without being read, and once read after every append.
+    """
+    print 'iterations:      %d' % count
+    for name, source in CONCAT_PROGRAMS:
+        program = runtime.Program()
+        program.AddAll(parser.ProgramReader(
+            StringIO.StringIO(source % count)).Read())
+        rt = runtime.Runtime(program, runtime.Environment())
+        rt.engine = runtime.Interpreter()
+        gc.collect()
+        start = time.time()
+        rt.engine.Run(rt)
+        print '%-16s %.3f s, length %d' % (name + ':', time.time() - start,
+                                          len(rt.env.Get('a$').value))
+
+
+def BenchFn(count):
+    """Measures the overhead of calling an FN function.
+
+    The same sum is worked out by the tree walker with and without a call per
+    iteration.  For comparison, the time taken to make as many environments
+    as there are calls is also shown.
+    """
+    print 'calls:           %d' % count
+    for name, source in FN_PROGRAMS:
+        program = runtime.Program()
+        program.AddAll(parser.ProgramReader(
+            StringIO.StringIO(source % count)).Read())
+        rt = runtime.Runtime(program, runtime.Environment())
+        rt.engine = runtime.Interpreter()
+        gc.collect()
+        start = time.time()
+        rt.engine.Run(rt)
+        print '%-16s %.3f s, %s' % (name + ':', time.time() - start,
+                                    rt.env.Get('s'))
+
+    env = runtime.Environment()
+    gc.collect()
+    start = time.time()
+    for _ in xrange(count):
+        runtime.Environment(env)
+    print '%-16s %.3f s' % ('environments:', time.time() - start)
+
+
+def BenchReset(count):
+    """Measures the time taken to RUN the same short program repeatedly.
+
+    This is what a harness that reruns a program does.  The time taken by the
+    resets alone, with the variables left by the program, is shown apart; the
+    lists of variables growing back after each reset is part of the run.
+    """
+    program = runtime.Program()
+    program.AddAll(parser.ProgramReader(
+        StringIO.StringIO(RESET_PROGRAM)).Read())
+    rt = runtime.Runtime(program, runtime.Environment())
+    rt.engine = runtime.Interpreter()
+    resetting = 0.0
+    gc.collect()
+    start = time.time()
+    for _ in xrange(count):
+        reset = time.time()
+        rt.Reset()
+        resetting += time.time() - reset
+        rt.engine.Run(rt)
+    elapsed = time.time() - start
+    print 'runs:            %d' % count
+    print 'seconds:         %.3f' % elapsed
+    print 'resetting:       %.3f' % resetting
+
+
+def BenchRun(count):
+    """Measures the time taken to RUN a loop-heavy program with each engine."""
+    source = LOOP_PROGRAM % max(1, count / 10)
+    print 'iterations:      %d' % (max(1, count / 10) * 10)
+    for name, engine in ENGINES:
+        program = runtime.Program()
+        program.AddAll(parser.ProgramReader(StringIO.StringIO(source)).Read())
+        rt = runtime.Runtime(program, runtime.Environment())
+        rt.engine = engine()
+        stdout = sys.stdout
+        sys.stdout = StringIO.StringIO()
+        gc.collect()
+        start = time.time()
+        try:
+            rt.engine.Run(rt)
+        finally:
+            output, sys.stdout = sys.stdout.getvalue(), stdout
+        print '%-16s %.3f s, %s' % (name + ':', time.time() - start,
+                                    output.strip())
+
+
+def BenchNested(count):
+    """Measures jumps in and out of IF statements with each engine.
+
+    The output of every engine is shown, and should be the same.
+    """
+    source = NESTED_PROGRAM % max(1, count / 10)
+    print 'iterations:      %d' % max(1, count / 10)
+    outputs = set()
+    for name, engine in ENGINES:
+        program = runtime.Program()
+        program.AddAll(parser.ProgramReader(StringIO.StringIO(source)).Read())
+        rt = runtime.Runtime(program, runtime.Environment())
+        rt.engine = engine()
+        stdout = sys.stdout
+        sys.stdout = StringIO.StringIO()
+        gc.collect()
+        start = time.time()
+        try:
+            rt.engine.Run(rt)
+        finally:
+            output, sys.stdout = sys.stdout.getvalue(), stdout
+        outputs.add(output)
+        print '%-16s %.3f s, %s' % (name + ':', time.time() - start,
+                                    output.strip())
+    print 'outputs:         %s' % ('same' if len(outputs) == 1 else 'DIFFERENT')
+
+
+BENCHMARKS = {
+    'alloc': BenchAlloc,
+    'concat': BenchConcat,
+    'fn': BenchFn,
+    'fold': BenchFold,
+    'jumps': BenchJumps,
+    'lines': BenchLines,
+    'nested': BenchNested,
+    'parse': BenchParse,
+    'reset': BenchReset,
+    'run': BenchRun,
+    'skip': BenchSkip,
+    'tokens': BenchTokens,
+}
+
+
+def main(argv):
+    """Main routine: parse command-line flags and run a benchmark."""
+    try:
+        opts, args = getopt.getopt(argv, '', ['lines='])
+    except getopt.GetoptError:
+        args = []
+    if len(args) != 1 or args[0] not in BENCHMARKS:
+        print >>sys.stderr, ('benchmark [--lines=N] (%s)' %
+                             '|'.join(sorted(BENCHMARKS)))
+        sys.exit(1)
+
+    count = 10000
+    for opt, arg in opts:
+        if opt == '--lines':
+            count = int(arg)
+
+    BENCHMARKS[args[0]](count)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,153 @@
+import StringIO
+import sys
+import unittest
+
+from basic import ENGINES
+from lib import parser
+from lib import runtime
+
+# Programs that every engine must run the same way, by name.  Each covers
+# control flow or values that the engines handle in different code, and
+# several of them end in an error on purpose.
+PROGRAMS = {
+    'arithmetic': '''
+10 A%=3:B=2.5:C$="X"
+20 PRINT A%+1;B*A%;C$+"Y";-A%;A%<B;A%-B;7-A%
+30 PRINT 10 MOD -3;-7 MOD 2;7.6 MOD 3;2^10;7/2;&HFF AND 15;NOT 0
+40 PRINT 1/0
+''',
+    'arrays': '''
+10 DIM A(20,20), B%(10), C$(3)
+20 FOR I=0 TO 20:FOR J=0 TO 20:A(I,J)=I*J+0.5:NEXT J:NEXT I
+30 B%(10)=7:C$(2)="HI"
+40 PRINT A(3,4);A(20,20);B%(10);B%(0);C$(2);"[";C$(1);"]"
+50 PRINT A(21,0)
+''',
+    'bare next': '''
+10 FOR I=1 TO 2:GOSUB 100:NEXT
+20 FOR J=1 TO 2:GOSUB 100:NEXT
+30 FOR I=1 TO 2:GOTO 50
+40 FOR J=1 TO 2
+50 PRINT I;J:NEXT
+60 END
+100 FOR K=1 TO 2:PRINT I;J;K:NEXT:RETURN
+''',
+    'clear': '''
+10 DIM A(1000):A(5)=3:X=4:B$="HI":DEF FNF(Q)=Q+1
+20 PRINT A(5);X;B$;FNF(1)
+30 CLEAR
+40 PRINT X;B$;"."
+50 DIM A(3):A(1)=X+2:PRINT A(1)
+60 FOR I=1 TO 2:PRINT I:NEXT
+70 FOR I=1 TO 3:CLEAR:PRINT I:NEXT I
+80 PRINT "NOT REACHED"
+''',
+    'functions': '''
+10 X=100:Y=7
+20 DEF FNF(X)=X*X+Y
+30 DEF FNA%(X,B$)=X*3+0.7
+40 DEF FNS$(A$)=A$+"!"
+50 PRINT FNF(3);X;FNA%(2,"ABC");FNS$("HI")
+60 S=0
+70 FOR I=1 TO 5:S=S+FNF(I):NEXT I
+80 PRINT S;FNF(FNF(2));INT(-2.5);ABS(-3);LEN("ABC")
+90 PRINT FNF(1,2)
+''',
+    'gosub in if': '''
+10 X=3
+20 IF X>2 THEN GOSUB 100:PRINT "AFTER" ELSE PRINT "NO"
+30 IF X>5 THEN PRINT "NO" ELSE GOSUB 100:PRINT "ELSE":GOSUB 100
+40 IF X>1 THEN IF X>2 THEN GOSUB 100:PRINT "INNER" ELSE PRINT "NO"
+50 IF X>1 THEN ON 2 GOSUB 100,110:PRINT "ON AFTER"
+60 L=100:IF X>1 THEN GOSUB L:PRINT "COMPUTED"
+70 IF X>1 THEN FOR I=1 TO 2:IF I=2 THEN GOSUB 100:PRINT "IN";I:NEXT I
+80 END
+100 PRINT "SUB"
+105 RETURN
+110 PRINT "SUB2":RETURN
+''',
+    'loops': '''
+10 FOR I=1 TO 3:FOR J=1 TO 2
+20 PRINT I;J;
+30 NEXT J,I
+40 PRINT
+50 FOR K=5 TO 1:PRINT "NO":FOR L=1 TO 2:NEXT L:NEXT K
+60 W=0:WHILE W<3:W=W+1:WHILE 0:PRINT "NO":WEND:WEND:PRINT W
+70 FOR M=1 TO 2:FOR N=1 TO 0:NEXT N,M:PRINT "M";M
+80 FOR S=10 TO 1 STEP -3:PRINT S;:NEXT S:PRINT
+90 IF 1 THEN FOR J=1 TO 0
+100 PRINT "J":NEXT J:PRINT "AFTER"
+110 FOR Z=9 TO 1
+''',
+    'on': '''
+10 FOR K=0 TO 4
+20 ON K GOSUB 100,200,300
+30 ON K GOTO 50,60
+40 PRINT "FALL";K:GOTO 70
+50 PRINT "FIFTY":GOTO 70
+60 PRINT "SIXTY"
+70 IF K=4 THEN 90
+80 NEXT K
+90 RETURN
+100 PRINT "SUB1":RETURN
+200 PRINT "SUB2":RETURN
+300 PRINT "SUB3":RETURN
+''',
+    'strings': '''
+10 A$="":B$="AB"
+20 FOR I=1 TO 300:A$=A$+"X"+B$:L=LEN(A$):NEXT I
+30 C$=A$:A$=A$+"Y":C$=C$+"Z"
+40 PRINT L;A$=C$;A$>C$;B$+"!";MID$(A$,2,4);LEFT$(B$,1)
+50 PRINT MID$(A$,0,1)
+''',
+    'while and goto': '''
+10 WHILE A<2:A=A+1:PRINT "A";A:GOTO 40
+20 WHILE B<2:B=B+1:PRINT "B";B
+40 WEND
+50 PRINT "END"
+60 WEND:PRINT "AFTER"
+''',
+}
+
+
+def Run(source, engine):
+    """Runs a program on an engine.
+
+    Args:
+        source (str): The listing of the program.
+        engine (str): The name of the engine, as in basic.ENGINES.
+
+    Returns:
+        (str, str): What the program printed, and the class name of the error
+        that stopped it (or None).
+    """
+    program = runtime.Program()
+    program.AddAll(parser.ProgramReader(StringIO.StringIO(source)).Read())
+    rt = runtime.Runtime(program, runtime.Environment())
+    rt.engine = ENGINES[engine]()
+    stdout = sys.stdout
+    sys.stdout = output = StringIO.StringIO()
+    error = None
+    try:
+        rt.engine.Run(rt)
+    except Exception as e:
+        error = e.__class__.__name__
+    finally:
+        sys.stdout = stdout
+    return output.getvalue(), error
+
+
+class EnginesTest(unittest.TestCase):
+    """Checks that every engine runs every program the way the tree does."""
+
+    def testPrograms(self):
+        for name, source in sorted(PROGRAMS.items()):
+            expected = Run(source, 'tree')
+            self.assertTrue(expected[0], '%s prints nothing' % name)
+            for engine in sorted(ENGINES):
+                self.assertEqual(expected, Run(source, engine),
+                                 '%s on %s' % (name, engine))
+
+
+if __name__ == '__main__':
+    unittest.main()
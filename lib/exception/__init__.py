@@ -1,3 +1,4 @@
+from error import Error
 from eval_exception import EvalException
 from parser_exception import ParserException
 from token_exception import TokenException
@@ -0,0 +1,22 @@
+class Error:
+    """The error codes carried by exception.EvalException.
+
+    These are the errors a running program can run into, as opposed to the
+    syntax errors reported by the tokenizer and parser.
+    """
+
+    ERR_INTERNAL = 1  # something is wrong with the interpreter itself
+    ERR_TYPE     = 2  # a value of the wrong type was used
+    ERR_RANGE    = 3  # a value was out of range
+    ERR_FORMAT   = 4  # a string could not be converted to a number
+    ERR_BADVAR   = 5  # an undefined array or function was used
+    ERR_DIVZERO  = 6  # a number was divided by zero
+    ERR_BADLINE  = 7  # a line number that is not in the program was used
+    ERR_RETURN   = 8  # RETURN without GOSUB
+    ERR_NEXT     = 9  # NEXT without FOR
+    ERR_WEND     = 10  # WEND without WHILE
+    ERR_FOR      = 11  # FOR without NEXT
+    ERR_WHILE    = 12  # WHILE without WEND
+    ERR_ARGS     = 13  # a function was called with the wrong number of arguments
+    ERR_OVERFLOW = 14  # a number was too large to use
+    ERR_FILE     = 15  # a file could not be read or written, or its name is bad
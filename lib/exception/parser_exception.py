@@ -1,5 +1,23 @@
 class ParserException(Exception):
-    """Base class for all exceptions generated by the parser."""
+    """Base class for all exceptions generated by the parser.
 
-    def __init__(self, *args):
-        pass
+    The message names what was being read, followed by the message of the
+    error that stopped it, if any.  A construct that recurses into itself,
+    such as an expression, is only named once.
+    """
+
+    def __init__(self, context, cause=None):
+        """Initializes the exception.
+
+        Args:
+            context (str): What was being read, or the whole message.
+            cause (Exception): The error that stopped the read, if any.
+        """
+        self.context = context
+        message = context
+        if (isinstance(cause, ParserException) and
+            cause.context == context):
+            message = str(cause)
+        elif cause is not None and str(cause):
+            message = '%s: %s' % (context, cause)
+        super(ParserException, self).__init__(message)
@@ -1,5 +1,16 @@
-class TokenException(Exception):
-    """Base class for all exceptions generated by tokenization."""
+import parser_exception
 
-    def __init__(self, *args):
-        pass
+class TokenException(parser_exception.ParserException):
+    """Base class for all exceptions generated by tokenization.
+
+    These are parser errors too, so both tokenizing engines raise the same
+    kind of exception, with a message, for the same bad input.
+    """
+
+    def __init__(self, message):
+        """Initializes the exception.
+
+        Args:
+            message (str): What was wrong with the input, and where.
+        """
+        super(TokenException, self).__init__(message)
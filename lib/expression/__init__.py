@@ -1,3 +1,43 @@
 from eadd import EAdd
+from eaddfloat import EAddFloat
+from eaddint import EAddInt
+from eaddstring import EAddString
 from eand import EAnd
+from ebinary import EBinary
+from edivide import EDivide
+from efloat import EFloat
+from efunction import EFunction
+from eint import EInt
+from elvalue import ELValue
+from elvaluearray import ELValueArray
+from emod import EMod
+from emod import Mod
+from emultiply import EMultiply
+from emultiplyfloat import EMultiplyFloat
+from emultiplyint import EMultiplyInt
+from enegate import ENegate
+from enegatefloat import ENegateFloat
+from enegateint import ENegateInt
+from enot import ENot
+from eor import EOr
+from eparen import EParen
+from epower import EPower
+from erelational import ERelational
+from erelational import RELATION_TYPE_EQ
+from erelational import RELATION_TYPE_GEQ
+from erelational import RELATION_TYPE_GT
+from erelational import RELATION_TYPE_LEQ
+from erelational import RELATION_TYPE_LT
+from erelational import RELATION_TYPE_NEQ
+from erelationaltyped import ERelationalTyped
+from estring import EString
+from esubtract import ESubtract
+from esubtractfloat import ESubtractFloat
+from esubtractint import ESubtractInt
+from eunary import EUnary
 from expression import Expression
+from expression import RequireNumber
+from expression import ToInt
+from optimizer import Optimizer
+from slottable import SlotTable
+from specializer import Specializer
@@ -1,33 +1,48 @@
 from .. import exception
 from .. import value
+import ebinary
 import expression
 
-class EAdd(expression.Expression):
+class EAdd(ebinary.EBinary):
     """This expression represents an addition operation."""
 
-    def __init__(self, exp_a, exp_b):
-        """Initializes the expression.
-        
-        Args:
-            exp_a (expression.Expression): The first expression.
-            exp_b (expression.Expression): The second expression.
-        """
-        super(EAdd, self).__init__()
-        self.exp_a = exp_a
-        self.exp_b = exp_b
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        VFloat = value.VFloat
+        VString = value.VString
+        numeric = self.NUMERIC_TYPES
+
+        if type_a == type_b == value.Value.INT:
+            return lambda rt: VInt(a(rt).value + b(rt).value)
+        elif type_a in numeric and type_b in numeric:
+            return lambda rt: VFloat(a(rt).value + b(rt).value)
+        elif type_a == type_b == value.Value.STRING:
+            return lambda rt: VString(a(rt).value + b(rt).value)
+
+        def Add(rt):
+            val_a = a(rt)
+            val_b = b(rt)
+            if val_a.IsInt() and val_b.IsInt():
+                return VInt(val_a.value + val_b.value)
+            elif val_a.IsNumeric() and val_b.IsNumeric():
+                return VFloat(val_a.AsFloat() + val_b.AsFloat())
+            elif val_a.IsString() and val_b.IsString():
+                return VString(val_a.value + val_b.value)
+            raise exception.EvalException(exception.Error.ERR_TYPE)
+        return Add
 
     def Evaluate(self, rt):
-        val_a = self.exp_a.Evaluate(rt)
-        val_b = self.exp_b.Evaluate(rt)
-
-        if val_a.IsInt() and val_b.IsInt():
-            return value.VInt(val_a.AsInt() + val_b.AsInt())
-        elif val_a.IsNumeric() and val_b.IsNumeric():
-            return value.VFloat(val_a.AsFloat() + val_b.AsFloat())
-        elif val_a.IsString() and val_b.IsString():
-            return value.VString(val_a.AsString() + val_b.AsString())
-        else:
+        return expression.Box(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        a = self.exp_a.EvaluateRaw(rt)
+        b = self.exp_b.EvaluateRaw(rt)
+
+        # Numbers add to numbers, and strings to strings.
+        if isinstance(a, str) != isinstance(b, str):
             raise exception.EvalException(exception.Error.ERR_TYPE)
+        return a + b
 
     def __str__(self):
         return str(self.exp_a) + ' + ' + str(self.exp_b)
@@ -0,0 +1,25 @@
+from .. import value
+import eadd
+
+class EAddInt(eadd.EAdd):
+    """This expression represents an addition of two integers.
+
+    The Specializer builds this in place of an EAdd whose operands are known to
+    be integers, so it skips the checks on their types.
+    """
+
+    GENERIC = eadd.EAdd
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        return lambda rt: VInt(a(rt).value + b(rt).value)
+
+    def Evaluate(self, rt):
+        return value.VInt(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return self.exp_a.EvaluateRaw(rt) + self.exp_b.EvaluateRaw(rt)
+
+    def StaticType(self):
+        return value.Value.INT
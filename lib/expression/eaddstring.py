@@ -0,0 +1,27 @@
+from .. import value
+import eadd
+
+class EAddString(eadd.EAdd):
+    """This expression represents a concatenation of two strings.
+
+    The Specializer builds this in place of an EAdd whose operands are known to
+    be strings, so it skips the checks on their types.  The first operand is
+    evaluated as a value.VString, and the second appended to it with Concat,
+    so that appending to a string variable in a loop builds a value.VRope
+    instead of copying the string every time.
+    """
+
+    GENERIC = eadd.EAdd
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        return lambda rt: a(rt).Concat(b(rt).value)
+
+    def Evaluate(self, rt):
+        return self.exp_a.Evaluate(rt).Concat(self.exp_b.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return self.exp_a.EvaluateRaw(rt) + self.exp_b.EvaluateRaw(rt)
+
+    def StaticType(self):
+        return value.Value.STRING
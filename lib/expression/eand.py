@@ -1,25 +1,32 @@
 from .. import value
+import ebinary
 import expression
 
-class EAnd(expression.Expression):
+class EAnd(ebinary.EBinary):
     """This is an AND operation (no distinction between logical and bitwise)."""
 
-    def __init__(self, exp_a, exp_b):
-        """Initializes the expression.
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        RequireNumeric = expression.RequireNumeric
+        ToInt = expression.ToInt
+        numeric = self.NUMERIC_TYPES
 
-        Args:
-            exp_a (expression.Expression): The first expression.
-            exp_b (expression.Expression): The second expression.
-        """
-        super(EAnd, self).__init__()
-        self.exp_a = exp_a
-        self.exp_b = exp_b
+        if type_a in numeric and type_b in numeric:
+            return lambda rt: VInt(ToInt(a(rt).value) & ToInt(b(rt).value))
+        return lambda rt: VInt(RequireNumeric(a(rt)).AsInt() &
+                               RequireNumeric(b(rt)).AsInt())
 
     def Evaluate(self, rt):
-        val_a = self.exp_a.EvaluateToNumeric(rt)
-        val_b = self.exp_b.EvaluateToNumeric(rt)
+        return value.VInt(self.EvaluateRaw(rt))
 
-        return value.VInt(val_a.AsInt() & val_b.AsInt())
+    def EvaluateRaw(self, rt):
+        ToInt = expression.ToInt
+        return (ToInt(self.exp_a.EvaluateRaw(rt)) &
+                ToInt(self.exp_b.EvaluateRaw(rt)))
+
+    def StaticType(self):
+        return value.Value.INT
 
     def __str__(self):
         return str(self.exp_a) + ' AND ' + str(self.exp_b)
@@ -0,0 +1,36 @@
+import copy
+
+import expression
+
+class EBinary(expression.Expression):
+    """The base class for expressions with two operands."""
+
+    def __init__(self, exp_a, exp_b):
+        """Initializes the expression.
+
+        Args:
+            exp_a (expression.Expression): The first expression.
+            exp_b (expression.Expression): The second expression.
+        """
+        super(EBinary, self).__init__()
+        self.exp_a = exp_a
+        self.exp_b = exp_b
+
+    def Children(self):
+        return (self.exp_a, self.exp_b)
+
+    def CompileOperands(self):
+        """Compiles both operands, for the Compile method of a subclass.
+
+        Returns:
+            (function, function, int, int): The closures of the operands,
+            followed by their static types.
+        """
+        return (self.exp_a.Compiled(), self.exp_b.Compiled(),
+                self.exp_a.StaticType(), self.exp_b.StaticType())
+
+    def WithChildren(self, children):
+        exp = copy.copy(self)
+        exp.exp_a, exp.exp_b = children
+        exp._compiled = None
+        return exp
@@ -0,0 +1,46 @@
+from .. import exception
+from .. import value
+import ebinary
+import expression
+
+class EDivide(ebinary.EBinary):
+    """This expression represents a (floating-point) division operation."""
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VFloat = value.VFloat
+        RequireNumeric = expression.RequireNumeric
+        numeric = self.NUMERIC_TYPES
+
+        if type_a in numeric and type_b in numeric:
+            def Divide(rt):
+                val_a = a(rt).value
+                val_b = b(rt).value
+                if val_b == 0:
+                    raise exception.EvalException(exception.Error.ERR_DIVZERO)
+                return VFloat(float(val_a) / val_b)
+        else:
+            def Divide(rt):
+                val_a = RequireNumeric(a(rt)).AsFloat()
+                val_b = RequireNumeric(b(rt)).AsFloat()
+                if val_b == 0.0:
+                    raise exception.EvalException(exception.Error.ERR_DIVZERO)
+                return VFloat(val_a / val_b)
+        return Divide
+
+    def Evaluate(self, rt):
+        return value.VFloat(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        a = expression.RequireNumber(self.exp_a.EvaluateRaw(rt))
+        b = expression.RequireNumber(self.exp_b.EvaluateRaw(rt))
+
+        if b == 0:
+            raise exception.EvalException(exception.Error.ERR_DIVZERO)
+        return float(a) / b
+
+    def StaticType(self):
+        return value.Value.FLOAT
+
+    def __str__(self):
+        return str(self.exp_a) + ' / ' + str(self.exp_b)
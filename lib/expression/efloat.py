@@ -0,0 +1,41 @@
+from .. import value
+import expression
+
+_INF = float('inf')
+
+class EFloat(expression.Expression):
+    """This expression is a floating-point constant."""
+
+    def __init__(self, val):
+        """Initializes the expression.
+
+        Args:
+            val (float): The value of the constant.
+        """
+        super(EFloat, self).__init__()
+        self.value = val
+
+    def Compile(self):
+        val = value.VFloat(self.value)
+        return lambda rt: val
+
+    def Evaluate(self, rt):
+        return value.VFloat(self.value)
+
+    def EvaluateRaw(self, rt):
+        return self.value
+
+    def IsConstant(self):
+        return True
+
+    def StaticType(self):
+        return value.Value.FLOAT
+
+    def __str__(self):
+        # Infinity, from a constant too large for a float or folded from one,
+        # is written as a constant that reads back as it.
+        if self.value == _INF:
+            return '1E999'
+        elif self.value == -_INF:
+            return '-1E999'
+        return repr(self.value)
@@ -0,0 +1,78 @@
+import copy
+
+from .. import exception
+import expression
+import slottable
+
+class EFunction(expression.Expression):
+    """This expression is a call to an FN function.
+
+    Functions have slots of their own, apart from those of variables, and
+    are found in the environment by them.  The type of the result is given by
+    the name of the function, as for a variable.
+    """
+
+    def __init__(self, var, exps):
+        """Initializes the expression.
+
+        Args:
+            var (expression.ELValue): The name of the function.
+            exps (list of expression.Expression): The arguments.
+        """
+        super(EFunction, self).__init__()
+        self.var = var
+        self.exps = exps
+        self.slot = slottable.SlotTable.NONE
+
+    def Children(self):
+        return tuple(self.exps)
+
+    def Compile(self):
+        args = [exp.Compiled() for exp in self.exps]
+        Function = self.Function
+
+        def Call(rt):
+            return Function(rt).Call(rt, [arg(rt) for arg in args])
+        return Call
+
+    def Evaluate(self, rt):
+        return self.Function(rt).Call(
+            rt, [exp.Evaluate(rt) for exp in self.exps])
+
+    def EvaluateRaw(self, rt):
+        return self.Evaluate(rt).value
+
+    def Function(self, rt):
+        """Returns the function called.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Returns:
+            value.VFunction: The function.
+
+        Raises:
+            exception.EvalException if the function is not defined.
+        """
+        try:
+            function = rt.env.functions[self.slot]
+        except IndexError:
+            function = None
+        if function is None:
+            function = rt.env.GetFunction(self.var.id)
+            if function is None:
+                raise exception.EvalException(exception.Error.ERR_BADVAR)
+        return function
+
+    def StaticType(self):
+        return self.var.type
+
+    def WithChildren(self, children):
+        exp = copy.copy(self)
+        exp.exps = list(children)
+        exp._compiled = None
+        return exp
+
+    def __str__(self):
+        return (str(self.var) + '(' +
+                ', '.join(str(exp) for exp in self.exps) + ')')
@@ -0,0 +1,39 @@
+from .. import value
+import expression
+
+class EInt(expression.Expression):
+    """This expression is an integer constant."""
+
+    def __init__(self, val, base=10):
+        """Initializes the expression.
+
+        Args:
+            val (int): The value of the constant.
+            base (int): The base it was written in (2, 10 or 16), for display.
+        """
+        super(EInt, self).__init__()
+        self.value = val
+        self.base = base
+
+    def Compile(self):
+        val = value.VInt(self.value)
+        return lambda rt: val
+
+    def Evaluate(self, rt):
+        return value.VInt(self.value)
+
+    def EvaluateRaw(self, rt):
+        return self.value
+
+    def IsConstant(self):
+        return True
+
+    def StaticType(self):
+        return value.Value.INT
+
+    def __str__(self):
+        if self.base == 2:
+            return '&B' + bin(self.value)[2:]
+        elif self.base == 16:
+            return '&H%X' % self.value
+        return str(self.value)
@@ -0,0 +1,133 @@
+from .. import exception
+from .. import value
+import expression
+import slottable
+
+class ELValue(expression.Expression):
+    """This expression is a scalar variable, which can also be assigned to.
+
+    The type of the variable is given by the last character of its name: '$'
+    for strings, '%' for integers, and floating-point otherwise.
+
+    The variable is given its slot (see SlotTable) when the program it is in
+    is linked, and is found in the environment by it.  Only variables that
+    have no slot (as in direct mode), that are not set in the environment
+    itself, or that were first named after the environment was made, are
+    looked up by name, which is how the variables of a parent environment are
+    found.
+    """
+
+    # The value of each type of variable before it is first assigned.
+    DEFAULTS = {
+        value.Value.INT:    value.VInt(0),
+        value.Value.FLOAT:  value.VFloat(0.0),
+        value.Value.STRING: value.VString(''),
+    }
+
+    def __init__(self, tok):
+        """Initializes the expression.
+
+        Args:
+            tok (parser.Token): The ID token naming the variable.
+        """
+        super(ELValue, self).__init__()
+        self.id = tok.value
+        if self.id.endswith('$'):
+            self.type = value.Value.STRING
+        elif self.id.endswith('%'):
+            self.type = value.Value.INT
+        else:
+            self.type = value.Value.FLOAT
+        self.slot = slottable.SlotTable.NONE
+
+    def Assign(self, rt, val):
+        """Stores a value in the variable.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+            val (value.Value): The value to store.
+
+        Raises:
+            exception.EvalException if the value is of the wrong type.
+        """
+        val = self.Convert(val)
+        try:
+            rt.env.scalars[self.slot] = val
+        except IndexError:
+            rt.env.Set(self.id, val)
+
+    def Compile(self):
+        id = self.id
+        slot = self.slot
+        default = self.DEFAULTS[self.type]
+
+        def Variable(rt):
+            try:
+                val = rt.env.scalars[slot]
+            except IndexError:
+                val = None
+            if val is None:
+                val = rt.env.Get(id)
+                if val is None:
+                    return default
+            return val
+        return Variable
+
+    def Convert(self, val):
+        """Converts a value to the type of the variable.
+
+        Numbers are converted to integers or floating-point as the variable
+        requires; strings can only be stored in string variables.
+
+        Args:
+            val (value.Value): The value.
+
+        Returns:
+            value.Value: The converted value.
+
+        Raises:
+            exception.EvalException if the value is of the wrong type.
+        """
+        type = val.Type()
+        if type == self.type:
+            return val
+        elif self.type == value.Value.STRING:
+            if val.IsString():
+                return value.VString(val.AsString())
+        elif type != value.Value.STRING:
+            if self.type == value.Value.INT:
+                return value.VInt(val.AsInt())
+            return value.VFloat(val.AsFloat())
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+
+    def Evaluate(self, rt):
+        try:
+            val = rt.env.scalars[self.slot]
+        except IndexError:
+            val = None
+        if val is None:
+            val = rt.env.Get(self.id)
+            if val is None:
+                return self.DEFAULTS[self.type]
+        return val
+
+    def EvaluateRaw(self, rt):
+        try:
+            val = rt.env.scalars[self.slot]
+        except IndexError:
+            val = None
+        if val is None:
+            val = rt.env.Get(self.id)
+            if val is None:
+                return self.DEFAULTS[self.type].value
+        return val.value
+
+    def IsNumeric(self):
+        """Checks if this variable holds numbers (rather than strings)."""
+        return self.type != value.Value.STRING
+
+    def StaticType(self):
+        return self.type
+
+    def __str__(self):
+        return self.id
@@ -0,0 +1,93 @@
+import copy
+
+import elvalue
+import expression
+
+class ELValueArray(elvalue.ELValue):
+    """This expression is an element of an array, which can be assigned to.
+
+    Arrays have slots of their own, apart from those of scalar variables.
+    """
+
+    def __init__(self, tok, exps):
+        """Initializes the expression.
+
+        Args:
+            tok (parser.Token): The ID token naming the array.
+            exps (list of expression.Expression): The subscripts.
+        """
+        super(ELValueArray, self).__init__(tok)
+        self.exps = exps
+
+    def Array(self, rt):
+        """Returns the array, if it is in the environment itself.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Returns:
+            value.ArrayValue: The array, or None if it must be looked up by
+            name.
+        """
+        try:
+            return rt.env.arrays[self.slot]
+        except IndexError:
+            return None
+
+    def Assign(self, rt, val):
+        array = self.Array(rt)
+        if array is None:
+            rt.env.SetArray(self.id, self.Indices(rt), self.Convert(val))
+        else:
+            array.Set(self.Indices(rt), self.Convert(val))
+
+    def Children(self):
+        return tuple(self.exps)
+
+    def Compile(self):
+        id = self.id
+        subscripts = [exp.Compiled() for exp in self.exps]
+        RequireNumeric = expression.RequireNumeric
+
+        Array = self.Array
+
+        def Element(rt):
+            indices = [RequireNumeric(sub(rt)).AsInt() for sub in subscripts]
+            array = Array(rt)
+            if array is None:
+                return rt.env.GetArray(id, indices)
+            return array.Get(indices)
+        return Element
+
+    def Evaluate(self, rt):
+        array = self.Array(rt)
+        if array is None:
+            return rt.env.GetArray(self.id, self.Indices(rt))
+        return array.Get(self.Indices(rt))
+
+    def EvaluateRaw(self, rt):
+        return self.Evaluate(rt).value
+
+    def Indices(self, rt):
+        """Evaluates the subscripts.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Returns:
+            list of int: The subscripts.
+
+        Raises:
+            exception.EvalException if a subscript is not numeric.
+        """
+        RequireNumber = expression.RequireNumber
+        return [int(RequireNumber(exp.EvaluateRaw(rt))) for exp in self.exps]
+
+    def WithChildren(self, children):
+        exp = copy.copy(self)
+        exp.exps = list(children)
+        exp._compiled = None
+        return exp
+
+    def __str__(self):
+        return self.id + '(' + ', '.join(str(exp) for exp in self.exps) + ')'
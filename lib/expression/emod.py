@@ -0,0 +1,61 @@
+from .. import exception
+from .. import value
+import ebinary
+import expression
+
+def Mod(a, b):
+    """Returns the remainder of two plain numbers, as MOD does.
+
+    Both numbers are rounded to integers first, and the remainder has the sign
+    of the dividend, as the quotient is truncated toward zero: 10 MOD -3 is 1,
+    -7 MOD 2 is -1 and 7.6 MOD 3 is 2.  The machine and the transpiler call
+    this too, so that every engine gets the same result.
+
+    Args:
+        a (int, long, float or str): The dividend.
+        b (int, long, float or str): The divisor.
+
+    Returns:
+        int or long: The remainder.
+
+    Raises:
+        exception.EvalException if either value is a string, is too large to
+        round, or if the divisor rounds to zero.
+    """
+    a = _Round(a)
+    b = _Round(b)
+    if b == 0:
+        raise exception.EvalException(exception.Error.ERR_DIVZERO)
+    remainder = abs(a) % abs(b)
+    return -remainder if a < 0 else remainder
+
+
+def _Round(val):
+    """Rounds a plain number to the nearest integer."""
+    if isinstance(val, float):
+        try:
+            return int(round(val))
+        except (OverflowError, ValueError):
+            raise exception.EvalException(exception.Error.ERR_OVERFLOW)
+    return expression.RequireNumber(val)
+
+
+class EMod(ebinary.EBinary):
+    """This expression represents an integer remainder (MOD) operation."""
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        return lambda rt: VInt(Mod(a(rt).value, b(rt).value))
+
+    def Evaluate(self, rt):
+        return value.VInt(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return Mod(self.exp_a.EvaluateRaw(rt), self.exp_b.EvaluateRaw(rt))
+
+    def StaticType(self):
+        return value.Value.INT
+
+    def __str__(self):
+        return str(self.exp_a) + ' MOD ' + str(self.exp_b)
@@ -0,0 +1,34 @@
+from .. import value
+import eunary
+import expression
+
+class ENegate(eunary.EUnary):
+    """This expression represents a unary minus."""
+
+    def Compile(self):
+        a = self.exp.Compiled()
+        type = self.exp.StaticType()
+        VInt = value.VInt
+        VFloat = value.VFloat
+        RequireNumeric = expression.RequireNumeric
+
+        if type == value.Value.INT:
+            return lambda rt: VInt(-a(rt).value)
+        elif type == value.Value.FLOAT:
+            return lambda rt: VFloat(-a(rt).value)
+
+        def Negate(rt):
+            val = RequireNumeric(a(rt))
+            if val.IsInt():
+                return VInt(-val.value)
+            return VFloat(-val.AsFloat())
+        return Negate
+
+    def Evaluate(self, rt):
+        return expression.Box(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return -expression.RequireNumber(self.exp.EvaluateRaw(rt))
+
+    def __str__(self):
+        return '-' + str(self.exp)
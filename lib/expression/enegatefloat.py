@@ -0,0 +1,25 @@
+from .. import value
+import enegate
+
+class ENegateFloat(enegate.ENegate):
+    """This expression represents a floating-point unary minus.
+
+    The Specializer builds this in place of an ENegate whose operand is known
+    to be floating-point, so it skips the check on its type.
+    """
+
+    GENERIC = enegate.ENegate
+
+    def Compile(self):
+        a = self.exp.Compiled()
+        VFloat = value.VFloat
+        return lambda rt: VFloat(-a(rt).value)
+
+    def Evaluate(self, rt):
+        return value.VFloat(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return -self.exp.EvaluateRaw(rt)
+
+    def StaticType(self):
+        return value.Value.FLOAT
@@ -0,0 +1,25 @@
+from .. import value
+import enegate
+
+class ENegateInt(enegate.ENegate):
+    """This expression represents an integer unary minus.
+
+    The Specializer builds this in place of an ENegate whose operand is known
+    to be an integer, so it skips the check on its type.
+    """
+
+    GENERIC = enegate.ENegate
+
+    def Compile(self):
+        a = self.exp.Compiled()
+        VInt = value.VInt
+        return lambda rt: VInt(-a(rt).value)
+
+    def Evaluate(self, rt):
+        return value.VInt(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return -self.exp.EvaluateRaw(rt)
+
+    def StaticType(self):
+        return value.Value.INT
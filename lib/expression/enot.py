@@ -0,0 +1,28 @@
+from .. import value
+import eunary
+import expression
+
+class ENot(eunary.EUnary):
+    """This is a NOT operation (no distinction between logical and bitwise)."""
+
+    def Compile(self):
+        a = self.exp.Compiled()
+        VInt = value.VInt
+        RequireNumeric = expression.RequireNumeric
+        ToInt = expression.ToInt
+
+        if self.exp.StaticType() in self.NUMERIC_TYPES:
+            return lambda rt: VInt(~ToInt(a(rt).value))
+        return lambda rt: VInt(~RequireNumeric(a(rt)).AsInt())
+
+    def Evaluate(self, rt):
+        return value.VInt(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return ~expression.ToInt(self.exp.EvaluateRaw(rt))
+
+    def StaticType(self):
+        return value.Value.INT
+
+    def __str__(self):
+        return 'NOT ' + str(self.exp)
@@ -0,0 +1,32 @@
+from .. import value
+import ebinary
+import expression
+
+class EOr(ebinary.EBinary):
+    """This is an OR operation (no distinction between logical and bitwise)."""
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        RequireNumeric = expression.RequireNumeric
+        ToInt = expression.ToInt
+        numeric = self.NUMERIC_TYPES
+
+        if type_a in numeric and type_b in numeric:
+            return lambda rt: VInt(ToInt(a(rt).value) | ToInt(b(rt).value))
+        return lambda rt: VInt(RequireNumeric(a(rt)).AsInt() |
+                               RequireNumeric(b(rt)).AsInt())
+
+    def Evaluate(self, rt):
+        return value.VInt(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        ToInt = expression.ToInt
+        return (ToInt(self.exp_a.EvaluateRaw(rt)) |
+                ToInt(self.exp_b.EvaluateRaw(rt)))
+
+    def StaticType(self):
+        return value.Value.INT
+
+    def __str__(self):
+        return str(self.exp_a) + ' OR ' + str(self.exp_b)
@@ -0,0 +1,24 @@
+import eunary
+
+class EParen(eunary.EUnary):
+    """This expression is another expression in parentheses.
+
+    The parentheses have no effect on evaluation, since the tree already
+    records the grouping, but they are kept so that LIST shows the expression
+    as it was typed.  The Optimizer removes them from the trees that are run.
+    """
+
+    def Compile(self):
+        return self.exp.Compiled()
+
+    def Evaluate(self, rt):
+        return self.exp.Evaluate(rt)
+
+    def EvaluateRaw(self, rt):
+        return self.exp.EvaluateRaw(rt)
+
+    def StaticType(self):
+        return self.exp.StaticType()
+
+    def __str__(self):
+        return '(' + str(self.exp) + ')'
@@ -0,0 +1,49 @@
+from .. import exception
+from .. import value
+import ebinary
+import expression
+
+class EPower(ebinary.EBinary):
+    """This expression represents exponentiation."""
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        VFloat = value.VFloat
+        RequireNumeric = expression.RequireNumeric
+
+        def Power(rt):
+            val_a = RequireNumeric(a(rt))
+            val_b = RequireNumeric(b(rt))
+            if val_a.IsInt() and val_b.IsInt() and val_b.value >= 0:
+                return VInt(val_a.value ** val_b.value)
+            try:
+                return VFloat(val_a.AsFloat() ** val_b.AsFloat())
+            except (OverflowError, ValueError, ZeroDivisionError):
+                raise exception.EvalException(exception.Error.ERR_RANGE)
+        return Power
+
+    def Evaluate(self, rt):
+        return expression.Box(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        a = expression.RequireNumber(self.exp_a.EvaluateRaw(rt))
+        b = expression.RequireNumber(self.exp_b.EvaluateRaw(rt))
+
+        if not isinstance(a, float) and not isinstance(b, float) and b >= 0:
+            return a ** b
+        try:
+            return float(a) ** float(b)
+        except (OverflowError, ValueError, ZeroDivisionError):
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+
+    def StaticType(self):
+        # Integers raised to negative powers give floating-point results, so
+        # only a floating-point operand settles the type.
+        if value.Value.FLOAT in (self.exp_a.StaticType(),
+                                 self.exp_b.StaticType()):
+            return value.Value.FLOAT
+        return None
+
+    def __str__(self):
+        return str(self.exp_a) + '^' + str(self.exp_b)
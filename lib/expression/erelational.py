@@ -0,0 +1,92 @@
+import operator
+
+from .. import exception
+from .. import value
+import ebinary
+
+# The kinds of comparison.
+RELATION_TYPE_EQ  = 1
+RELATION_TYPE_NEQ = 2
+RELATION_TYPE_GEQ = 3
+RELATION_TYPE_GT  = 4
+RELATION_TYPE_LEQ = 5
+RELATION_TYPE_LT  = 6
+
+class ERelational(ebinary.EBinary):
+    """This expression compares two numbers or two strings.
+
+    As in other BASICs, the result is -1 if the comparison holds, or 0 if not.
+    """
+
+    # The text of each operator, for display.
+    OPERATORS = {
+        RELATION_TYPE_EQ:  '=',
+        RELATION_TYPE_NEQ: '<>',
+        RELATION_TYPE_GEQ: '>=',
+        RELATION_TYPE_GT:  '>',
+        RELATION_TYPE_LEQ: '<=',
+        RELATION_TYPE_LT:  '<',
+    }
+
+    # The Python function for each comparison, for Compile.
+    COMPARISONS = {
+        RELATION_TYPE_EQ:  operator.eq,
+        RELATION_TYPE_NEQ: operator.ne,
+        RELATION_TYPE_GEQ: operator.ge,
+        RELATION_TYPE_GT:  operator.gt,
+        RELATION_TYPE_LEQ: operator.le,
+        RELATION_TYPE_LT:  operator.lt,
+    }
+
+    def __init__(self, relation, exp_a, exp_b):
+        """Initializes the expression.
+
+        Args:
+            relation (int): The comparison to make (RELATION_TYPE_*).
+            exp_a (ebinary.EBinary): The first expression.
+            exp_b (ebinary.EBinary): The second expression.
+        """
+        super(ERelational, self).__init__(exp_a, exp_b)
+        self.relation = relation
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        compare = self.COMPARISONS[self.relation]
+        numeric = self.NUMERIC_TYPES
+
+        if ((type_a in numeric and type_b in numeric) or
+            type_a == type_b == value.Value.STRING):
+            return lambda rt: VInt(-1 if compare(a(rt).value, b(rt).value)
+                                   else 0)
+
+        def Relational(rt):
+            val_a = a(rt)
+            val_b = b(rt)
+            if val_a.IsNumeric() and val_b.IsNumeric():
+                result = compare(val_a.AsFloat(), val_b.AsFloat())
+            elif val_a.IsString() and val_b.IsString():
+                result = compare(val_a.value, val_b.value)
+            else:
+                raise exception.EvalException(exception.Error.ERR_TYPE)
+            return VInt(-1 if result else 0)
+        return Relational
+
+    def Evaluate(self, rt):
+        return value.VInt(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        a = self.exp_a.EvaluateRaw(rt)
+        b = self.exp_b.EvaluateRaw(rt)
+
+        # Numbers compare with numbers, and strings with strings.
+        if isinstance(a, str) != isinstance(b, str):
+            raise exception.EvalException(exception.Error.ERR_TYPE)
+        return -1 if self.COMPARISONS[self.relation](a, b) else 0
+
+    def StaticType(self):
+        return value.Value.INT
+
+    def __str__(self):
+        return (str(self.exp_a) + ' ' + self.OPERATORS[self.relation] + ' ' +
+                str(self.exp_b))
@@ -0,0 +1,24 @@
+from .. import value
+import erelational
+
+class ERelationalTyped(erelational.ERelational):
+    """This expression compares two numbers or two strings, known in advance.
+
+    The Specializer builds this in place of an ERelational whose operands are
+    known to be both numbers or both strings, so it compares their values
+    directly, without checking their types or converting them.
+    """
+
+    GENERIC = erelational.ERelational
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        compare = self.COMPARISONS[self.relation]
+        return lambda rt: VInt(-1 if compare(a(rt).value, b(rt).value) else 0)
+
+    def EvaluateRaw(self, rt):
+        if self.COMPARISONS[self.relation](self.exp_a.EvaluateRaw(rt),
+                                           self.exp_b.EvaluateRaw(rt)):
+            return -1
+        return 0
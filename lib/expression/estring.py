@@ -0,0 +1,33 @@
+from .. import value
+import expression
+
+class EString(expression.Expression):
+    """This expression is a string constant."""
+
+    def __init__(self, val):
+        """Initializes the expression.
+
+        Args:
+            val (str): The value of the constant, without the quotes.
+        """
+        super(EString, self).__init__()
+        self.value = val
+
+    def Compile(self):
+        val = value.VString(self.value)
+        return lambda rt: val
+
+    def Evaluate(self, rt):
+        return value.VString(self.value)
+
+    def EvaluateRaw(self, rt):
+        return self.value
+
+    def IsConstant(self):
+        return True
+
+    def StaticType(self):
+        return value.Value.STRING
+
+    def __str__(self):
+        return '"' + self.value + '"'
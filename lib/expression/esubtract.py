@@ -0,0 +1,37 @@
+from .. import value
+import ebinary
+import expression
+
+class ESubtract(ebinary.EBinary):
+    """This expression represents a subtraction operation."""
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VInt = value.VInt
+        VFloat = value.VFloat
+        RequireNumeric = expression.RequireNumeric
+        numeric = self.NUMERIC_TYPES
+
+        if type_a == type_b == value.Value.INT:
+            return lambda rt: VInt(a(rt).value - b(rt).value)
+        elif type_a in numeric and type_b in numeric:
+            return lambda rt: VFloat(a(rt).value - b(rt).value)
+
+        def Subtract(rt):
+            val_a = RequireNumeric(a(rt))
+            val_b = RequireNumeric(b(rt))
+            if val_a.IsInt() and val_b.IsInt():
+                return VInt(val_a.value - val_b.value)
+            return VFloat(val_a.AsFloat() - val_b.AsFloat())
+        return Subtract
+
+    def Evaluate(self, rt):
+        return expression.Box(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        RequireNumber = expression.RequireNumber
+        return (RequireNumber(self.exp_a.EvaluateRaw(rt)) -
+                RequireNumber(self.exp_b.EvaluateRaw(rt)))
+
+    def __str__(self):
+        return str(self.exp_a) + ' - ' + str(self.exp_b)
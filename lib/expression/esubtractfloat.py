@@ -0,0 +1,26 @@
+from .. import value
+import esubtract
+
+class ESubtractFloat(esubtract.ESubtract):
+    """This expression represents a floating-point subtraction.
+
+    The Specializer builds this in place of an ESubtract whose operands are
+    known to be numbers, at least one of them floating-point, so it skips the
+    checks on their types.
+    """
+
+    GENERIC = esubtract.ESubtract
+
+    def Compile(self):
+        a, b, type_a, type_b = self.CompileOperands()
+        VFloat = value.VFloat
+        return lambda rt: VFloat(a(rt).value - b(rt).value)
+
+    def Evaluate(self, rt):
+        return value.VFloat(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return self.exp_a.EvaluateRaw(rt) - self.exp_b.EvaluateRaw(rt)
+
+    def StaticType(self):
+        return value.Value.FLOAT
@@ -0,0 +1,24 @@
+import copy
+
+import expression
+
+class EUnary(expression.Expression):
+    """The base class for expressions with a single operand."""
+
+    def __init__(self, exp):
+        """Initializes the expression.
+
+        Args:
+            exp (expression.Expression): The operand.
+        """
+        super(EUnary, self).__init__()
+        self.exp = exp
+
+    def Children(self):
+        return (self.exp,)
+
+    def WithChildren(self, children):
+        exp = copy.copy(self)
+        exp.exp, = children
+        exp._compiled = None
+        return exp
@@ -1,11 +1,134 @@
 from .. import exception
+from .. import value
+
+# The value.Value class for each type of plain Python value.
+_BOXES = {
+    int:   value.VInt,
+    long:  value.VInt,
+    float: value.VFloat,
+    str:   value.VString,
+}
+
+def Box(val):
+    """Wraps a plain Python value, as returned by EvaluateRaw, in a value.Value.
+
+    Args:
+        val (int, long, float or str): The plain value.
+
+    Returns:
+        value.Value: The value.
+    """
+    return _BOXES[type(val)](val)
+
+
+def RequireNumber(val):
+    """Makes sure that a plain Python value is a number.
+
+    Args:
+        val (int, long, float or str): The plain value.
+
+    Returns:
+        int, long or float: The same value.
+
+    Raises:
+        exception.EvalException if the value is a string.
+    """
+    if isinstance(val, str):
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+    return val
+
+
+def ToInt(val):
+    """Converts a plain Python value to an integer, as AND, OR and NOT do.
+
+    Args:
+        val (int, long, float or str): The plain value.
+
+    Returns:
+        int or long: The value, truncated.
+
+    Raises:
+        exception.EvalException if the value is a string, or is infinite or
+        not a number.
+    """
+    try:
+        return int(RequireNumber(val))
+    except (OverflowError, ValueError):
+        raise exception.EvalException(exception.Error.ERR_OVERFLOW)
+
+
+def RequireNumeric(val):
+    """Makes sure that a value is numeric.
+
+    Args:
+        val (value.Value): The value.
+
+    Returns:
+        value.Value: The same value.
+
+    Raises:
+        exception.EvalException if the value is not numeric.
+    """
+    if val.IsNumeric():
+        return val
+    raise exception.EvalException(exception.Error.ERR_TYPE)
+
 
 class Expression(object):
-    """The base class for all expressions."""
+    """The base class for all expressions.
+
+    Besides walking the tree with Evaluate, an expression can be compiled into
+    a Python closure with the same result, which calls the closures of its
+    operands directly.  The closure is built once and kept on the node, so
+    evaluating it again skips the method dispatch and the type checks that
+    Evaluate repeats for every node.
+
+    Operators evaluate their operands with EvaluateRaw, which returns plain
+    Python numbers and strings, so that no value.Value is built for the
+    intermediate results; only the value of the whole expression is wrapped,
+    by Evaluate.
+    """
+
+    # The static types of numeric expressions.
+    NUMERIC_TYPES = (value.Value.INT, value.Value.FLOAT)
+
+    # The closure for the expression, once Compiled has built it.
+    _compiled = None
+
+    # For the specialized versions of operators built by the Specializer, the
+    # general operator class that they stand in for.
+    GENERIC = None
 
     def __init__(self):
         pass
 
+    def Children(self):
+        """Returns the operands of the expression, as a tuple."""
+        return ()
+
+    def Compile(self):
+        """Compiles the expression into a Python closure.
+
+        Subclasses build their closures from the closures of their operands,
+        and specialize them on the StaticType of the operands where it is
+        known.  By default, the closure is just Evaluate.
+
+        Returns:
+            function: A function that takes a runtime.Runtime and returns the
+            value.Value of the expression, exactly as Evaluate does.
+        """
+        return self.Evaluate
+
+    def Compiled(self):
+        """Returns the closure for the expression, compiling it on first use.
+
+        Returns:
+            function: The closure built by Compile.
+        """
+        if self._compiled is None:
+            self._compiled = self.Compile()
+        return self._compiled
+
     def Evaluate(self, rt):
         """Evaluates the expression in the given runtime environment.
 
@@ -17,6 +140,21 @@ class Expression(object):
         """
         return exception.EvalException(exception.Error.ERR_INTERNAL)
 
+    def EvaluateRaw(self, rt):
+        """Evaluates the expression to a plain Python value.
+
+        This is how operators evaluate their operands.  By default, it is the
+        value.Value from Evaluate, unwrapped; operators and leaves override it
+        to compute the plain value directly, and then Evaluate wraps it.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Returns:
+            int, long, float or str: The value of the expression.
+        """
+        return self.Evaluate(rt).value
+
     def EvaluateToNumeric(self, rt):
         """Evaluates the expression and makes sure that the result is numeric.
 
@@ -29,10 +167,7 @@ class Expression(object):
         Raises:
             exception.EvalException if the value is not numeric.
         """
-        val = self.Evaluate(rt)
-        if val.IsNumeric():
-            return val
-        raise exception.EvalException(exception.Error.ERR_TYPE)
+        return RequireNumeric(self.Evaluate(rt))
 
     def EvaluateToString(self, rt):
         """Evaluates the expression and makes sure that the result is a string.
@@ -51,6 +186,52 @@ class Expression(object):
             return val
         raise exception.EvalException(exception.Error.ERR_TYPE)
 
+    def Generic(self):
+        """Returns the class of the expression, ignoring specialization.
+
+        Passes that handle each kind of expression differently dispatch on
+        this, so that they treat a specialized operator such as EAddInt just
+        like the EAdd it was made from.
+
+        Returns:
+            class: The class of the expression, or for a specialized operator,
+            the class of the general operator.
+        """
+        return self.GENERIC or self.__class__
+
+    def IsConstant(self):
+        """Checks if this expression is a literal constant."""
+        return False
+
+    def StaticType(self):
+        """Returns the type of the value of the expression, if it is known.
+
+        The type is known without running the program for constants and for
+        variables, whose names give their types, and for the operators whose
+        result type follows from the types of their operands.  For an
+        operator, it is the type of the value if evaluation succeeds.
+
+        Returns:
+            int: The type (value.Value.INT, FLOAT or STRING), or None.
+        """
+        return None
+
+    def WithChildren(self, children):
+        """Returns a copy of the expression with different operands.
+
+        The expression itself is left unchanged.  Subclasses with operands
+        must make sure that the copy does not share the closure of the
+        original.
+
+        Args:
+            children (tuple of expression.Expression): The new operands, in the
+                same order as Children() returns them.
+
+        Returns:
+            expression.Expression: The new expression.
+        """
+        return self
+
     def __str__(self):
         """Constructs a string representation of the expression."""
         return exception.EvalException(exception.Error.ERR_INTERNAL)
@@ -0,0 +1,35 @@
+from efn import Count
+from efn import EFn
+from efn import String
+from efnabs import EFnAbs
+from efnacos import EFnAcos
+from efnasc import EFnAsc
+from efnasin import EFnAsin
+from efnatan import EFnAtan
+from efnatan2 import EFnAtan2
+from efnbins import EFnBinS
+from efnchrs import EFnChrS
+from efncos import EFnCos
+from efndates import EFnDateS
+from efnexp import EFnExp
+from efnhexs import EFnHexS
+from efninstr import EFnInstr
+from efnint import EFnInt
+from efnlefts import EFnLeftS
+from efnlen import EFnLen
+from efnlog import EFnLog
+from efnmath import EFnMath
+from efnmids import EFnMidS
+from efnpos import EFnPos
+from efnrights import EFnRightS
+from efnrnd import EFnRnd
+from efnsgn import EFnSgn
+from efnsin import EFnSin
+from efnspaces import EFnSpaceS
+from efnsqr import EFnSqr
+from efnstrings import EFnStringS
+from efnstrs import EFnStrS
+from efntab import EFnTab
+from efntan import EFnTan
+from efntimes import EFnTimeS
+from efnval import EFnVal
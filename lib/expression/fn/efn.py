@@ -0,0 +1,109 @@
+import copy
+
+from ... import exception
+from ... import value
+from .. import expression
+
+def Count(val):
+    """Makes sure that a plain Python value is a count or a length.
+
+    Args:
+        val (int, long, float or str): The plain value.
+
+    Returns:
+        int or long: The value, truncated.
+
+    Raises:
+        exception.EvalException if the value is a string, or is negative.
+    """
+    count = expression.ToInt(val)
+    if count < 0:
+        raise exception.EvalException(exception.Error.ERR_RANGE)
+    return count
+
+
+def String(val):
+    """Makes sure that a plain Python value is a string.
+
+    Args:
+        val (int, long, float or str): The plain value.
+
+    Returns:
+        str: The same value.
+
+    Raises:
+        exception.EvalException if the value is a number.
+    """
+    if not isinstance(val, str):
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+    return val
+
+
+class EFn(expression.Expression):
+    """The base class for calls to built-in functions.
+
+    Subclasses name the function and implement Apply, which computes the
+    result from the plain Python values of the arguments, as EvaluateRaw
+    returns them; Evaluate and the compiled closure both call it.  The
+    parser's table of built-in functions checks the number of arguments.
+    """
+
+    # The name of the function, as written in a program.
+    NAME = None
+
+    # The static type of the result.
+    TYPE = value.Value.FLOAT
+
+    def __init__(self, exps=()):
+        """Initializes the expression.
+
+        Args:
+            exps (list of expression.Expression): The arguments.
+        """
+        super(EFn, self).__init__()
+        self.exps = list(exps)
+
+    def Apply(self, *args):
+        """Computes the result of the function.
+
+        Args:
+            args (int, long, float or str): The values of the arguments.
+
+        Returns:
+            int, long, float or str: The result, of the type given by
+            StaticType.
+
+        Raises:
+            exception.EvalException if an argument is of the wrong type or
+            out of range.
+        """
+        raise exception.EvalException(exception.Error.ERR_INTERNAL)
+
+    def Children(self):
+        return tuple(self.exps)
+
+    def Compile(self):
+        args = [exp.Compiled() for exp in self.exps]
+        Apply = self.Apply
+        Box = expression.Box
+        return lambda rt: Box(Apply(*[arg(rt).value for arg in args]))
+
+    def Evaluate(self, rt):
+        return expression.Box(self.EvaluateRaw(rt))
+
+    def EvaluateRaw(self, rt):
+        return self.Apply(*[exp.EvaluateRaw(rt) for exp in self.exps])
+
+    def StaticType(self):
+        return self.TYPE
+
+    def WithChildren(self, children):
+        exp = copy.copy(self)
+        exp.exps = list(children)
+        exp._compiled = None
+        return exp
+
+    def __str__(self):
+        if not self.exps:
+            return self.NAME
+        return self.NAME + '(' + ', '.join(str(exp) for exp in self.exps) + ')'
@@ -0,0 +1,16 @@
+from ... import value
+from .. import expression
+import efn
+
+class EFnAbs(efn.EFn):
+    """ABS(x), the absolute value of x, of the same type as x."""
+
+    NAME = 'ABS'
+
+    def Apply(self, x):
+        return abs(expression.RequireNumber(x))
+
+    def StaticType(self):
+        if self.exps[0].StaticType() == value.Value.INT:
+            return value.Value.INT
+        return value.Value.FLOAT
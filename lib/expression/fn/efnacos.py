@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnAcos(efnmath.EFnMath):
+    """ACOS(x), the arc cosine of x, in radians."""
+
+    NAME = 'ACOS'
+    FUNCTION = staticmethod(math.acos)
@@ -0,0 +1,15 @@
+from ... import exception
+from ... import value
+import efn
+
+class EFnAsc(efn.EFn):
+    """ASC(s$), the character code of the first character of s$."""
+
+    NAME = 'ASC'
+    TYPE = value.Value.INT
+
+    def Apply(self, s):
+        s = efn.String(s)
+        if not s:
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+        return ord(s[0])
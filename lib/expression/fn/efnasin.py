@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnAsin(efnmath.EFnMath):
+    """ASIN(x), the arc sine of x, in radians."""
+
+    NAME = 'ASIN'
+    FUNCTION = staticmethod(math.asin)
@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnAtan(efnmath.EFnMath):
+    """ATAN(x), the arc tangent of x, in radians."""
+
+    NAME = 'ATAN'
+    FUNCTION = staticmethod(math.atan)
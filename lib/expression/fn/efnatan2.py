@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnAtan2(efnmath.EFnMath):
+    """ATAN2(y, x), the angle of the point (x, y), in radians."""
+
+    NAME = 'ATAN2'
+    FUNCTION = staticmethod(math.atan2)
@@ -0,0 +1,12 @@
+from ... import value
+from .. import expression
+import efn
+
+class EFnBinS(efn.EFn):
+    """BIN$(n), the binary digits of n."""
+
+    NAME = 'BIN$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, n):
+        return format(expression.ToInt(n), 'b')
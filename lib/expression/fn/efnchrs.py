@@ -0,0 +1,16 @@
+from ... import exception
+from ... import value
+from .. import expression
+import efn
+
+class EFnChrS(efn.EFn):
+    """CHR$(n), the character with the code n, from 0 to 255."""
+
+    NAME = 'CHR$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, n):
+        n = expression.ToInt(n)
+        if not 0 <= n <= 255:
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+        return chr(n)
@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnCos(efnmath.EFnMath):
+    """COS(x), the cosine of x radians."""
+
+    NAME = 'COS'
+    FUNCTION = staticmethod(math.cos)
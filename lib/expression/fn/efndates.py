@@ -0,0 +1,13 @@
+import time
+
+from ... import value
+import efn
+
+class EFnDateS(efn.EFn):
+    """DATE$, today's date as YYYY-MM-DD."""
+
+    NAME = 'DATE$'
+    TYPE = value.Value.STRING
+
+    def Apply(self):
+        return time.strftime('%Y-%m-%d')
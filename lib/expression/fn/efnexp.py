@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnExp(efnmath.EFnMath):
+    """EXP(x), e to the power of x."""
+
+    NAME = 'EXP'
+    FUNCTION = staticmethod(math.exp)
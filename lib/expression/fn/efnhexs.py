@@ -0,0 +1,12 @@
+from ... import value
+from .. import expression
+import efn
+
+class EFnHexS(efn.EFn):
+    """HEX$(n), the hexadecimal digits of n, in uppercase."""
+
+    NAME = 'HEX$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, n):
+        return format(expression.ToInt(n), 'X')
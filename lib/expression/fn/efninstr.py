@@ -0,0 +1,11 @@
+from ... import value
+import efn
+
+class EFnInstr(efn.EFn):
+    """INSTR(s$, t$), the position of t$ in s$ counting from 1, or 0."""
+
+    NAME = 'INSTR'
+    TYPE = value.Value.INT
+
+    def Apply(self, s, t):
+        return efn.String(s).find(efn.String(t)) + 1
@@ -0,0 +1,25 @@
+import math
+
+from ... import value
+from .. import expression
+import efn
+
+class EFnInt(efn.EFn):
+    """INT(x), the largest whole number not greater than x.
+
+    The result has the same type as x, so that INT of a float stays a float,
+    even when it is too large for an integer.
+    """
+
+    NAME = 'INT'
+
+    def Apply(self, x):
+        x = expression.RequireNumber(x)
+        if isinstance(x, float):
+            return math.floor(x)
+        return x
+
+    def StaticType(self):
+        if self.exps[0].StaticType() == value.Value.INT:
+            return value.Value.INT
+        return value.Value.FLOAT
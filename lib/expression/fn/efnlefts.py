@@ -0,0 +1,11 @@
+from ... import value
+import efn
+
+class EFnLeftS(efn.EFn):
+    """LEFT$(s$, n), the first n characters of s$."""
+
+    NAME = 'LEFT$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, s, n):
+        return efn.String(s)[:efn.Count(n)]
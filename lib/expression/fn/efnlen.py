@@ -0,0 +1,11 @@
+from ... import value
+import efn
+
+class EFnLen(efn.EFn):
+    """LEN(s$), the number of characters in s$."""
+
+    NAME = 'LEN'
+    TYPE = value.Value.INT
+
+    def Apply(self, s):
+        return len(efn.String(s))
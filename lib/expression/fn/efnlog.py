@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnLog(efnmath.EFnMath):
+    """LOG(x), the natural logarithm of x."""
+
+    NAME = 'LOG'
+    FUNCTION = staticmethod(math.log)
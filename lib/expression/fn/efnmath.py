@@ -0,0 +1,22 @@
+from ... import exception
+from .. import expression
+import efn
+
+class EFnMath(efn.EFn):
+    """The base class for the functions of the math module.
+
+    Arguments outside the domain of the function raise ERR_RANGE, and results
+    too large for a float raise ERR_OVERFLOW.
+    """
+
+    # The function from the math module, taking and returning floats.
+    FUNCTION = None
+
+    def Apply(self, *args):
+        args = [float(expression.RequireNumber(arg)) for arg in args]
+        try:
+            return self.FUNCTION(*args)
+        except ValueError:
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+        except OverflowError:
+            raise exception.EvalException(exception.Error.ERR_OVERFLOW)
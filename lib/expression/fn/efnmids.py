@@ -0,0 +1,20 @@
+from ... import exception
+from ... import value
+from .. import expression
+import efn
+
+class EFnMidS(efn.EFn):
+    """MID$(s$, start, n), the n characters of s$ from position start.
+
+    Positions count from 1.
+    """
+
+    NAME = 'MID$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, s, start, n):
+        s = efn.String(s)
+        start = expression.ToInt(start)
+        if start < 1:
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+        return s[start - 1:start - 1 + efn.Count(n)]
@@ -0,0 +1,15 @@
+from ... import statement
+from ... import value
+import efn
+
+class EFnPos(efn.EFn):
+    """POS(x), the column of the cursor, counting from 1.
+
+    The argument is ignored, as it is in other BASICs.
+    """
+
+    NAME = 'POS'
+    TYPE = value.Value.INT
+
+    def Apply(self, x):
+        return statement.SPrint.column + 1
@@ -0,0 +1,12 @@
+from ... import value
+import efn
+
+class EFnRightS(efn.EFn):
+    """RIGHT$(s$, n), the last n characters of s$."""
+
+    NAME = 'RIGHT$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, s, n):
+        s = efn.String(s)
+        return s[max(len(s) - efn.Count(n), 0):]
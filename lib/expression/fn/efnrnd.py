@@ -0,0 +1,25 @@
+import random
+
+from ... import value
+from .. import expression
+import efn
+
+class EFnRnd(efn.EFn):
+    """RND or RND(x), a random number from 0 up to 1.
+
+    With a negative x, the generator is seeded with x first, so that the same
+    x starts the same sequence; with x zero, the last number is repeated.
+    """
+
+    NAME = 'RND'
+
+    # The last number returned.
+    last = 0.0
+
+    def Apply(self, x=1):
+        x = expression.RequireNumber(x)
+        if x < 0:
+            random.seed(x)
+        if x != 0:
+            EFnRnd.last = random.random()
+        return EFnRnd.last
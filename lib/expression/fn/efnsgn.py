@@ -0,0 +1,13 @@
+from ... import value
+from .. import expression
+import efn
+
+class EFnSgn(efn.EFn):
+    """SGN(x), -1, 0 or 1 as x is negative, zero or positive."""
+
+    NAME = 'SGN'
+    TYPE = value.Value.INT
+
+    def Apply(self, x):
+        x = expression.RequireNumber(x)
+        return (x > 0) - (x < 0)
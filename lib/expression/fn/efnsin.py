@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnSin(efnmath.EFnMath):
+    """SIN(x), the sine of x radians."""
+
+    NAME = 'SIN'
+    FUNCTION = staticmethod(math.sin)
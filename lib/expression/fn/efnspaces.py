@@ -0,0 +1,11 @@
+from ... import value
+import efn
+
+class EFnSpaceS(efn.EFn):
+    """SPACE$(n), a string of n spaces."""
+
+    NAME = 'SPACE$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, n):
+        return ' ' * efn.Count(n)
@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnSqr(efnmath.EFnMath):
+    """SQR(x), the square root of x."""
+
+    NAME = 'SQR'
+    FUNCTION = staticmethod(math.sqrt)
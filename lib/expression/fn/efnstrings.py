@@ -0,0 +1,25 @@
+from ... import exception
+from ... import value
+from .. import expression
+import efn
+
+class EFnStringS(efn.EFn):
+    """STRING$(n, c), n copies of a character.
+
+    The character is either given by its code, or is the first character of a
+    string.
+    """
+
+    NAME = 'STRING$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, n, c):
+        n = efn.Count(n)
+        if isinstance(c, str):
+            if not c:
+                raise exception.EvalException(exception.Error.ERR_RANGE)
+            return c[0] * n
+        c = expression.ToInt(c)
+        if not 0 <= c <= 255:
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+        return chr(c) * n
@@ -0,0 +1,13 @@
+from ... import statement
+from ... import value
+from .. import expression
+import efn
+
+class EFnStrS(efn.EFn):
+    """STR$(x), x as PRINT shows it, without the space that follows it."""
+
+    NAME = 'STR$'
+    TYPE = value.Value.STRING
+
+    def Apply(self, x):
+        return statement.SPrint.Format(expression.RequireNumber(x))[:-1]
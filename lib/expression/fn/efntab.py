@@ -0,0 +1,15 @@
+from ... import statement
+from ... import value
+import efn
+
+class EFnTab(efn.EFn):
+    """TAB(n), the spaces that move the cursor to column n, counting from 1.
+
+    If the cursor is already at or past the column, there are none.
+    """
+
+    NAME = 'TAB'
+    TYPE = value.Value.STRING
+
+    def Apply(self, n):
+        return ' ' * max(efn.Count(n) - 1 - statement.SPrint.column, 0)
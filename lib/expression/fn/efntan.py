@@ -0,0 +1,9 @@
+import math
+
+import efnmath
+
+class EFnTan(efnmath.EFnMath):
+    """TAN(x), the tangent of x radians."""
+
+    NAME = 'TAN'
+    FUNCTION = staticmethod(math.tan)
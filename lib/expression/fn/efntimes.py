@@ -0,0 +1,13 @@
+import time
+
+from ... import value
+import efn
+
+class EFnTimeS(efn.EFn):
+    """TIME$, the time of day as HH:MM:SS."""
+
+    NAME = 'TIME$'
+    TYPE = value.Value.STRING
+
+    def Apply(self):
+        return time.strftime('%H:%M:%S')
@@ -0,0 +1,14 @@
+from ... import exception
+from ... import value
+import efn
+
+class EFnVal(efn.EFn):
+    """VAL(s$), the number written in s$."""
+
+    NAME = 'VAL'
+
+    def Apply(self, s):
+        try:
+            return float(efn.String(s))
+        except ValueError:
+            raise exception.EvalException(exception.Error.ERR_FORMAT)
@@ -0,0 +1,149 @@
+import copy
+
+from .. import exception
+import eadd
+import eand
+import edivide
+import efloat
+import efunction
+import eint
+import elvalue
+import elvaluearray
+import emod
+import emultiply
+import enegate
+import enot
+import eor
+import eparen
+import epower
+import erelational
+import estring
+import esubtract
+
+class Optimizer:
+    """Simplifies expression trees, so that they are cheaper to evaluate.
+
+    The parser builds trees that mirror the text of each line, which LIST needs
+    to show the line as it was typed.  This pass builds a second tree for
+    running the line:
+
+        - EParen nodes are dropped, since the tree already records the
+          grouping.
+        - Operators whose operands are all constants are replaced by the
+          constant result, so "2*3" costs no more to evaluate than "6".
+
+    Nothing is folded that would raise an error ("1/0", "A" + 1), so that the
+    error still happens when the line runs.  The original tree is never
+    modified; parts of it that cannot be simplified are shared with the new
+    tree.
+
+    Given the slot tables of a program, the pass also gives every variable and
+    FN call it meets its slot in them (see SlotTable), which is how
+    runtime.Program resolves the names of a program as it is linked.  The
+    slots go in copies of the nodes too, since the parsed trees can be shared
+    by programs with different tables (see parser.ParseCache).
+
+    The counters record how many nodes went in, and how many came out.
+    """
+
+    # The operators that can be folded.  Each of them computes its value from
+    # its operands alone.
+    FOLDABLE = set((
+        eadd.EAdd, eand.EAnd, edivide.EDivide, emod.EMod,
+        emultiply.EMultiply, enegate.ENegate, enot.ENot, eor.EOr,
+        epower.EPower, erelational.ERelational, esubtract.ESubtract,
+    ))
+
+    def __init__(self, slots=None):
+        """Initializes the counters.
+
+        Args:
+            slots (runtime.Program): What has the slot tables (scalar_slots,
+                array_slots and function_slots) to give variables their slots
+                from, or None to leave them as they are.
+        """
+        self.slots = slots
+        self.nodes_in = 0   # nodes in the trees before optimization
+        self.nodes_out = 0  # nodes in the trees after optimization
+        self.parens = 0     # EParen nodes dropped
+        self.folded = 0     # operators replaced by constants
+
+    def CountNodes(self, exp):
+        """Returns the number of nodes in an expression tree."""
+        return 1 + sum(self.CountNodes(child) for child in exp.Children())
+
+    def Eliminated(self):
+        """Returns the number of nodes eliminated so far."""
+        return self.nodes_in - self.nodes_out
+
+    def Optimize(self, exp):
+        """Builds the simplified version of an expression tree.
+
+        Args:
+            exp (expression.Expression): The tree, as read by the parser.
+
+        Returns:
+            expression.Expression: The simplified tree.
+        """
+        result = self._Optimize(exp)
+        self.nodes_in += self.CountNodes(exp)
+        self.nodes_out += self.CountNodes(result)
+        return result
+
+    def Stats(self):
+        """Returns a human-readable summary of the counters."""
+        return '%d nodes in, %d out (%d parentheses, %d operators folded)' % (
+            self.nodes_in, self.nodes_out, self.parens, self.folded)
+
+    def _Fold(self, exp):
+        """Returns the constant value of an expression, or None."""
+        try:
+            val = exp.Evaluate(None)
+        except (exception.EvalException, OverflowError, ValueError):
+            return None
+        self.folded += 1
+        if val.IsString():
+            return estring.EString(val.AsString())
+        elif val.IsInt():
+            return eint.EInt(val.AsInt())
+        else:
+            return efloat.EFloat(val.AsFloat())
+
+    def _Optimize(self, exp):
+        """Simplifies an expression tree, bottom-up."""
+        if isinstance(exp, eparen.EParen):
+            self.parens += 1
+            return self._Optimize(exp.exp)
+        if self.slots is not None:
+            exp = self._Slot(exp)
+
+        children = exp.Children()
+        if not children:
+            return exp
+        optimized = tuple(self._Optimize(child) for child in children)
+        if optimized != children:
+            exp = exp.WithChildren(optimized)
+
+        if (exp.Generic() in self.FOLDABLE and
+            all(child.IsConstant() for child in optimized)):
+            return self._Fold(exp) or exp
+        return exp
+
+    def _Slot(self, exp):
+        """Returns a copy of a variable or an FN call with its slot, or the
+        expression itself if it is neither, or already has that slot."""
+        cls = exp.__class__
+        if cls is elvalue.ELValue:
+            slot = self.slots.scalar_slots.Slot(exp.id)
+        elif cls is elvaluearray.ELValueArray:
+            slot = self.slots.array_slots.Slot(exp.id)
+        elif cls is efunction.EFunction:
+            slot = self.slots.function_slots.Slot(exp.var.id)
+        else:
+            return exp
+        if slot == exp.slot:
+            return exp
+        exp = copy.copy(exp)
+        exp.slot = slot
+        exp._compiled = None
+        return exp
@@ -0,0 +1,41 @@
+import sys
+
+class SlotTable(object):
+    """Numbers the names of one kind of variable, in the order they are seen.
+
+    Every runtime.Environment keeps the values of its variables in lists
+    indexed by these numbers (slots), so that an expression naming a variable
+    can find its value with a list index rather than looking up the name.
+    Each runtime.Program has tables of its own, which give the variables of
+    the program their slots as it is linked, and which its environment uses
+    for the names it is given; a name keeps its slot for as long as the
+    program does.
+    """
+
+    # The slot of a variable that has not been given one, as in direct mode.
+    # It is past the end of any list, so the variable is found by name.
+    NONE = sys.maxint
+
+    def __init__(self):
+        self.slots = {}  # name->slot
+
+    def Find(self, id):
+        """Returns the slot of a name, or None if it has not been seen."""
+        return self.slots.get(id)
+
+    def Slot(self, id):
+        """Returns the slot of a name, giving it the next one if it is new.
+
+        Args:
+            id (str): The name.
+
+        Returns:
+            int: The slot.
+        """
+        slot = self.slots.get(id)
+        if slot is None:
+            slot = self.slots[id] = len(self.slots)
+        return slot
+
+    def __len__(self):
+        return len(self.slots)
@@ -0,0 +1,242 @@
+from .. import exception
+from .. import value
+import eadd
+import eaddfloat
+import eaddint
+import eaddstring
+import eand
+import edivide
+import emod
+import emultiply
+import emultiplyfloat
+import emultiplyint
+import enegate
+import enegatefloat
+import enegateint
+import enot
+import eor
+import epower
+import erelational
+import erelationaltyped
+import esubtract
+import esubtractfloat
+import esubtractint
+
+class Specializer:
+    """Infers the types of expressions, and specializes operators to them.
+
+    The sigil at the end of every variable name, and the literals themselves,
+    fix the types of the leaves of an expression tree.  From these, this pass
+    works out the type of each operator bottom-up, and where the types of the
+    operands of an operator are known, replaces it with a version specialized
+    to them: EAddInt adds two integers without checking that they are, and so
+    on.  The specialized operators print exactly as the general ones do.
+
+    An operator whose operands are known to be of types it cannot take, such
+    as "A$ * 2", could only ever fail with a type mismatch, so the pass raises
+    that error straight away rather than leaving it for the line to hit when it
+    runs.
+
+    Nothing else about the tree changes; the nodes that are not specialized are
+    shared with the original tree.
+
+    The counters record how many operators were looked at, and how many of
+    them were specialized.
+    """
+
+    # The specialized versions of the operators, by the type of their result.
+    # The operators without a STRING version only take numbers.
+    SPECIALIZED = {
+        eadd.EAdd: {
+            value.Value.INT:    eaddint.EAddInt,
+            value.Value.FLOAT:  eaddfloat.EAddFloat,
+            value.Value.STRING: eaddstring.EAddString,
+        },
+        emultiply.EMultiply: {
+            value.Value.INT:    emultiplyint.EMultiplyInt,
+            value.Value.FLOAT:  emultiplyfloat.EMultiplyFloat,
+        },
+        enegate.ENegate: {
+            value.Value.INT:    enegateint.ENegateInt,
+            value.Value.FLOAT:  enegatefloat.ENegateFloat,
+        },
+        esubtract.ESubtract: {
+            value.Value.INT:    esubtractint.ESubtractInt,
+            value.Value.FLOAT:  esubtractfloat.ESubtractFloat,
+        },
+    }
+
+    # The operators that only take numbers, and are not specialized.
+    NUMERIC = set((
+        eand.EAnd, edivide.EDivide, emod.EMod, enot.ENot, eor.EOr,
+        epower.EPower,
+    ))
+
+    # All of the operators the pass looks at.
+    OPERATORS = set(SPECIALIZED) | NUMERIC | set((erelational.ERelational,))
+
+    def __init__(self):
+        """Initializes the counters."""
+        self.operators = 0    # operators looked at
+        self.specialized = 0  # operators replaced by specialized versions
+        self._plans = {}      # class to build, by operator and operand types
+
+    def Specialize(self, exp):
+        """Builds the specialized version of a whole expression tree.
+
+        Args:
+            exp (expression.Expression): The tree.
+
+        Returns:
+            expression.Expression: The specialized tree.
+
+        Raises:
+            exception.EvalException if an operator is certain to fail with a
+            type mismatch.
+        """
+        children = exp.Children()
+        if children:
+            specialized = tuple(self.Specialize(child) for child in children)
+            if specialized != children:
+                exp = exp.WithChildren(specialized)
+        return self.SpecializeNode(exp)
+
+    def SpecializeNode(self, exp):
+        """Specializes a single node, whose operands are already specialized.
+
+        Args:
+            exp (expression.Expression): The node.
+
+        Returns:
+            expression.Expression: The specialized node, or the node itself if
+            it cannot be specialized.
+
+        Raises:
+            exception.EvalException if the node is certain to fail with a type
+            mismatch.
+        """
+        cls = exp.__class__
+        if cls not in self.OPERATORS:
+            return exp
+        children = exp.Children()
+        build = self._Plan(cls, children)
+        if build is cls:
+            return exp
+        elif cls is erelational.ERelational:
+            return build(exp.relation, *children)
+        return build(*children)
+
+    def Build(self, cls, *args):
+        """Builds an operator, specialized to the types of its operands.
+
+        This is what the parser calls for each operator it reads, so that the
+        whole tree is specialized in a single pass, and without first building
+        the general node only to replace it.
+
+        Args:
+            cls (class): The general class of the operator.
+            args: The arguments to its constructor: the operands, after the
+                relation for expression.ERelational.
+
+        Returns:
+            expression.Expression: The specialized operator, or the general
+            one if it cannot be specialized.
+
+        Raises:
+            exception.EvalException if the operator is certain to fail with a
+            type mismatch.
+        """
+        if cls is erelational.ERelational:
+            return self._Plan(cls, args[1:])(*args)
+        return self._Plan(cls, args)(*args)
+
+    def Stats(self):
+        """Returns a human-readable summary of the counters."""
+        return '%d operators, %d specialized' % (self.operators,
+                                                 self.specialized)
+
+    def _Mismatch(self):
+        """Raises the error for an operator that can only fail."""
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+
+    def _Plan(self, cls, operands):
+        """Works out which class to build an operator as, and counts it.
+
+        The answer only depends on the operator and the static types of its
+        operands, and the same few combinations come up over and over, so it is
+        remembered for each of them.
+
+        Args:
+            cls (class): The general class of the operator.
+            operands (tuple of expression.Expression): Its operands.
+
+        Returns:
+            class: The specialized class, or cls itself.
+
+        Raises:
+            exception.EvalException if the operator is certain to fail with a
+            type mismatch.
+        """
+        key = (cls,) + tuple([operand.StaticType() for operand in operands])
+        build = self._plans.get(key)
+        if build is None:
+            build = self._plans[key] = self._Choose(cls, key[1:])
+        self.operators += 1
+        if build is not cls:
+            self.specialized += 1
+        return build
+
+    def _Choose(self, cls, types):
+        """Works out which class to build an operator as.
+
+        Args:
+            cls (class): The general class of the operator.
+            types (tuple of int): The static types of its operands.
+
+        Returns:
+            class: The specialized class, or cls itself.
+
+        Raises:
+            exception.EvalException if the operator is certain to fail with a
+            type mismatch.
+        """
+        string = value.Value.STRING
+        if cls in self.NUMERIC:
+            if string in types:
+                self._Mismatch()
+            return cls
+        elif cls is erelational.ERelational:
+            type = self._ResultType(types)
+            if type is None:
+                return cls
+            return erelationaltyped.ERelationalTyped
+        versions = self.SPECIALIZED[cls]
+        if string in types and string not in versions:
+            self._Mismatch()
+        type = self._ResultType(types)
+        if type is None:
+            return cls
+        return versions[type]
+
+    def _ResultType(self, types):
+        """Works out the type of the value of an arithmetic operator.
+
+        This raises the error for an operator that mixes strings and numbers.
+
+        Args:
+            types (tuple of int): The static types of the operands.
+
+        Returns:
+            int: value.Value.INT if they are all integers, FLOAT if they are
+            numbers and at least one of them is floating-point, STRING if they
+            are all strings, or None if the type of an operand is not known.
+        """
+        if None in types:
+            return None
+        elif value.Value.STRING in types:
+            if any(type != value.Value.STRING for type in types):
+                self._Mismatch()
+            return value.Value.STRING
+        elif value.Value.FLOAT in types:
+            return value.Value.FLOAT
+        return value.Value.INT
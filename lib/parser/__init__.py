@@ -1,3 +1,10 @@
+from cruncher import Cruncher
+from line_scanner import LineScanner
+from parse_cache import ParseCache
 from parser import Parser
+from program_reader import ProgramReader
 from token import Token
+from token_array import TokenArray
+from token_array_stream import TokenArrayStream
+from token_line import TokenLine
 from token_stream import TokenStream
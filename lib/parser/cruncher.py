@@ -0,0 +1,221 @@
+import struct
+
+from .. import exception
+import token
+import token_array
+
+class Cruncher:
+    """Converts programs to and from the tokenized ("crunched") file format.
+
+    In the spirit of the binary SAVE format of GW-BASIC, a crunched program
+    stores its lines already tokenized, so that loading it never has to run the
+    tokenizer.  The format is:
+
+        header:   MAGIC
+        line:     [line number] [token]... [EOF]
+        token:    [type] [payload]
+
+    where [type] is a single byte holding the token.TYPE_* value and the
+    payload depends on the type:
+
+        keyword, function:    one byte, the index into KEYWORDS/FUNCTIONS
+        ID, string, comment:  the length as a varint, then the text
+        integer types:        the value as a varint
+        float:                the value as a little-endian double
+        anything else:        nothing
+
+    Line numbers and lengths are unsigned LEB128 varints, so small values take
+    a single byte.
+    """
+
+    # The first bytes of every crunched program.  Text programs can never start
+    # with a 0xFF byte, which is how LOAD tells the two formats apart.
+    MAGIC = '\xffPBC\x01'
+
+    # The codes for keywords and functions.  These are stored in files, so new
+    # entries must only ever be added at the end.
+    KEYWORDS = (
+        'AND', 'CLEAR', 'CLS', 'COLOR', 'CURSOR',
+        'DATA', 'DEF', 'DELETE', 'DIM', 'ELSE',
+        'END', 'FILES', 'FOLDER', 'FOLDERS', 'FOR',
+        'GET', 'GOSUB', 'GOTO', 'IF', 'INPUT',
+        'LET', 'LIST', 'LOAD', 'LOCATE', 'MOD',
+        'NEW', 'NEXT', 'NOT', 'OFF', 'ON',
+        'OR', 'PAUSE', 'PRINT', 'RANDOMIZE', 'READ',
+        'REMOVE', 'RENUM', 'RESTORE', 'RETURN', 'RUN',
+        'SAVE', 'STEP', 'STOP', 'THEN', 'TO',
+        'TROFF', 'TRON', 'WEND', 'WHILE', 'WIDTH',
+    )
+    FUNCTIONS = (
+        'ABS', 'ACOS', 'ASC', 'ASIN', 'ATAN',
+        'ATAN2', 'BIN$', 'CHR$', 'COS', 'DATE$',
+        'EXP', 'HEX$', 'INSTR', 'INT', 'LEFT$',
+        'LEN', 'LOG', 'LOOK', 'MID$', 'POS',
+        'RIGHT$', 'RND', 'SGN', 'SIN', 'SIZE',
+        'SPACE$', 'SQR', 'STR$', 'STRING$', 'TAB',
+        'TAN', 'TIME$', 'VAL',
+    )
+
+    # Reverse mappings from names to codes.
+    KEYWORD_CODES = dict((name, i) for i, name in enumerate(KEYWORDS))
+    FUNCTION_CODES = dict((name, i) for i, name in enumerate(FUNCTIONS))
+
+    # The token types whose payload is text or an integer.
+    TEXT_TYPES = set((token.TYPE_COMMENT, token.TYPE_ID_FLOAT,
+                      token.TYPE_ID_INT, token.TYPE_ID_STRING,
+                      token.TYPE_STRING))
+    INT_TYPES = set((token.TYPE_INT, token.TYPE_INT_BIN, token.TYPE_INT_HEX))
+
+    # The encoding of floating-point values.
+    FLOAT = struct.Struct('<d')
+
+    def Crunch(self, source):
+        """Converts the text of a program into the crunched format.
+
+        Args:
+            source (str): The program text, one numbered line per text line.
+
+        Returns:
+            str: The crunched program.
+
+        Raises:
+            exception.TokenException if a line cannot be tokenized, does not
+            start with a line number, or uses a keyword or function that was
+            added with parser.Parser.AddStatement or AddFunction.
+        """
+        tokens = token_array.TokenArray(source)
+        out = bytearray(self.MAGIC)
+        for row in range(tokens.LineCount()):
+            if row in tokens.errors:
+                raise tokens.errors[row]
+            self._CrunchLine(tokens, row, out)
+        return str(out)
+
+    def IsCrunched(self, data):
+        """Checks whether the contents of a file are a crunched program."""
+        return data.startswith(self.MAGIC)
+
+    def Load(self, data):
+        """Tokenizes the contents of a program file, in either format.
+
+        Args:
+            data (str): The contents of the file, crunched or text.
+
+        Returns:
+            parser.TokenArray: The tokens of the program, one row per line.
+        """
+        if self.IsCrunched(data):
+            return self.Uncrunch(data)
+        return token_array.TokenArray(data)
+
+    def Uncrunch(self, data):
+        """Converts a crunched program back into tokens.
+
+        Every row of the result starts with the line number as an INT token,
+        exactly as if the line had been tokenized from text.
+
+        Args:
+            data (str): The crunched program.
+
+        Returns:
+            parser.TokenArray: The tokens of the program, one row per line.
+
+        Raises:
+            exception.TokenException if the data is not a valid crunched
+            program.
+        """
+        if not self.IsCrunched(data):
+            raise exception.TokenException('Not a crunched program')
+
+        tokens = token_array.TokenArray()
+        offset = len(self.MAGIC)
+        try:
+            while offset < len(data):
+                line_number, offset = self._ReadVarint(data, offset)
+                types = [token.TYPE_INT]
+                values = [line_number]
+                offset = self._UncrunchLine(data, offset, types, values)
+                tokens.AddLine(types, values)
+        except (IndexError, KeyError, struct.error):
+            raise exception.TokenException(
+                'Corrupt crunched program at offset %d' % offset)
+        return tokens
+
+    def _CrunchLine(self, tokens, row, out):
+        """Appends a single tokenized line to the output."""
+        start = tokens.starts[row]
+        end = tokens.starts[row + 1]
+        if start == end - 1:
+            return  # blank line
+        if tokens.types[start] != token.TYPE_INT:
+            raise exception.TokenException(
+                'Line %d of the program has no line number' % (row + 1))
+        self._WriteVarint(out, tokens.values[start])
+
+        for i in range(start + 1, end):
+            type = tokens.types[i]
+            value = tokens.values[i]
+            if (type == token.TYPE_KEYWORD and value not in self.KEYWORD_CODES or
+                type == token.TYPE_FUNCTION and value not in self.FUNCTION_CODES):
+                raise exception.TokenException(
+                    '%s has no crunched form' % value)
+            out.append(type)
+            if type == token.TYPE_KEYWORD:
+                out.append(self.KEYWORD_CODES[value])
+            elif type == token.TYPE_FUNCTION:
+                out.append(self.FUNCTION_CODES[value])
+            elif type in self.TEXT_TYPES:
+                self._WriteVarint(out, len(value))
+                out.extend(value)
+            elif type in self.INT_TYPES:
+                self._WriteVarint(out, value)
+            elif type == token.TYPE_FLOAT:
+                out.extend(self.FLOAT.pack(value))
+
+    def _UncrunchLine(self, data, offset, types, values):
+        """Decodes the tokens of a line, returning the offset just past it."""
+        while True:
+            type = ord(data[offset])
+            offset += 1
+            if type == token.TYPE_KEYWORD:
+                value = self.KEYWORDS[ord(data[offset])]
+                offset += 1
+            elif type == token.TYPE_FUNCTION:
+                value = self.FUNCTIONS[ord(data[offset])]
+                offset += 1
+            elif type in self.TEXT_TYPES:
+                length, offset = self._ReadVarint(data, offset)
+                value = data[offset:offset + length]
+                offset += length
+                if type != token.TYPE_STRING and type != token.TYPE_COMMENT:
+                    value = intern(value)
+            elif type in self.INT_TYPES:
+                value, offset = self._ReadVarint(data, offset)
+            elif type == token.TYPE_FLOAT:
+                value = self.FLOAT.unpack_from(data, offset)[0]
+                offset += self.FLOAT.size
+            else:
+                value = None
+            types.append(type)
+            values.append(value)
+            if type == token.TYPE_EOF:
+                return offset
+
+    def _ReadVarint(self, data, offset):
+        """Decodes a varint, returning its value and the offset past it."""
+        result = 0
+        shift = 0
+        while True:
+            byte = ord(data[offset])
+            offset += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result, offset
+            shift += 7
+
+    def _WriteVarint(self, out, value):
+        """Appends a non-negative integer to the output as a varint."""
+        while value >= 0x80:
+            out.append((value & 0x7f) | 0x80)
+            value >>= 7
+        out.append(value)
@@ -0,0 +1,192 @@
+import re
+
+from .. import exception
+import token
+
+class LineScanner:
+    """Scans an entire line of BASIC source into tokens in a single pass.
+
+    This is an alternative engine to the character-at-a-time finite-state
+    machine in TokenStream._ReadToken.  A single compiled master regular
+    expression recognizes every token type, so the per-character work happens
+    inside the regular expression engine instead of in Python.  The tokens
+    produced are the same as those produced by the state machine.
+    """
+
+    # The master pattern.  Each alternative is a named group, and the name of
+    # the group that matched tells us what kind of token we found.  Note that
+    # REM has to be tried before general identifiers.
+    PATTERN = re.compile(r"""
+        (?P<space>[ \t\n\r\f]*)
+        (?:
+            (?P<rem>[Rr][Ee][Mm](?:\ (?P<rem_text>.*)|\Z))
+          | (?P<id>[A-Za-z][A-Za-z0-9]*[%$]?)
+          | (?P<number>(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]*)
+                       (?P<exponent>[Ee][-+0-9]?[0-9]*)?)
+          | &[Bb](?P<bin>[01]*)
+          | &[Hh](?P<hex>[0-9A-Fa-f]*)
+          | '(?P<comment>.*)
+          | "(?P<string>[^"]*)"?
+          | (?P<punct><[=>]?|>=?|[:,/=(\-+^?);*])
+          | (?P<eof>\Z)
+        )
+        """, re.VERBOSE | re.DOTALL)
+
+    # Maps punctuation to token types.  The question mark is handled specially,
+    # since it is shorthand for PRINT.
+    PUNCTUATION = {
+        ':':  token.TYPE_COLON,
+        ',':  token.TYPE_COMMA,
+        '/':  token.TYPE_DIVIDE,
+        '=':  token.TYPE_EQUAL,
+        '>=': token.TYPE_GEQ,
+        '>':  token.TYPE_GT,
+        '<=': token.TYPE_LEQ,
+        '(':  token.TYPE_LPAREN,
+        '<':  token.TYPE_LT,
+        '-':  token.TYPE_MINUS,
+        '<>': token.TYPE_NEQUAL,
+        '+':  token.TYPE_PLUS,
+        '^':  token.TYPE_POWER,
+        ')':  token.TYPE_RPAREN,
+        ';':  token.TYPE_SEMICOLON,
+        '*':  token.TYPE_TIMES,
+    }
+
+    def Scan(self, buffer, tokens):
+        """Scans the buffer, appending the tokens found to a list.
+
+        The final token appended is always the EOF token, unless an error is
+        raised, in which case the list holds the tokens before the error.
+
+        Args:
+            buffer (str): The source text to scan.
+            tokens (list of parser.Token): The list to append tokens to.
+
+        Raises:
+            exception.TokenException if the buffer holds an invalid token.
+        """
+        types = []
+        values = []
+        try:
+            self.ScanInto(buffer, types, values, [])
+        finally:
+            tokens.extend(map(token.Make, types, values))
+
+    def ScanInto(self, buffer, types, values, columns, offset=0, stops=None):
+        """Scans the buffer into parallel arrays of token data.
+
+        This is the engine behind Scan, and it avoids building parser.Token
+        objects altogether.  The values of ID tokens are left exactly as they
+        appear in the source; see token.Promote for turning them into keywords,
+        functions and lowercase IDs.
+
+        Scanning normally runs to the end of the buffer, but it can also be made
+        to stop at the first token that starts at one of a set of offsets, which
+        is what incremental rescanning needs.
+
+        Args:
+            buffer (str): The source text to scan.
+            types (list or array of int): Receives the token types.
+            values (list): Receives the token values (None if valueless).
+            columns (list or array of int): Receives the offset of each token
+                within the buffer.
+            offset (int): The offset at which to start scanning.
+            stops (set of int): Offsets at which to stop scanning, if any.
+
+        Returns:
+            int: The offset of the token that scanning stopped at, or None if
+            scanning ran to the end of the buffer.
+
+        Raises:
+            exception.TokenException if the buffer holds an invalid token.
+        """
+        match = self.PATTERN.match
+        add_type = types.append
+        add_value = values.append
+        add_column = columns.append
+
+        while True:
+            m = match(buffer, offset)
+            if not m:
+                self._RaiseError(buffer, offset)
+            if stops and m.end('space') in stops:
+                return m.end('space')
+            kind = m.lastgroup
+            offset = m.end()
+
+            if kind == 'id':
+                text = m.group('id')
+                if text[-1] == '%':
+                    add_type(token.TYPE_ID_INT)
+                elif text[-1] == '$':
+                    add_type(token.TYPE_ID_STRING)
+                else:
+                    add_type(token.TYPE_ID_FLOAT)
+                add_value(text)
+            elif kind == 'punct':
+                text = m.group('punct')
+                if text == '?':
+                    add_type(token.TYPE_KEYWORD)
+                    add_value('PRINT')
+                else:
+                    add_type(self.PUNCTUATION[text])
+                    add_value(None)
+            elif kind == 'number':
+                type, value = self._MakeNumber(buffer, m)
+                add_type(type)
+                add_value(value)
+            elif kind == 'string':
+                add_type(token.TYPE_STRING)
+                add_value(m.group('string'))
+            elif kind == 'rem':
+                add_type(token.TYPE_COMMENT)
+                add_value(m.group('rem_text') or '')
+            elif kind == 'comment':
+                add_type(token.TYPE_COMMENT)
+                add_value(m.group('comment'))
+            elif kind == 'bin':
+                value = self._MakeBase(buffer, m, 'bin', 2)
+                add_type(token.TYPE_INT_BIN)
+                add_value(value)
+            elif kind == 'hex':
+                value = self._MakeBase(buffer, m, 'hex', 16)
+                add_type(token.TYPE_INT_HEX)
+                add_value(value)
+            else:
+                add_type(token.TYPE_EOF)
+                add_value(None)
+                add_column(m.end('space'))
+                return None
+            add_column(m.end('space'))
+
+    def _MakeBase(self, buffer, m, group, base):
+        """Converts the digits of a binary or hexadecimal integer match."""
+        digits = m.group(group)
+        if not digits:
+            self._RaiseError(buffer, m.end())
+        return int(digits, base)
+
+    def _MakeNumber(self, buffer, m):
+        """Converts an integer or floating-point match to a (type, value)."""
+        text = m.group('number')
+        exponent = m.group('exponent')
+        if exponent is None and '.' not in text:
+            return token.TYPE_INT, int(text)
+        if exponent is not None and len(exponent) == 1:
+            self._RaiseError(buffer, m.end())
+        try:
+            return token.TYPE_FLOAT, float(text)
+        except ValueError:
+            raise exception.TokenException(
+                'Malformed number "%s" at column %d' % (text, m.start('number')))
+
+    def _RaiseError(self, buffer, offset):
+        """Raises the error for an unexpected character at this offset."""
+        while offset < len(buffer) and buffer[offset] in ' \t\n\r\f':
+            offset += 1
+        if buffer[offset:offset + 1] == '&':
+            offset += 1
+        ch = buffer[offset] if offset < len(buffer) else '\0'
+        raise exception.TokenException(
+            "Unexpected char '%s' at column %d" % (ch, offset))
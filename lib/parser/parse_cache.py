@@ -0,0 +1,77 @@
+import collections
+
+import parser
+import token_stream
+
+class ParseCache:
+    """A bounded cache of parsed lines, keyed by their source text.
+
+    Both direct mode and LOAD parse lines of text, and the same text tends to
+    come up again and again.  This cache sits in front of the parser and keeps
+    the results for the most recently used lines, evicting the least recently
+    used line once it is full.
+
+    The statement sets handed out by the cache are shared by everyone who reads
+    the same text, so they must be treated as immutable.
+
+    The hits, misses and evictions counters can be used to size the cache.
+    """
+
+    # The default number of lines to keep.
+    DEFAULT_SIZE = 1024
+
+    def __init__(self, size=DEFAULT_SIZE):
+        """Initializes an empty cache.
+
+        Args:
+            size (int): The maximum number of lines to keep.
+        """
+        self.size = size
+        self.lines = collections.OrderedDict()  # text->(line number, set)
+        self.hits = 0       # number of reads satisfied by the cache
+        self.misses = 0     # number of reads that had to parse
+        self.evictions = 0  # number of lines dropped to make room
+
+    def __len__(self):
+        """Returns the number of lines currently in the cache."""
+        return len(self.lines)
+
+    def Clear(self):
+        """Empties the cache and resets the counters."""
+        self.lines.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def Read(self, line, stream=None):
+        """Parses a line of input, using the cached result if there is one.
+
+        Args:
+            line (str): The line of input.
+            stream (parser.TokenStream): The tokens of the line, if they are
+                already at hand; otherwise the line is tokenized as needed.
+
+        Returns:
+            (int, statement.StatementSet): The result of Parser.ReadLine.
+        """
+        key = line.strip()
+        result = self.lines.pop(key, None)
+        if result is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if stream is None:
+                stream = token_stream.TokenStream(key)
+            result = parser.Parser(stream).ReadLine()
+            if len(self.lines) >= self.size:
+                self.lines.popitem(last=False)
+                self.evictions += 1
+
+        # Either way, this line is now the most recently used.
+        self.lines[key] = result
+        return result
+
+    def Stats(self):
+        """Returns a human-readable summary of the cache counters."""
+        return '%d/%d lines, %d hits, %d misses, %d evictions' % (
+            len(self.lines), self.size, self.hits, self.misses, self.evictions)
@@ -1,20 +1,160 @@
+import functools
+import operator
 import sys
 
 from .. import exception
 from .. import expression
 from .. import runtime
 from .. import statement
+from .. import system
 from .. import value
+from ..expression import fn
 import print_item
 import token
 
+def _Context(context):
+    """Decorator naming what a parsing method reads, for error reporting.
+
+    Any exception raised by the decorated method is wrapped in a
+    exception.ParserException naming the context, so that a failed parse
+    reports the whole chain of constructs it was in the middle of.
+
+    Args:
+        context (str): The name of the construct read by the method.
+    """
+    def Decorate(method):
+        def Checked(self, *args):
+            try:
+                return method(self, *args)
+            except Exception as e:
+                raise exception.ParserException(context, e)
+        Checked.__name__ = method.__name__
+        Checked.__doc__ = method.__doc__
+        return Checked
+    return Decorate
+
+
 class Parser:
     """Recursive-descent parser for BASIC statements and expressions."""
 
+    # The statements, by keyword.  Each maps to a function that reads the
+    # statement, given the parser positioned at the keyword.
+    _statements = dict((keyword, operator.methodcaller(method)) for
+                       keyword, method in (
+        ('CLEAR',     '_ReadClear'),
+        ('CLS',       '_ReadCls'),
+        ('COLOR',     '_ReadColor'),
+        ('CURSOR',    '_ReadCursor'),
+        ('DATA',      '_ReadData'),
+        ('DEF',       '_ReadDefFn'),
+        ('DELETE',    '_ReadDelete'),
+        ('DIM',       '_ReadDim'),
+        ('END',       '_ReadEnd'),
+        ('FILES',     '_ReadFiles'),
+        ('FOLDER',    '_ReadFolder'),
+        ('FOLDERS',   '_ReadFolders'),
+        ('FOR',       '_ReadFor'),
+        ('GET',       '_ReadGet'),
+        ('GOSUB',     '_ReadGosub'),
+        ('GOTO',      '_ReadGoto'),
+        ('IF',        '_ReadIf'),
+        ('INPUT',     '_ReadInput'),
+        ('LET',       '_ReadLet'),
+        ('LIST',      '_ReadList'),
+        ('LOAD',      '_ReadLoad'),
+        ('LOCATE',    '_ReadLocate'),
+        ('NEW',       '_ReadNew'),
+        ('NEXT',      '_ReadNext'),
+        ('ON',        '_ReadOn'),
+        ('PAUSE',     '_ReadPause'),
+        ('PRINT',     '_ReadPrint'),
+        ('RANDOMIZE', '_ReadRandomize'),
+        ('READ',      '_ReadRead'),
+        ('REMOVE',    '_ReadRemove'),
+        ('RENUM',     '_ReadRenum'),
+        ('RESTORE',   '_ReadRestore'),
+        ('RETURN',    '_ReadReturn'),
+        ('RUN',       '_ReadRun'),
+        ('SAVE',      '_ReadSave'),
+        ('STOP',      '_ReadStop'),
+        ('TROFF',     '_ReadTroff'),
+        ('TRON',      '_ReadTron'),
+        ('WEND',      '_ReadWend'),
+        ('WHILE',     '_ReadWhile'),
+        ('WIDTH',     '_ReadWidth'),
+    ))
+
+    # The built-in functions, by name.  Each maps to a function building the
+    # expression from the list of arguments, and the minimum and maximum number
+    # of arguments (None for a maximum means exactly the minimum).  Functions
+    # that can take no arguments are called without parentheses in that case.
+    _functions = {
+        'ABS':     (fn.EFnAbs, 1, None),
+        'ACOS':    (fn.EFnAcos, 1, None),
+        'ASC':     (fn.EFnAsc, 1, None),
+        'ASIN':    (fn.EFnAsin, 1, None),
+        'ATAN':    (fn.EFnAtan, 1, None),
+        'ATAN2':   (fn.EFnAtan2, 2, None),
+        'BIN$':    (fn.EFnBinS, 1, None),
+        'CHR$':    (fn.EFnChrS, 1, None),
+        'COS':     (fn.EFnCos, 1, None),
+        'DATE$':   (fn.EFnDateS, 0, 0),
+        'EXP':     (fn.EFnExp, 1, None),
+        'HEX$':    (fn.EFnHexS, 1, None),
+        'INSTR':   (fn.EFnInstr, 2, None),
+        'INT':     (fn.EFnInt, 1, None),
+        'LEFT$':   (fn.EFnLeftS, 2, None),
+        'LEN':     (fn.EFnLen, 1, None),
+        'LOG':     (fn.EFnLog, 1, None),
+        'MID$':    (fn.EFnMidS, 3, None),
+        'POS':     (fn.EFnPos, 1, None),
+        'RIGHT$':  (fn.EFnRightS, 2, None),
+        'RND':     (fn.EFnRnd, 0, 1),
+        'SGN':     (fn.EFnSgn, 1, None),
+        'SIN':     (fn.EFnSin, 1, None),
+        'SPACE$':  (fn.EFnSpaceS, 1, None),
+        'SQR':     (fn.EFnSqr, 1, None),
+        'STR$':    (fn.EFnStrS, 1, None),
+        'STRING$': (fn.EFnStringS, 2, None),
+        'TAB':     (fn.EFnTab, 1, None),
+        'TAN':     (fn.EFnTan, 1, None),
+        'TIME$':   (fn.EFnTimeS, 0, 0),
+        'VAL':     (fn.EFnVal, 1, None),
+    }
+
     def __init__(self, stream):
         """Initializes the parser with a source of tokens."""
         self.stream = stream
 
+    @classmethod
+    def AddFunction(cls, name, make, min_count, max_count=None):
+        """Adds a built-in function to the language.
+
+        Args:
+            name (str): The name of the function, in uppercase.
+            make (function): Builds the expression for a call, given the list
+                of argument expressions (or no arguments at all, for a call
+                without parentheses).
+            min_count (int): The minimum number of arguments.  If this is zero,
+                the function can also be called without parentheses.
+            max_count (int): The maximum number of arguments, or None for
+                exactly min_count.
+        """
+        token.AddWord(token.TYPE_FUNCTION, name)
+        cls._functions[name] = (make, min_count, max_count)
+
+    @classmethod
+    def AddStatement(cls, keyword, read):
+        """Adds a statement to the language.
+
+        Args:
+            keyword (str): The keyword that starts the statement, in uppercase.
+            read (function): Reads the statement, given the parser positioned at
+                the keyword, and returns the statement.Statement.
+        """
+        token.AddWord(token.TYPE_KEYWORD, keyword)
+        cls._statements[keyword] = read
+
     def Read(self):
         """Attempts to read one more statement.StatementSet from the stream.
 
@@ -23,6 +163,24 @@ class Parser:
         """
         return self._ReadCommand()
 
+    @_Context('line number')
+    def ReadLine(self):
+        """Reads one line of input without acting on it.
+
+        Unlike Read(), this does not add numbered lines to the program, which
+        lets the caller decide what to do with them (or cache them).
+
+        Returns:
+            (int, statement.StatementSet): The line number (or None if the line
+            is not numbered) and the statements read.
+        """
+        if self.stream.Peek().IsType(token.TYPE_INT):
+            line_number = self.stream.Require(token.TYPE_INT).value
+            return line_number, self._ReadStatementList()
+        else:
+            return None, self._ReadStatementList()
+
+    @_Context('assignment')
     def _ReadAssign(self):
         """Reads an assignment statement.
 
@@ -31,14 +189,12 @@ class Parser:
         Returns:
             statement.SAssignment: The statement read.
         """
-        try:
-            var = self._ReadLValue()
-            self.stream.require(token.TYPE_EQUAL)
-            exp = self._ReadExp()
-            return statement.SAssignment(var, exp)
-        except Exception as e:
-            raise exception.ParserException('assignment', e)
+        var = self._ReadLValue()
+        self.stream.Require(token.TYPE_EQUAL)
+        exp = self._ReadExp()
+        return statement.SAssignment(var, exp)
 
+    @_Context('function call')
     def _ReadCall(self):
         """Reads a function call.
 
@@ -47,95 +203,25 @@ class Parser:
         Returns:
             expression.Expression: The expression read.
         """
-        try:
-            # Read the function name.
-            name = self.stream.Require(token.TYPE_FUNCTION).value
-
-            # Handle zero-argument functions first.
-            if name == 'RND' and self.stream.Peek().type != token.TYPE_LPAREN:
-                return expression.fn.EFnRnd()
-            elif name == 'DATE$':
-                return expression.fn.EFnDateS()
-            elif name == 'TIME$':
-                return expression.fn.EFnTimeS()
+        # Read the function name.
+        name = self.stream.Require(token.TYPE_FUNCTION).value
+        if name not in self._functions:
+            raise exception.ParserException('unknown function')
+        make, min_count, max_count = self._functions[name]
 
-            # Read the opening parenthesis.
-            self.stream.Require(token.TYPE_LPAREN)
-
-            # Read the list of argument expressions.
-            exp = None
-            if name == 'ABS':
-                return expression.fn.EFnAbs(self._ReadExpList(1))
-            elif name == 'ACOS':
-                return expression.fn.EFnAcos(self._ReadExpList(1))
-            elif name == 'ASC':
-                return expression.fn.EFnAsc(self._ReadExpList(1))
-            elif name == 'ASIN':
-                return expression.fn.EFnAsin(self._ReadExpList(1))
-            elif name == 'ATAN':
-                return expression.fn.EFnAtan(self._ReadExpList(1))
-            elif name == 'ATAN2':
-                return expression.fn.EFnAtan2(self._ReadExpList(2))
-            elif name == 'BIN$':
-                return expression.fn.EFnBinS(self._ReadExpList(1))
-            elif name == 'COS':
-                return expression.fn.EFnCos(self._ReadExpList(1))
-            elif name == 'CHR$':
-                return expression.fn.EFnChrS(self._ReadExpList(1))
-            elif name == 'EXP':
-                return expression.fn.EFnExp(self._ReadExpList(1))
-            elif name == 'HEX$':
-                return expression.fn.EFnHexS(self._ReadExpList(1))
-            elif name == 'INSTR':
-                return expression.fn.EFnInstr(self._ReadExpList(2))
-            elif name == 'INT':
-                return expression.fn.EFnInt(self._ReadExpList(1))
-            elif name == 'LEFT$':
-                return expression.fn.EFnLeftS(self._ReadExpList(2))
-            elif name == 'LEN':
-                return expression.fn.EFnLen(self._ReadExpList(1))
-            elif name == 'LOG':
-                return expression.fn.EFnLog(self._ReadExpList(1))
-            elif name == 'LOOK':
-                return expression.fn.EFnLook(self._ReadExpList(2, 3))
-            elif name == 'MID$':
-                return expression.fn.EFnMidS(self._ReadExpList(3))
-            elif name == 'POS':
-                return expression.fn.EFnPos(self._ReadExpList(1))
-            elif name == 'RIGHT$':
-                return expression.fn.EFnRightS(self._ReadExpList(2))
-            elif name == 'RND':
-                return expression.fn.EFnRnd(self._ReadExpList(1))
-            elif name == 'SGN':
-                return expression.fn.EFnSgn(self._ReadExpList(1))
-            elif name == 'SIN':
-                return expression.fn.EFnSin(self._ReadExpList(1))
-            elif name == 'SIZE':
-                return expression.fn.EFnSize(self._ReadExpList(1, 2))
-            elif name == 'SPACE$':
-                return expression.fn.EFnSpaceS(self._ReadExpList(1))
-            elif name == 'SQR':
-                return expression.fn.EFnSqr(self._ReadExpList(1))
-            elif name == 'STR$':
-                return expression.fn.EFnStrS(self._ReadExpList(1))
-            elif name == 'STRING$':
-                return expression.fn.EFnStringS(self._ReadExpList(2))
-            elif name == 'TAB':
-                return expression.fn.EFnTab(self._ReadExpList(1))
-            elif name == 'TAN':
-                return expression.fn.EFnTan(self._ReadExpList(1))
-            elif name == 'VAL':
-                return expression.fn.EFnVal(self._ReadExpList(1))
-            else:
-                raise exception.ParserException('unknown function')
-  
-            # Read the closing parenthesis and we're done.
-            self.stream.Require(token.TYPE_RPAREN)
-            return exp
+        # Functions that can take no arguments are called without parentheses.
+        if min_count == 0 and not self.stream.Peek().IsType(token.TYPE_LPAREN):
+            return make()
+        if max_count == 0:
+            raise exception.ParserException('argument count')
 
-        except Exception as e:
-            raise exception.ParserException('function call', e)
+        # Read the arguments in parentheses.
+        self.stream.Require(token.TYPE_LPAREN)
+        exp = make(self._ReadExpList(max(min_count, 1), max_count))
+        self.stream.Require(token.TYPE_RPAREN)
+        return exp
 
+    @_Context('CLEAR')
     def _ReadClear(self):
         """Reads a CLEAR statement.
 
@@ -144,12 +230,10 @@ class Parser:
         Returns:
             statement.SClear: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('CLEAR')
-            return statement.SClear()
-        except Exception as e:
-            raise exception.ParserException('CLEAR', e)
+        self.stream.RequireKeyword('CLEAR')
+        return statement.SClear()
 
+    @_Context('CLS')
     def _ReadCls(self):
         """Reads a CLS statement.
 
@@ -158,12 +242,10 @@ class Parser:
         Returns:
             statement.SCls: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('CLS')
-            return statement.SCls()
-        except Exception as e:
-            raise exception.ParserException('CLS', e)
+        self.stream.RequireKeyword('CLS')
+        return statement.SCls()
 
+    @_Context('COLOR')
     def _ReadColor(self):
         """Reads a COLOR statement.
 
@@ -172,19 +254,16 @@ class Parser:
         Returns:
             statement.SColor: The statement read.
         """
-        try:
-            # Read the foreground color.
-            self.stream.RequireKeyword('COLOR')
-            fg_exp = self._ReadExp()
+        # Read the foreground color.
+        self.stream.RequireKeyword('COLOR')
+        fg_exp = self._ReadExp()
 
-            # Also read the background color, if there is one.
-            if self.stream.Peek().IsType(token.TOKEN_COMMA):
-                self.stream.Get()
-                return statement.SColor(fg_exp, self._ReadExp())
-            else:
-                return statement.SColor(fg_exp)
-        except Exception as e:
-            raise exception.ParserException('COLOR', e)
+        # Also read the background color, if there is one.
+        if self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
+            return statement.SColor(fg_exp, self._ReadExp())
+        else:
+            return statement.SColor(fg_exp)
 
     def _ReadCommand(self):
         """Reads input from the command mode.
@@ -199,28 +278,16 @@ class Parser:
         Returns:
             statement.StatementSet or None: The statements read.
         """
-        try:
-            # Get the next token.
-            token = self.stream.Peek()
-
-            # If it's a line number, we're adding to a program.
-            if token.IsType(token.TYPE_INT):
-                # Get the line number.
-                line_number = self.stream.Require(token.TYPE_INT).value
-
-                # Try to add the line to the program.
-                try:
-                    statement_set = self._ReadStatementList()
-                    system.State.program.Add(line_number, statement_set)
-                except Exception as e:
-                    e.AtLine(line_number)
-                return None
-            else:
-                return self._ReadStatementList()
+        line_number, statement_set = self.ReadLine()
 
-        except Exception as e:
-            raise exception.ParserException('line number', e)
+        # If it's a line number, we're adding to a program.
+        if line_number is not None:
+            system.State.program.Add(line_number, statement_set)
+            return None
+        else:
+            return statement_set
 
+    @_Context('comment')
     def _ReadComment(self):
         """Reads a comment (REM) statement.
 
@@ -229,12 +296,10 @@ class Parser:
         Returns:
             statement.SComment: The statement read.
         """
-        try:
-            token = self.stream.Require(token.TYPE_COMMENT)
-            return statement.SComment(token.value)
-        except Exception as e:
-            raise exception.ParserException('comment', e)
+        tok = self.stream.Require(token.TYPE_COMMENT)
+        return statement.SComment(tok.value)
 
+    @_Context('CURSOR')
     def _ReadCursor(self):
         """Reads a CURSOR statement.
         
@@ -243,12 +308,10 @@ class Parser:
         Returns:
             statement.SCursor: The statement read.
         """
-        try:
-            token = self.stream.RequireKeyword('CURSOR')
-            return statement.SCursor(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('CURSOR', e)
+        token = self.stream.RequireKeyword('CURSOR')
+        return statement.SCursor(self._ReadExp())
 
+    @_Context('DATA')
     def _ReadData(self):
         """Reads a DATA statement.
 
@@ -257,12 +320,10 @@ class Parser:
         Returns:
             statement.SData: The statement read.
         """
-        try:
-            token = self.stream.RequireKeyword('DATA')
-            return statement.SData(self._ReadDataList())
-        except Exception as e:
-            raise exception.ParserException('DATA', e)
+        token = self.stream.RequireKeyword('DATA')
+        return statement.SData(self._ReadDataList())
 
+    @_Context('DATA item')
     def _ReadDataItem(self):
         """Reads a single item for a DATA statement.
 
@@ -274,33 +335,31 @@ class Parser:
         Returns:
             value.Value: A single data value.
         """
-        try:
-            tok = self.stream.Peek()
-            if tok.type == token.TYPE_INT:
-                return value.VInt(self.stream.Get().value)
+        tok = self.stream.Peek()
+        if tok.type == token.TYPE_INT:
+            return value.VInt(self.stream.Get().value)
 
-            elif tok.type == token.TYPE_FLOAT:
-                return value.VFloat(self.stream.Get().value)
+        elif tok.type == token.TYPE_FLOAT:
+            return value.VFloat(self.stream.Get().value)
 
-            elif tok.type in (token.TYPE_ID_FLOAT, token.TYPE_KEYWORD,
-                                 token.TYPE_FUNCTION, token.TYPE_STRING):
-                return value.VString(self.stream.Get().value)
+        elif tok.type in (token.TYPE_ID_FLOAT, token.TYPE_KEYWORD,
+                             token.TYPE_FUNCTION, token.TYPE_STRING):
+            return value.VString(self.stream.Get().value)
 
-            elif tok.type == token.TYPE_MINUS:
-                val = self._ReadDataItem()
-                if isinstance(val, value.VInt):
-                    return value.VInt(-val.AsInt())
-                elif isinstance(val, value.VFloat):
-                    return value.VFloat(-val.AsFloat())
-                elif isinstance(val, value.VString):
-                    return value.VString('-' + val.AsString())
+        elif tok.type == token.TYPE_MINUS:
+            val = self._ReadDataItem()
+            if isinstance(val, value.VInt):
+                return value.VInt(-val.AsInt())
+            elif isinstance(val, value.VFloat):
+                return value.VFloat(-val.AsFloat())
+            elif isinstance(val, value.VString):
+                return value.VString('-' + val.AsString())
 
-            else:
-                return value.VNull()
+        else:
+            return value.VNull()
 
-        except Exception as e:
-            raise exception.ParserException('DATA item', e)
 
+    @_Context('DATA list')
     def _ReadDataList(self):
         """Reads a list of items for a DATA statement.
 
@@ -311,15 +370,13 @@ class Parser:
             list of value.Value: The array of data values.
         """
         value_list = []
-        try:
+        value_list.append(self._ReadDataItem())
+        while self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
             value_list.append(self._ReadDataItem())
-            while self.stream.Peek().IsType(token.TYPE_COMMA):
-                self.stream.Get()
-                value_list.append(self._ReadDataItem())
-            return value_list
-        except Exception as e:
-            raise exception.ParserException('DATA list', e)
+        return value_list
 
+    @_Context('DEF FN')
     def _ReadDefFn(self):
         """Reads a DEF FN statement.
 
@@ -328,25 +385,24 @@ class Parser:
         Returns:
             statement.SDefFn: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('DEF')
+        self.stream.RequireKeyword('DEF')
 
-            # Read the function name.
-            name = self.stream.RequireId()
-            if not name.IsFn():
-                raise exception.ParserException('DEF FN')
+        # Read the function name.
+        name = self.stream.RequireId()
+        if not name.IsFn():
+            raise exception.ParserException('DEF FN')
 
-            # Read the list of formals.
-            self.stream.Require(token.TYPE_LPAREN)
-            formals = self._ReadIdList()
-            self.stream.Require(token.TYPE_RPAREN)
+        # Read the list of formals.
+        self.stream.Require(token.TYPE_LPAREN)
+        formals = self._ReadIdList()
+        self.stream.Require(token.TYPE_RPAREN)
 
-            # Finish up.
-            self.stream.Require(token.TYPE_EQUAL)
-            return statement.SDefFn(name.vale, formals, self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('DEF FN', e)
+        # Finish up.
+        self.stream.Require(token.TYPE_EQUAL)
+        return statement.SDefFn(expression.ELValue(name), formals,
+                                self._ReadExp())
 
+    @_Context('DELETE')
     def _ReadDelete(self):
         """Reads a DELETE statement.
 
@@ -355,12 +411,10 @@ class Parser:
         Returns:
             statement.SDelete: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('DELETE')
-            return statement.SDelete(self._ReadRange())
-        except Exception as e:
-            raise exception.ParserException('DELETE', e)
+        self.stream.RequireKeyword('DELETE')
+        return statement.SDelete(self._ReadRange())
 
+    @_Context('DIM')
     def _ReadDim(self):
         """Reads a DIM statement.
 
@@ -369,12 +423,10 @@ class Parser:
         Returns:
             statement.SDim: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('DIM')
-            return statement.SDim(self._ReadLValueArrayList())
-        except Exception as e:
-            raise exception.ParserException('DIM', e)
+        self.stream.RequireKeyword('DIM')
+        return statement.SDim(self._ReadLValueArrayList())
 
+    @_Context('END')
     def _ReadEnd(self):
         """Reads an END statement.
 
@@ -383,252 +435,106 @@ class Parser:
         Returns:
             statement.SEnd: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('END')
-            return statement.SEnd()
-        except Exception as e:
-            raise exception.ParserException('END', e)
-
-    def _ReadExp(self):
-        """Reads an expression.
-
-        [exp] ::= [exp0]
-
-        Returns:
-            expression.Expression: The expression read.
-        """
-        return self._ReadExp0()
-
-    def _ReadExp0(self):
-        """Another precedence level in expression-parsing.
-
-        [exp0] ::= [exp1] [exp0-rest]
-        [exp0-rest] ::= @ | OR [exp1] [exp0-rest]
-
-        Returns:
-            expression.Expression: The expression read.
-        """
-        exp = self._ReadExp1()
-        try:
-            tok = self.stream.Peek()
-            while tok.IsKeyword('OR'):
-                self.stream.Get()
-                exp = expression.EOf(exp, self._ReadExp1())
-                tok = self.stream.Peek()
-        except Exception as e:
-            raise exception.ParserException('expression', e)
-        return exp
-
-    def _ReadExp1(self):
-        """Another precedence level in expression-parsing.
-
-        [exp1] ::= [exp2] [exp1-rest]
-        [exp1-rest] ::= @ | AND [exp2] [exp1-rest]
-
-        Returns:
-            expression.Expression: The expression read.
-        """
-        exp = self._ReadExp2()
-        try:
-            tok = self.stream.Peek()
-            while tok.IsKeyword('AND'):
-                self.stream.Get()
-                exp = expression.EAnd(exp, self._ReadExp2())
-                tok = self.stream.Peek()
-        except Exception as e:
-            raise exception.ParserException('expression', e)
-        return exp
-
-    def _ReadExp2(self):
-        """Another precedence level in expression-parsing.
-
-        [exp2] ::= [exp3] [exp2-rest]
-        [exp2-rest] ::= @ | =  [exp3] [exp2-rest] | <> [exp3] [exp2-rest]
-
-        Returns:
-            expression.Expression: The expression read.
-        """
-        exp = self._ReadExp3()
-        try:
-            tok = self.stream.Peek()
-            while tok.IsType(token.TYPE_EQUAL) or tok.IsType(token.TYPE_NEQUAL):
-                if tok.IsType(token.TYPE_EQUAL):
-                    exp = expression.ERelational(
-                        expression.RELATION_TYPE_EQ, exp, self._ReadExp3())
-                elif tok.IsType(token.TYPE_NEQUAL):
-                    exp = expression.ERelational(
-                        expression.RELATION_TYPE_NEQ, exp, self._ReadExp3())
-                tok = self.stream.Peek()
-        except Exception as e:
-            raise exception.ParserException('expression', e)
-        return exp
-
-    def _ReadExp3(self):
-        """Another precedence level in expression-parsing.
-
-        [exp3] ::= [exp4] [exp3-rest]
-        [exp3-rest] ::= @ | <  [exp4] [exp3-rest] | <= [exp4] [exp3-rest]
-            | >  [exp4] [exp3-rest] | >= [exp4] [exp3-rest]
-
-        Returns:
-            expression.Expression: The expression read.
-        """
-        exp = self._ReadExp4()
-        try:
-            tok = self.stream.Peek()
-            while (tok.IsType(token.TYPE_GEQ) or tok.IsType(token.TYPE_GT) or
-                   tok.IsType(token.TYPE_LEQ) or tok.IsType(token.TYPE_LT)):
-                if tok.type == token.TYPE_GEQ:
-                    self.stream.Get()
-                    exp = expression.ERelational(
-                        expression.RELATION_TYPE_GEQ, exp, self._ReadExp4())
-                elif tok.type == token.TYPE_GT:
-                    self.stream.Get()
-                    exp = expression.ERelational(
-                        expression.RELATION_TYPE_GT, exp, self._ReadExp4())
-                elif tok.type == token.TYPE_LEQ:
-                    self.stream.Get()
-                    exp = expression.ERelational(
-                        expression.RELATION_TYPE_LEQ, exp, self._ReadExp4())
-                elif tok.type == token.TYPE_LT:
-                    self.stream.Get()
-                    exp = expression.ERelational(
-                        expression.RELATION_TYPE_LT, exp, self._ReadExp4())
-                tok = self.stream.Peek()
-        except Exception as e:
-            raise exception.ParserException('expression', e)
-        return exp
-
-    def _ReadExp4(self):
-        """Another precedence level in expression-parsing.
-
-        [exp4] ::= [exp5] [exp4-rest]
-        [exp4-rest] ::= @ | + [exp5] [exp4-rest] | - [exp5] [exp4-rest]
-
-        Returns:
-            expression.Expression: The expression read.
-        """
-        exp = self._ReadExp5()
-        try:
-            tok = self.stream.Peek()
-            while tok.IsType(token.TYPE_PLUS) or tok.IsType(token.TYPE_MINUS):
-                if tok.IsType(token.TYPE_PLUS):
-                    self.stream.Get()
-                    exp = expression.EAdd(exp, self._ReadExp5())
-                elif tok.IsType(token.TYPE_MINUS):
-                    self.stream.Get()
-                    exp = expression.ESubtract(exp, self._ReadExp5())
-                tok = self.stream.Peek()
-        except Exception as e:
-            raise exception.ParserException('expression', e)
-        return exp
-
-    def _ReadExp5(self):
-        """Another precedence level in expression-parsing.
-
-        [exp5] ::= [exp6] [exp5-rest]
-        [exp5-rest] ::= @ | * [exp6] [exp5-rest] | / [exp6] [exp5-rest]
-            | MOD [exp6] [exp5-rest]
-
-        Returns:
-            expression.Expression: The expression read.
-        """
-        exp = self._ReadExp6()
-        try:
-            tok = self.stream.Peek()
-            while (tok.IsType(token.TYPE_DIVIDE) or
-                   tok.IsType(token.TYPE_TIMES) or
-                   tok.IsKeyword('MOD')):
-                if tok.IsType(token.TYPE_DIVIDE):
-                    self.stream.Get()
-                    exp = expression.EDivide(exp, self._ReadExp6())
-                elif tok.IsType(token.TYPE_TIMES):
-                    self.stream.Get()
-                    exp = expression.EMultiply(exp, self._ReadExp6())
-                elif tok.IsKeyword('MOD'):
-                    self.stream.Get()
-                    exp = expression.EMod(exp, self._ReadExp6())
-                tok = self.stream.Peek()
-        except Exception as e:
-            raise exception.ParserException('expression', e)
-        return exp
-
-    def _ReadExp6(self):
-        """Another precedence level in expression-parsing.
-
-        [exp6] ::= [exp7] | + [exp6] | - [exp6] | NOT [exp6]
+        self.stream.RequireKeyword('END')
+        return statement.SEnd()
+
+    # The binary operators, keyed by token type (or by the keyword, for the
+    # keyword operators).  Each maps to the precedence of the operator, whether
+    # it is right-associative, its expression class, and the arguments that
+    # class takes before the two operands.
+    _BINARY_OPERATORS = {
+        'OR':              (0, False, expression.EOr, ()),
+        'AND':             (1, False, expression.EAnd, ()),
+        token.TYPE_EQUAL:  (2, False, expression.ERelational,
+                            (expression.RELATION_TYPE_EQ,)),
+        token.TYPE_NEQUAL: (2, False, expression.ERelational,
+                            (expression.RELATION_TYPE_NEQ,)),
+        token.TYPE_GEQ:    (3, False, expression.ERelational,
+                            (expression.RELATION_TYPE_GEQ,)),
+        token.TYPE_GT:     (3, False, expression.ERelational,
+                            (expression.RELATION_TYPE_GT,)),
+        token.TYPE_LEQ:    (3, False, expression.ERelational,
+                            (expression.RELATION_TYPE_LEQ,)),
+        token.TYPE_LT:     (3, False, expression.ERelational,
+                            (expression.RELATION_TYPE_LT,)),
+        token.TYPE_PLUS:   (4, False, expression.EAdd, ()),
+        token.TYPE_MINUS:  (4, False, expression.ESubtract, ()),
+        token.TYPE_TIMES:  (5, False, expression.EMultiply, ()),
+        token.TYPE_DIVIDE: (5, False, expression.EDivide, ()),
+        'MOD':             (5, False, expression.EMod, ()),
+        token.TYPE_POWER:  (7, True,  expression.EPower, ()),
+    }
+
+    # The unary operators, keyed the same way, mapped to their expression class
+    # (or None, for unary plus).  They all bind more tightly than any binary
+    # operator except for ^.
+    _UNARY_OPERATORS = {
+        token.TYPE_PLUS:  None,
+        token.TYPE_MINUS: expression.ENegate,
+        'NOT':            expression.ENot,
+    }
+    _UNARY_PRECEDENCE = 6
+
+    # Specializes the operators of expressions to the types of their operands.
+    _specializer = expression.Specializer()
+
+    @_Context('expression')
+    def _ReadExp(self, min_precedence=0):
+        """Reads an expression, by precedence climbing.
+
+        In order of increasing precedence, the operators are:
+
+            OR
+            AND
+            =  <>
+            <  <=  >  >=
+            +  -
+            *  /  MOD
+            unary +  unary -  NOT
+            ^
+
+        All of the binary operators are left-associative, except for ^.  Each
+        loop iteration reads one operator and its right-hand operand, so the
+        cost of an expression depends on the number of operators in it rather
+        than on the number of precedence levels.
+
+        Each operator is specialized to the types of its operands as soon as
+        it is built (see expression.Specializer), so an operator that can only
+        fail with a type mismatch is an error here.
 
-        Returns:
-            expression.Expression: The expression read.
-        """
-        try:
-            tok = self.stream.Peek()
-            if tok.IsType(token.TYPE_EOF):
-                return self._ReadExp7()
-            elif tok.IsType(token.TYPE_PLUS):
-                self.stream.Get()
-                return self._ReadExp6()
-            elif tok.IsType(token.TYPE_MINUS):
-                self.stream.Get()
-                return expression.ENegate(self._ReadExp6())
-            elif tok.IsKeyword('NOT'):
-                self.stream.Get()
-                return expression.ENot(self._ReadExp6())
-        except Exception as e:
-            raise exception.ParserException('expression', e)
-        return self._ReadExp7()
-
-    def _ReadExp7(self):
-        """Another precedence level in expression-parsing.
-
-        [exp7] ::= [exp8] [exp7-rest]
-        [exp7-rest] ::= @ | ^ [exp7] [exp7-rest]
-
-        Returns:
-            expression.Expression: The expression read.
-        """
-        exp = self._ReadExp8()
-        try:
-            tok = self.stream.Peek()
-            if tok.IsType(token.TYPE_POWER):
-                self.stream.Get()
-                exp = expression.EPower(exp, self._ReadExp7())
-        except Exception as e:
-            raise exception.ParseException('expression', e)
-        return exp
-
-    def _ReadExp8(self):
-        """Another precedence level in expression-parsing.
-
-        [exp8] ::= [literal] | [lvalue] | [fn-call] | [function] [args]
-            | ( [exp] )
+        Args:
+            min_precedence (int): The lowest precedence of operator to read;
+                reading stops at the first operator below it.
 
         Returns:
             expression.Expression: The expression read.
         """
-        try:
+        tok = self.stream.Peek()
+        key = tok.value if tok.type == token.TYPE_KEYWORD else tok.type
+        if key in self._UNARY_OPERATORS:
+            self.stream.Get()
+            cls = self._UNARY_OPERATORS[key]
+            exp = self._ReadExp(self._UNARY_PRECEDENCE)
+            if cls:
+                exp = self._specializer.Build(cls, exp)
+        else:
+            exp = self._ReadOperand()
+
+        while True:
             tok = self.stream.Peek()
-            if tok.IsType(token.TYPE_LPAREN):
-                # This is a parenthetical expression.
-                self.stream.Require(token.TYPE_LPAREN)
-                exp = self._ReadExp()
-                self.stream.Require(token.TYPE_RPAREN)
-                return expression.EParen(exp)
-            elif tok.IsType(token.TYPE_FUNCTION):
-                # This is a built-in function call.
-                return self._ReadCall()
-            elif tok.IsFn():
-                # This is an FN function call.
-                return self._ReadFunction()
-            elif tok.IsId():
-                # This is an LValue.
-                return self._ReadLValue()
+            key = tok.value if tok.type == token.TYPE_KEYWORD else tok.type
+            operator = self._BINARY_OPERATORS.get(key)
+            if operator is None or operator[0] < min_precedence:
+                return exp
+            precedence, right, cls, args = operator
+            self.stream.Get()
+            if right:
+                rhs = self._ReadExp(precedence)
             else:
-                # This is a literal
-                return self._ReadLiteral()
-        except Exception as e:
-            raise exception.ParserException('expression', e)
+                rhs = self._ReadExp(precedence + 1)
+            exp = self._specializer.Build(cls, *(args + (exp, rhs)))
 
+    @_Context('expression list')
     def _ReadExpList(self, min_count=None, max_count=None):
         """Reads in a list of expressions.
 
@@ -643,13 +549,10 @@ class Parser:
             list of expression.Expression: The list of expressions read.
         """
         exps = []
-        try:
+        exps.append(self._ReadExp())
+        while self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
             exps.append(self._ReadExp())
-            while self.stream.Peek().IsType(token.TYPE_COMMA):
-                self.stream.Get()
-                exps.append(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('expression list', e)
 
         if min_count and not max_count:
             max_count = min_count
@@ -660,6 +563,7 @@ class Parser:
 
         return exps
 
+    @_Context('FILES')
     def _ReadFiles(self):
         """Reads a FILES statement.
 
@@ -668,12 +572,10 @@ class Parser:
         Returns:
             statement.SFiles: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('FILES')
-            return statement.SFiles()
-        except Exception as e:
-            raise exception.ParserException('FILES', e)
+        self.stream.RequireKeyword('FILES')
+        return statement.SFiles()
 
+    @_Context('FOLDER')
     def _ReadFolder(self):
         """Reads a FOLDER statement.
 
@@ -682,12 +584,10 @@ class Parser:
         Returns:
             statement.SFolder: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('FOLDER')
-            return statement.SFolder(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('FOLDER', e)
+        self.stream.RequireKeyword('FOLDER')
+        return statement.SFolder(self._ReadExp())
 
+    @_Context('FOLDERS')
     def _ReadFolders(self):
         """Reads a FOLDERS statement.
 
@@ -696,12 +596,10 @@ class Parser:
         Returns:
             statement.SFolders: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('FOLDERS')
-            return statement.SFolders()
-        except Exception as e:
-            raise exception.ParserException('FOLDERS', e)
+        self.stream.RequireKeyword('FOLDERS')
+        return statement.SFolders()
 
+    @_Context('FOR')
     def _ReadFor(self):
         """Reads a FOR statement.
 
@@ -711,32 +609,30 @@ class Parser:
         Returns:
             statement.SFor: The statement read.
         """
-        try:
-            # Read the FOR.
-            self.stream.RequireKeyword('FOR')
+        # Read the FOR.
+        self.stream.RequireKeyword('FOR')
 
-            # Get the variable to use.
-            var = self._ReadLValue()
-            if not var.IsNumeric():
-                raise exception.ParserException('FOR variable')
+        # Get the variable to use.
+        var = self._ReadLValue()
+        if not var.IsNumeric():
+            raise exception.ParserException('FOR variable')
 
-            # Read the range expression.
-            self.stream.Require(token.TYPE_EQUAL)
-            exp_start = self._ReadExp()
-            self.stream.RequireKeyword('TO')
-            exp_end = self._ReadExp()
+        # Read the range expression.
+        self.stream.Require(token.TYPE_EQUAL)
+        exp_start = self._ReadExp()
+        self.stream.RequireKeyword('TO')
+        exp_end = self._ReadExp()
 
-            # See if there's a step specified.
-            if self.stream.Peek().IsKeyword('STEP'):
-                self.stream.Get()
-                exp_step = self._ReadExp()
-                return statement.SFor(var, exp_start, exp_end, exp_step)
-            else:
-                return statement.SFor(var, exp_start, exp_end)
+        # See if there's a step specified.
+        if self.stream.Peek().IsKeyword('STEP'):
+            self.stream.Get()
+            exp_step = self._ReadExp()
+            return statement.SFor(var, exp_start, exp_end, exp_step)
+        else:
+            return statement.SFor(var, exp_start, exp_end)
 
-        except Exception as e:
-            raise exception.ParserException('FOR', e)
 
+    @_Context('function call')
     def _ReadFunction(self):
         """Reads a FN function call expression.
 
@@ -746,14 +642,13 @@ class Parser:
         Returns:
             expression.EFunction: The expression read.
         """
-        try:
-            name = expression.ELValue(self.stream.RequireId())
-            self.stream.Require(token.TYPE_LPAREN)
-            arg_exps = self._ReadExpList()
-            self.stream.Require(token.TYPE_RPAREN)
-        except Exception as e:
-            raise exception.ParserException('function call', e)
+        name = expression.ELValue(self.stream.RequireId())
+        self.stream.Require(token.TYPE_LPAREN)
+        arg_exps = self._ReadExpList()
+        self.stream.Require(token.TYPE_RPAREN)
+        return expression.EFunction(name, arg_exps)
 
+    @_Context('GET')
     def _ReadGet(self):
         """Reads a GET statement.
 
@@ -762,12 +657,10 @@ class Parser:
         Returns:
             statement.SGet: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('GET')
-            return statement.SGet(self._ReadLValue())
-        except Exception as e:
-            raise exception.ParserException('GET', e)
+        self.stream.RequireKeyword('GET')
+        return statement.SGet(self._ReadLValue())
 
+    @_Context('GOSUB')
     def _ReadGosub(self):
         """Reads a GOSUB statement.
 
@@ -776,12 +669,10 @@ class Parser:
         Returns:
             statement.SGosub: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('GOSUB')
-            return statement.SGosub(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('GOSUB', e)
+        self.stream.RequireKeyword('GOSUB')
+        return statement.SGosub(self._ReadExp())
 
+    @_Context('GOTO')
     def _ReadGoto(self):
         """Reads a GOTO statement.
 
@@ -790,12 +681,10 @@ class Parser:
         Returns:
             statement.SGoto: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('GOTO')
-            return statement.SGoto(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('GOTO', e)
+        self.stream.RequireKeyword('GOTO')
+        return statement.SGoto(self._ReadExp())
 
+    @_Context('variable list')
     def _ReadIdList(self):
         """Reads a list of IDs.
 
@@ -807,15 +696,13 @@ class Parser:
             list of expression.ELValue: The array of IDs.
         """
         vars = []
-        try:
+        vars.append(expression.ELValue(self.stream.RequireId()))
+        while self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
             vars.append(expression.ELValue(self.stream.RequireId()))
-            while self.stream.Peek().IsType(token.TYPE_COMMA):
-                self.stream.Get()
-                vars.append(self.expression.ELValue(self.stream.RequireId()))
-            return vars
-        except Exception as e:
-            raise exception.ParserException('variable list', e)
+        return vars
 
+    @_Context('IF')
     def _ReadIf(self):
         """Reads an IF statement.
 
@@ -825,25 +712,23 @@ class Parser:
         Returns:
             statement.SIf: The statement read.
         """
-        try:
-            # Read the IF and THEN.
-            self.stream.RequireKeyword('IF')
-            test_exp = self._ReadExp()
-            self.stream.RequireKeyword('THEN')
-            then_case = self._ReadThenCase()
+        # Read the IF and THEN.
+        self.stream.RequireKeyword('IF')
+        test_exp = self._ReadExp()
+        self.stream.RequireKeyword('THEN')
+        then_case = self._ReadThenCase()
 
-            # See if there's an ELSE.
-            if self.stream.Peek().IsKeyword('ELSE'):
-                self.stream.RequireKeyword('ELSE')
-                else_case = self._ReadThenCase()
-                return statement.SIf(test_exp, then_case, else_case)
+        # See if there's an ELSE.
+        if self.stream.Peek().IsKeyword('ELSE'):
+            self.stream.RequireKeyword('ELSE')
+            else_case = self._ReadThenCase()
+            return statement.SIf(test_exp, then_case, else_case)
 
-            # If not, return the one-armed version.
-            return statement.SIf(test_exp, then_case)
+        # If not, return the one-armed version.
+        return statement.SIf(test_exp, then_case)
 
-        except Exception as e:
-            raise exception.ParserException('IF', e)
 
+    @_Context('INPUT')
     def _ReadInput(self):
         """Reads an INPUT statement.
 
@@ -852,17 +737,15 @@ class Parser:
         Returns:
             statement.SInput: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('INPUT')
-            if self.stream.Peek().IsType(token.TYPE_STRING):
-                prompt = self.stream.Get().value
-                self.stream.Require(token.TYPE_SEMICOLON)
-                return statement.SInput(self._ReadLValueList(), prompt)
-            else:
-                return statement.SInput(self._ReadLValueList())
-        except Exception as e:
-            raise exception.ParserException('INPUT', e)
+        self.stream.RequireKeyword('INPUT')
+        if self.stream.Peek().IsType(token.TYPE_STRING):
+            prompt = self.stream.Get().value
+            self.stream.Require(token.TYPE_SEMICOLON)
+            return statement.SInput(self._ReadLValueList(), prompt)
+        else:
+            return statement.SInput(self._ReadLValueList())
 
+    @_Context('constant')
     def _ReadInt(self):
         """Reads an integer expression.
 
@@ -871,17 +754,15 @@ class Parser:
         Returns:
             expression.EInt: The expression read.
         """
-        try:
-            tok = self.stream.RequireInt()
-            if tok.IsType(token.TYPE_INT):
-                return expression.EInt(tok.value)
-            elif tok.IsTyp(token.TYPE_INT_BIN):
-                return expression.EInt(tok.value, 2)
-            else:
-                return expression.EInt(tok.value, 16)
-        except Exception as e:
-            raise exception.ParserException('constant', e)
+        tok = self.stream.RequireInt()
+        if tok.IsType(token.TYPE_INT):
+            return expression.EInt(tok.value)
+        elif tok.IsType(token.TYPE_INT_BIN):
+            return expression.EInt(tok.value, 2)
+        else:
+            return expression.EInt(tok.value, 16)
 
+    @_Context('LET')
     def _ReadLet(self):
         """Reads a LET statement.
 
@@ -890,12 +771,10 @@ class Parser:
         Returns:
             statement.SAssignment: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('LET')
-            return self._ReadAssign()
-        except Exception as e:
-            raise exception.ParserException('LET', e)
+        self.stream.RequireKeyword('LET')
+        return self._ReadAssign()
 
+    @_Context('LIST')
     def _ReadList(self):
         """Reads a LIST statement.
 
@@ -904,12 +783,10 @@ class Parser:
         Returns:
             statement.SList: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('LIST')
-            return statement.SList(self._ReadRange())
-        except Exception as e:
-            raise exception.ParserException('LIST', e)
+        self.stream.RequireKeyword('LIST')
+        return statement.SList(self._ReadRange())
 
+    @_Context('constant')
     def _ReadLiteral(self):
         """Reads a literal expression.
 
@@ -918,19 +795,17 @@ class Parser:
         Returns:
             expression.Expression: The expression read.
         """
-        try:
-            tok = self.stream.Peek()
-            if tok.IsType(token.TYPE_STRING):
-                return expression.EString(self.stream.Get().value)
-            elif tok.IsType(token.TYPE_FLOAT):
-                return expression.EFloat(self.stream.Get().value)
-            elif tok.IsInt():
-                return self._ReadInt()
-            else:
-                raise exception.ParserException('expression')
-        except Exception as e:
-            raise exception.ParserException('constant', e)
-
+        tok = self.stream.Peek()
+        if tok.IsType(token.TYPE_STRING):
+            return expression.EString(self.stream.Get().value)
+        elif tok.IsType(token.TYPE_FLOAT):
+            return expression.EFloat(self.stream.Get().value)
+        elif tok.IsInt():
+            return self._ReadInt()
+        else:
+            raise exception.ParserException('expression')
+
+    @_Context('LOAD')
     def _ReadLoad(self):
         """Reads a LOAD statement.
 
@@ -939,12 +814,10 @@ class Parser:
         Returns:
             statement.SLoad: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('LOAD')
-            return statement.SLoad(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('LOAD', e)
+        self.stream.RequireKeyword('LOAD')
+        return statement.SLoad(self._ReadExp())
 
+    @_Context('LOCATE')
     def _ReadLocate(self):
         """Reads a LOCATE statement.
 
@@ -953,15 +826,13 @@ class Parser:
         Returns:
             statement.SLocale: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('LOCATE')
-            row_exp = self._ReadExp()
-            self.stream.Require(token.TYPE_COMMA)
-            column_exp = self._ReadExp()
-            return statement.SLocate(row_exp, column_exp)
-        except Exception as e:
-            raise exception.ParserException('LOCATE', e)
+        self.stream.RequireKeyword('LOCATE')
+        row_exp = self._ReadExp()
+        self.stream.Require(token.TYPE_COMMA)
+        column_exp = self._ReadExp()
+        return statement.SLocate(row_exp, column_exp)
 
+    @_Context('variable reference')
     def _ReadLValue(self):
         """Reads a LValue (assignable value).
 
@@ -970,19 +841,17 @@ class Parser:
         Returns:
             expression.Expression: The assignable value read.
         """
-        try:
-            # Read the ID.
-            tok = self.stream.RequireId()
+        # Read the ID.
+        tok = self.stream.RequireId()
 
-            # Dispatch to the array or FN function versions if necessary.
-            if self.stream.Peek().IsType(token.TYPE_LPAREN):
-                return self._ReadLValueArray(tok)
-            else:
-                return expression.ELValue(tok)
+        # Dispatch to the array or FN function versions if necessary.
+        if self.stream.Peek().IsType(token.TYPE_LPAREN):
+            return self._ReadLValueArray(tok)
+        else:
+            return expression.ELValue(tok)
 
-        except Exception as e:
-            raise exception.ParserException('variable reference', e)
 
+    @_Context('variable list')
     def _ReadLValueList(self):
         """Reads an array of LValues (assignable values).
 
@@ -993,15 +862,13 @@ class Parser:
             list of expression.ELValue: The assignable values read.
         """
         vals = []
-        try:
+        vals.append(self._ReadLValue())
+        while self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
             vals.append(self._ReadLValue())
-            while self.stream.Peek().IsType(tok.TYPE_COMMA):
-                self.stream.Get()
-                vals.append(self._ReadLValue())
-            return vals
-        except Exception as e:
-            raise exception.ParserException('variable list', e)
+        return vals
 
+    @_Context('array subscript')
     def _ReadLValueArray(self, tok):
         """Reads an assignable array value.
 
@@ -1014,14 +881,12 @@ class Parser:
         Returns:
             expression.ELValueArray: The assignable array value read.
         """
-        try:
-            self.stream.Require(token.TYPE_LPAREN)
-            exp_list = self._ReadExpList()
-            self.stream.Require(token.TYPE_RPAREN)
-            return expression.ELValueArray(tok, exp_list)
-        except Exception as e:
-            raise exception.ParserException('array subscript', e)
+        self.stream.Require(token.TYPE_LPAREN)
+        exp_list = self._ReadExpList()
+        self.stream.Require(token.TYPE_RPAREN)
+        return expression.ELValueArray(tok, exp_list)
 
+    @_Context('array list')
     def _ReadLValueArrayList(self):
         """Reads a list of assignable array values.
 
@@ -1032,15 +897,13 @@ class Parser:
             list of expression.ELValueArray: The array of values read.
         """
         vars = []
-        try:
+        vars.append(self._ReadLValueArray(self.stream.RequireId()))
+        while self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
             vars.append(self._ReadLValueArray(self.stream.RequireId()))
-            while self.stream.Peek().IsType(token.TYPE_COMMA):
-                self.stream.Get()
-                vars.append(self._ReadLValueArray(self.stream.RequireId()))
-            return vars
-        except Exception as e:
-            raise exception.ParserException('array list', e)
+        return vars
 
+    @_Context('NEW')
     def _ReadNew(self):
         """Reads a NEW statement.
 
@@ -1049,29 +912,35 @@ class Parser:
         Returns:
             statement.SNew: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('NEW')
-            return statement.SNew()
-        except Exception as e:
-            raise exception.ParserException('NEW', e)
+        self.stream.RequireKeyword('NEW')
+        return statement.SNew()
 
+    @_Context('NEXT')
     def _ReadNext(self):
         """Reads a NEXT statement.
 
-        [next] ::= NEXT | NEXT [lvalue]
+        [next] ::= NEXT | NEXT [lvalue] [next-rest]
+        [next-rest] ::= @ | , [lvalue] [next-rest]
+
+        NEXT I, J is the same as NEXT I : NEXT J, and is read as the two
+        statements.
 
         Returns:
-            statement.SNext: The statement read.
+            statement.SNext or statement.StatementSet: The statement read, or
+            the statements for a list of variables.
         """
-        try:
-            self.stream.RequireKeyword('NEXT')
-            if self.stream.Peek().IsId():
-                return statement.SNext(self._ReadLValue())
-            else:
-                return statement.SNext()
-        except Exception as e:
-            raise exception.ParserException('NEXT', e)
+        self.stream.RequireKeyword('NEXT')
+        if not self.stream.Peek().IsId():
+            return statement.SNext()
+        nexts = [statement.SNext(self._ReadLValue())]
+        while self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
+            nexts.append(statement.SNext(self._ReadLValue()))
+        if len(nexts) == 1:
+            return nexts[0]
+        return statement.StatementSet(nexts)
 
+    @_Context('ON')
     def _ReadOn(self):
         """Reads an ON-GOTO or ON-GOSUB statement.
 
@@ -1081,20 +950,50 @@ class Parser:
         Returns:
             statement.Statement: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('ON')
-            index_exp = self._ReadExp()
-            if self.stream.Peek().IsKeyword('GOTO'):
-                self.stream.Get()
-                return statement.SOnGoto(index_exp, self._ReadExpList())
-            elif self.stream.Peek().IsKeyword('GOSUB'):
-                self.stream.Get()
-                return statement.SOnGosub(index_exp, self._ReadExpList())
-            else:
-                raise exception.ParserException('ON')
-        except Exception as e:
-            raise exception.ParserException('ON', e)
+        self.stream.RequireKeyword('ON')
+        index_exp = self._ReadExp()
+        if self.stream.Peek().IsKeyword('GOTO'):
+            self.stream.Get()
+            return statement.SOnGoto(index_exp, self._ReadExpList())
+        elif self.stream.Peek().IsKeyword('GOSUB'):
+            self.stream.Get()
+            return statement.SOnGosub(index_exp, self._ReadExpList())
+        else:
+            raise exception.ParserException('ON')
 
+    def _ReadOperand(self):
+        """Reads an operand of an expression.
+
+        [operand] ::= [literal] | [lvalue] | [fn-call] | [function] [args]
+            | ( [exp] )
+
+        This is only called by _ReadExp, whose context already names the
+        expression, so it does not add a second one.
+
+        Returns:
+            expression.Expression: The expression read.
+        """
+        tok = self.stream.Peek()
+        if tok.IsType(token.TYPE_LPAREN):
+            # This is a parenthetical expression.
+            self.stream.Require(token.TYPE_LPAREN)
+            exp = self._ReadExp()
+            self.stream.Require(token.TYPE_RPAREN)
+            return expression.EParen(exp)
+        elif tok.IsType(token.TYPE_FUNCTION):
+            # This is a built-in function call.
+            return self._ReadCall()
+        elif tok.IsFn():
+            # This is an FN function call.
+            return self._ReadFunction()
+        elif tok.IsId():
+            # This is an LValue.
+            return self._ReadLValue()
+        else:
+            # This is a literal
+            return self._ReadLiteral()
+
+    @_Context('PAUSE')
     def _ReadPause(self):
         """Reads a PAUSE statement.
 
@@ -1103,12 +1002,10 @@ class Parser:
         Returns:
             statement.SPause: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('PAUSE')
-            return statement.SPause(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('PAUSE', e)
+        self.stream.RequireKeyword('PAUSE')
+        return statement.SPause(self._ReadExp())
 
+    @_Context('PRINT')
     def _ReadPrint(self):
         """Reads a PRINT statement.
 
@@ -1117,11 +1014,10 @@ class Parser:
         Returns:
             statement.SPrint: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('PRINT')
-        except Exception as e:
-            raise exception.ParserException('PRINT', e)
+        self.stream.RequireKeyword('PRINT')
+        return statement.SPrint(self._ReadPrintList())
 
+    @_Context('PRINT')
     def _ReadPrintList(self):
         """Reads a list of PrintItem objects.
 
@@ -1131,23 +1027,25 @@ class Parser:
             list of parser.PrintItem: The PrintItem objects read.
         """
         items = []
-        try:
-            while not self.stream.AtTerminator():
-                exp = self._ReadExp()
-                tok = self.stream.Peek()
-                if self.stream.AtTerminator():
-                    items.append(
-                        print_item.PrintItem(exp, print_item.TYPE_FINAL))
-                elif tok.IsType(token.TYPE_SEMICOLON):
-                    items.append(
-                        print_item.PrintItem(exp, print_item.TYPE_SEMICOLON))
-                elif tok.IsType(token.TYPE_COMMA):
-                    items.append(
-                        print_item.PrintItem(exp, print_item.TYPE_COMMA))
-        except Exception as e:
-            raise exception.ParserException('PRINT', e)
+        while not self.stream.AtTerminator():
+            exp = self._ReadExp()
+            tok = self.stream.Peek()
+            if self.stream.AtTerminator():
+                items.append(
+                    print_item.PrintItem(exp, print_item.TYPE_FINAL))
+            elif tok.IsType(token.TYPE_SEMICOLON):
+                self.stream.Get()
+                items.append(
+                    print_item.PrintItem(exp, print_item.TYPE_SEMICOLON))
+            elif tok.IsType(token.TYPE_COMMA):
+                self.stream.Get()
+                items.append(
+                    print_item.PrintItem(exp, print_item.TYPE_COMMA))
+            else:
+                raise exception.ParserException('PRINT separator')
         return items
 
+    @_Context('RANDOMIZE')
     def _ReadRandomize(self):
         """Reads a RANDOMIZE statement.
 
@@ -1156,12 +1054,10 @@ class Parser:
         Returns:
             statement.SRandomize: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('RANDOMIZE')
-            return statement.SRandomize(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('RANDOMIZE', e)
+        self.stream.RequireKeyword('RANDOMIZE')
+        return statement.SRandomize(self._ReadExp())
 
+    @_Context('line range')
     def _ReadRange(self):
         """Reads a range of line numbers.
 
@@ -1171,34 +1067,32 @@ class Parser:
             runtime.LineRange: The range of line numbers read.
         """
         start = 0
-        try:
-            # Handle the @ case.
+        # Handle the @ case.
+        tok = self.stream.Peek()
+        if not (tok.IsType(token.TYPE_INT) or tok.IsType(token.TYPE_MINUS)):
+            return runtime.LineRange(start, sys.maxint)
+
+        # Establish the beginning of the range.
+        if tok.IsType(token.TYPE_INT):
+            start = self.stream.Get().value
             tok = self.stream.Peek()
-            if not (tok.IsType(token.TYPE_INT) or tok.IsType(token.TYPE_MINUS)):
-                return runtime.LineRange(start, sys.maxint)
 
-            # Establish the beginning of the range.
-            if tok.IsType(token.TYPE_INT):
-                start = self.stream.Get().value
-                tok = self.stream.Peek()
+            # Handle the [INT] case.
+            if not tok.IsType(token.TYPE_MINUS):
+                return runtime.LineRange(start, start)
 
-                # Handle the [INT] case.
-                if not tok.IsType(token.TYPE_MINUS):
-                    return runtime.LineRange(start, start)
+        # Read the -
+        self.stream.Get()
+        tok = self.stream.Peek()
 
-            # Read the -
-            self.stream.Get()
-            tok = self.stream.Peek()
-
-            # Establish the end of the range.
-            if tok.IsType(token.TYPE_INT):
-                return runtime.LineRange(start, self.stream.Get().value)
-            else:
-                return runtime.LineRange(start, sys.maxint)
+        # Establish the end of the range.
+        if tok.IsType(token.TYPE_INT):
+            return runtime.LineRange(start, self.stream.Get().value)
+        else:
+            return runtime.LineRange(start, sys.maxint)
 
-        except Exception as e:
-            raise exception.ParserException('line range', e)
 
+    @_Context('READ')
     def _ReadRead(self):
         """Reads a READ statement.
 
@@ -1207,12 +1101,10 @@ class Parser:
         Returns:
             statement.SRead: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('READ')
-            return statement.SRead(self._ReadLValueList())
-        except Exception as e:
-            raise exception.ParserException('READ', e)
+        self.stream.RequireKeyword('READ')
+        return statement.SRead(self._ReadLValueList())
 
+    @_Context('REMOVE')
     def _ReadRemove(self):
         """Reads a REMOVE statement.
 
@@ -1221,12 +1113,10 @@ class Parser:
         Returns:
             statement.SRemove: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('REMOVE')
-            return statement.SRemove(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('REMOVE', e)
+        self.stream.RequireKeyword('REMOVE')
+        return statement.SRemove(self._ReadExp())
 
+    @_Context('RENUM')
     def _ReadRenum(self):
         """Reads a RENUM statement.
 
@@ -1235,24 +1125,22 @@ class Parser:
         Returns:
             statement.SRenum: The statement read.
         """
-        try:
-            # Read the basic version.
-            self.stream.RequireKeyword('RENUM')
-            ran = self._ReadRange()
-            self.stream.RequireKeyword('TO')
-            start = self.stream.Require(token.TYPE_INT).value
+        # Read the basic version.
+        self.stream.RequireKeyword('RENUM')
+        ran = self._ReadRange()
+        self.stream.RequireKeyword('TO')
+        start = self.stream.Require(token.TYPE_INT).value
 
-            # See if we have an increment as well.
-            if self.stream.Peek().IsType(token.TYPE_COMMA):
-                self.stream.Get()
-                inc = self.stream.Require(token.TYPE_INT).value
-                return statement.SRenum(ran, start, inc)
-            else:
-                return statement.SRenum(ran, start)
+        # See if we have an increment as well.
+        if self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
+            inc = self.stream.Require(token.TYPE_INT).value
+            return statement.SRenum(ran, start, inc)
+        else:
+            return statement.SRenum(ran, start)
 
-        except Exception as e:
-            raise exception.ParserException('RENUM', e)
 
+    @_Context('RESTORE')
     def _ReadRestore(self):
         """Reads a RESTORE statement.
 
@@ -1261,15 +1149,13 @@ class Parser:
         Returns:
             statement.SRestore: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('RESTORE')
-            if self.stream.AtTerminator():
-                return statement.SRestore()
-            else:
-                return statement.SRestore(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('RESTORE', e)
+        self.stream.RequireKeyword('RESTORE')
+        if self.stream.AtTerminator():
+            return statement.SRestore()
+        else:
+            return statement.SRestore(self._ReadExp())
 
+    @_Context('RETURN')
     def _ReadReturn(self):
         """Reads a RETURN statement.
 
@@ -1278,12 +1164,10 @@ class Parser:
         Returns:
             statement.SReturn: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('RETURN')
-            return statement.SReturn()
-        except Exception as e:
-            raise exception.ParserException('RETURN', e)
+        self.stream.RequireKeyword('RETURN')
+        return statement.SReturn()
 
+    @_Context('RUN')
     def _ReadRun(self):
         """Reads a RUN statement.
 
@@ -1292,29 +1176,31 @@ class Parser:
         Returns:
             statement.SRun: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('RUN')
-            if self.stream.AtTerminator():
-                return statement.SRun()
-            else:
-                return statement.SRun(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('RUN', e)
+        self.stream.RequireKeyword('RUN')
+        if self.stream.AtTerminator():
+            return statement.SRun()
+        else:
+            return statement.SRun(self._ReadExp())
 
+    @_Context('SAVE')
     def _ReadSave(self):
         """Reads a SAVE statement.
 
-        [save] ::= SAVE [exp]
+        [save] ::= SAVE [exp] | SAVE [exp] , A
 
         Returns:
             statement.SSave: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('SAVE')
-            return statement.SSave(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('SAVE', e)
+        self.stream.RequireKeyword('SAVE')
+        exp = self._ReadExp()
+        if not self.stream.Peek().IsType(token.TYPE_COMMA):
+            return statement.SSave(exp)
+        self.stream.Get()
+        if self.stream.RequireId().value != 'a':
+            raise exception.ParserException('A')
+        return statement.SSave(exp, True)
 
+    @_Context('statement')
     def _ReadStatement(self):
         """Reads a statement.
 
@@ -1328,101 +1214,20 @@ class Parser:
         Returns:
             statement.Statement: The statement read.
         """
-        try:
-            tok = self.stream.Peek()
-            if tok.IsType(token.TYPE_EOF):
-                return statement.SNull()
-            elif tok.IsType(token.TYPE_COMMENT):
-                return self._ReadComment()
-            elif tok.IsKeyword('CLEAR'):
-                return self._ReadClear()
-            elif tok.IsKeyword('CLS'):
-                return self._ReadCls()
-            elif tok.IsKeyword('COLOR'):
-                return self._ReadColor()
-            elif tok.IsKeyword('CURSOR'):
-                return self._ReadCursor()
-            elif tok.IsKeyword('DATA'):
-                return self._ReadData()
-            elif tok.IsKeyword('DEF'):
-                return self._ReadDefFn()
-            elif tok.IsKeyword('DELETE'):
-                return self._ReadDelete()
-            elif tok.IsKeyword('DIM'):
-                return self._ReadDim()
-            elif tok.IsKeyword('END'):
-                return self._ReadEnd()
-            elif tok.IsKeyword('FILES'):
-                return self._ReadFiles()
-            elif tok.IsKeyword('FOLDER'):
-                return self._ReadFolder()
-            elif tok.IsKeyword('FOLDERS'):
-                return self._ReadFolders()
-            elif tok.IsKeyword('FOR'):
-                return self._ReadFor()
-            elif tok.IsKeyword('GET'):
-                return self._ReadGet()
-            elif tok.IsKeyword('GOSUB'):
-                return self._ReadGosub()
-            elif tok.IsKeyword('GOTO'):
-                return self._ReadGoto()
-            elif tok.IsKeyword('IF'):
-                return self._ReadIf()
-            elif tok.IsKeyword('INPUT'):
-                return self._ReadInput()
-            elif tok.IsKeyword('LET'):
-                return self._ReadLet()
-            elif tok.IsKeyword('LIST'):
-                return self._ReadList()
-            elif tok.IsKeyword('LOAD'):
-                return self._ReadLoad()
-            elif tok.IsKeyword('LOCATE'):
-                return self._ReadLocate()
-            elif tok.IsKeyword('NEW'):
-                return self._ReadNew()
-            elif tok.IsKeyword('NEXT'):
-                return self._ReadNext()
-            elif tok.IsKeyword('ON'):
-                return self._ReadOn()
-            elif tok.IsKeyword('PAUSE'):
-                return self._ReadPause()
-            elif tok.IsKeyword('PRINT'):
-                return self._ReadPrint()
-            elif tok.IsKeyword('RANDOMIZE'):
-                return self._ReadRandomize()
-            elif tok.IsKeyword('READ'):
-                return self._ReadRead()
-            elif tok.IsKeyword('REMOVE'):
-                return self._ReadRemove()
-            elif tok.IsKeyword('RENUM'):
-                return self._ReadRenum()
-            elif tok.IsKeyword('RESTORE'):
-                return self._ReadRestore()
-            elif tok.IsKeyword('RETURN'):
-                return self._ReadReturn()
-            elif tok.IsKeyword('RUN'):
-                return self._ReadRun()
-            elif tok.IsKeyword('SAVE'):
-                return self._ReadSave()
-            elif tok.IsKeyword('STOP'):
-                return self._ReadStop()
-            elif tok.IsKeyword('TROFF'):
-                return self._ReadTroff()
-            elif tok.IsKeyword('TRON'):
-                return self._ReadTron()
-            elif tok.IsKeyword('WEND'):
-                return self._ReadWend()
-            elif tok.IsKeyword('WHILE'):
-                return self._ReadWhile()
-            elif tok.IsKeyword('WIDTH'):
-                return self._ReadWidth()
-            elif tok.IsId():
-                return self._ReadAssign()
-            else:
-                raise exception.ParserException('unknown statement')
-        except Exception as e:
-            raise exception.ParserException('statement', e)
+        tok = self.stream.Peek()
+        if tok.IsType(token.TYPE_KEYWORD):
+            read = self._statements.get(tok.value)
+            if read:
+                return read(self)
+        elif tok.IsType(token.TYPE_EOF):
+            return statement.SNull()
+        elif tok.IsType(token.TYPE_COMMENT):
+            return self._ReadComment()
+        elif tok.IsId():
+            return self._ReadAssign()
+        raise exception.ParserException('unknown statement')
 
+    @_Context('compound statement')
     def _ReadStatementList(self):
         """Reads a set of statements.
 
@@ -1433,16 +1238,18 @@ class Parser:
             statement.StatementSet: The statement set read.
         """
         ls = []
-        try:
-            while True:
-                ls.append(self._ReadStatement())
-                tok = self.stream.Peek()
-                if not tok.IsType(token.TYPE_COLON):
-                    return statement.StatementSet(ls)
-                self.stream.Get()
-        except Exception as e:
-            raise exception.ParserException('compound statement', e)
+        while True:
+            stmt = self._ReadStatement()
+            if isinstance(stmt, statement.StatementSet):
+                ls.extend(stmt.set)  # a statement read as several
+            else:
+                ls.append(stmt)
+            tok = self.stream.Peek()
+            if not tok.IsType(token.TYPE_COLON):
+                return statement.StatementSet(ls)
+            self.stream.Get()
 
+    @_Context('STOP')
     def _ReadStop(self):
         """Reads a STOP statement.
 
@@ -1451,12 +1258,10 @@ class Parser:
         Returns:
             statement.SStop: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('STOP')
-            return statement.SSTop()
-        except Exception as e:
-            raise exception.ParserException('STOP', e)
+        self.stream.RequireKeyword('STOP')
+        return statement.SStop()
 
+    @_Context('THEN/ELSE')
     def _ReadThenCase(self):
         """Reads the THEN or ELSE case from an IF statement.
 
@@ -1467,16 +1272,14 @@ class Parser:
         Returns:
             statement.StatementSet: The set of statements read.
         """
-        try:
-            tok = self.stream.Peek()
-            if tok.IsType(token.TYPE_INT):
-                return statement.StatementSet(
-                    [statement.SGoto(self._ReadInt())])
-            else:
-                return self._ReadStatementList()
-        except Exception as e:
-            raise exception.ParserException('THEN/ELSE', e)
+        tok = self.stream.Peek()
+        if tok.IsType(token.TYPE_INT):
+            return statement.StatementSet(
+                [statement.SGoto(self._ReadInt())])
+        else:
+            return self._ReadStatementList()
 
+    @_Context('TROFF')
     def _ReadTroff(self):
         """Reads a TROFF statement.
 
@@ -1485,12 +1288,10 @@ class Parser:
         Returns:
             statement.STroff: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('TROFF')
-            return statement.STroff()
-        except Exception as e:
-            raise exception.ParserException('TROFF', e)
+        self.stream.RequireKeyword('TROFF')
+        return statement.STroff()
 
+    @_Context('TRON')
     def _ReadTron(self):
         """Reads a TRON statement.
 
@@ -1499,12 +1300,10 @@ class Parser:
         Returns:
             statement.STron: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('TRON')
-            return statement.STron()
-        except Exception as e:
-            raise exception.ParserException('TRON', e)
+        self.stream.RequireKeyword('TRON')
+        return statement.STron()
 
+    @_Context('WEND')
     def _ReadWend(self):
         """Reads a WEND statement.
 
@@ -1513,12 +1312,10 @@ class Parser:
         Returns:
             statement.SWend: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('WEND')
-            return statement.SWend()
-        except Exception as e:
-            raise exception.ParserException('WEND', e)
+        self.stream.RequireKeyword('WEND')
+        return statement.SWend()
 
+    @_Context('WHILE')
     def _ReadWhile(self):
         """Reads a WHILE statement.
 
@@ -1527,12 +1324,10 @@ class Parser:
         Returns:
             statement.SWhile: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('WHILE')
-            return statement.SWhile(self._ReadExp())
-        except Exception as e:
-            raise exception.ParserException('WHILE', e)
+        self.stream.RequireKeyword('WHILE')
+        return statement.SWhile(self._ReadExp())
 
+    @_Context('WIDTH')
     def _ReadWidth(self):
         """Reads a WIDTH statement.
 
@@ -1541,13 +1336,10 @@ class Parser:
         Returns:
             statement.SWidth: The statement read.
         """
-        try:
-            self.stream.RequireKeyword('WIDTH')
-            width_exp = self._ReadExp()
-            if self.stream.Peek().IsType(token.TYPE_COMMA):
-                self.stream.Get()
-                return statement.SWidth(width_exp, self._ReadExp())
-            else:
-                return statement.SWidth(width_exp)
-        except Exception as e:
-            raise exception.ParserException('WIDTH', e)
+        self.stream.RequireKeyword('WIDTH')
+        width_exp = self._ReadExp()
+        if self.stream.Peek().IsType(token.TYPE_COMMA):
+            self.stream.Get()
+            return statement.SWidth(width_exp, self._ReadExp())
+        else:
+            return statement.SWidth(width_exp)
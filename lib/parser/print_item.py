@@ -0,0 +1,26 @@
+from .. import statement
+
+# What follows each item of a PRINT statement.
+TYPE_FINAL     = statement.SPrint.FINAL      # nothing: the line ends
+TYPE_SEMICOLON = statement.SPrint.SEMICOLON  # the next item follows directly
+TYPE_COMMA     = statement.SPrint.COMMA      # the next item is in the next zone
+
+class PrintItem:
+    """A single item in the list of a PRINT statement."""
+
+    def __init__(self, exp, type):
+        """Initializes the item.
+
+        Args:
+            exp (expression.Expression): The value to print.
+            type (int): What follows the item (TYPE_*).
+        """
+        self.exp = exp
+        self.type = type
+
+    def __str__(self):
+        if self.type == TYPE_SEMICOLON:
+            return str(self.exp) + ';'
+        elif self.type == TYPE_COMMA:
+            return str(self.exp) + ','
+        return str(self.exp)
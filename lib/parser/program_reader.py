@@ -0,0 +1,74 @@
+import itertools
+
+from .. import exception
+import cruncher
+import parser
+import token_array
+import token_array_stream
+
+class ProgramReader:
+    """Reads a whole program from a file, streaming it line by line.
+
+    LOAD used to work like typing the program in at the REPL, building a new
+    tokenizer and parser for every line.  This reader instead tokenizes the
+    file in large chunks with token_array.TokenArray, and runs a single parser
+    over all of them, yielding the lines of the program as it goes.
+
+    The source can be anything with read() and readline() methods, including
+    regular files and mmap objects, and may be either a text or a crunched
+    program.
+    """
+
+    # The number of text lines to tokenize at a time.
+    CHUNK_LINES = 1024
+
+    def __init__(self, source, chunk_lines=CHUNK_LINES):
+        """Initializes with the file to read.
+
+        Args:
+            source (file): The file (or mmap) holding the program.
+            chunk_lines (int): The number of text lines to tokenize at a time.
+        """
+        self.source = source
+        self.chunk_lines = chunk_lines
+
+    def Read(self):
+        """Reads the lines of the program.
+
+        Blank lines are skipped.
+
+        Yields:
+            (int, statement.StatementSet): The line number and the statements
+            of each line.
+
+        Raises:
+            exception.ParserException if a line has no line number or cannot
+            be parsed.
+        """
+        p = parser.Parser(None)
+        for tokens in self._ReadArrays():
+            p.stream = token_array_stream.TokenArrayStream(tokens, 0)
+            for row in range(tokens.LineCount()):
+                if (tokens.starts[row + 1] - tokens.starts[row] == 1 and
+                    row not in tokens.errors):
+                    continue  # blank line
+
+                p.stream.SetRow(row)
+                line_number, statement_set = p.ReadLine()
+                if line_number is None:
+                    raise exception.ParserException('line number')
+                yield line_number, statement_set
+
+    def _ReadArrays(self):
+        """Reads the file as a series of token_array.TokenArray objects."""
+        crunch = cruncher.Cruncher()
+        head = self.source.read(len(crunch.MAGIC))
+        lines = iter(self.source.readline, '')
+        if crunch.IsCrunched(head):
+            yield crunch.Uncrunch(head + ''.join(lines))
+            return
+
+        text = head + ''.join(itertools.islice(lines, self.chunk_lines))
+        while text:
+            yield token_array.TokenArray(text)
+            text = ''.join(itertools.islice(lines, self.chunk_lines))
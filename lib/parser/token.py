@@ -29,35 +29,24 @@ TYPE_SEMICOLON = 26
 TYPE_STRING    = 27
 TYPE_TIMES     = 28
 
+_INF = float('inf')
 
-class Token:
-    """Encapsulates individual BASIC tokens."""
+
+class Token(object):
+    """Encapsulates individual BASIC tokens.
+
+    Tokens are immutable once built, which lets tokens be shared freely.  Use
+    Make rather than the constructor to get the shared instances.
+    """
+
+    __slots__ = ('type', 'value')
 
     def __init__(self, type, value=None):
+        if value and type in (TYPE_ID_FLOAT, TYPE_ID_INT, TYPE_ID_STRING):
+            type, value = Promote(type, value)
         self.type = type
         self.value = value
 
-        if self.value:
-            # Promote ID token if possible.
-            if self.type in (TYPE_ID_FLOAT, TYPE_ID_STRING):
-                id = self.value.upper()
-
-                # Try keywords first.
-                if id in self.KEYWORDS:
-                    this.type = TYPE_KEYWORD
-                    this.value = id
-                    return
-                
-                # Try functions second.
-                if id in self.FUNCTIONS:
-                    this.type = TYPE_FUNCTION
-                    this.value = id
-                    return
-
-            # If this is an actual ID, force it into lowercase.
-            if self.IsId():
-                self.value = self.value.lower()
-
     # The set of valid function names.
     FUNCTIONS = set((
         'ABS', 'ACOS', 'ASC', 'ASIN', 'ATAN',
@@ -179,7 +168,13 @@ class Token:
         elif self.type == TYPE_EQUAL:
             return '='
         elif self.type == TYPE_FLOAT:
-            return str(self.value)
+            # A number too large for a float, such as 1E999, reads as
+            # infinity; write it as one that does too, rather than as "inf".
+            if self.value == _INF:
+                return '1E999'
+            return repr(self.value)
+        elif self.type == TYPE_FUNCTION:
+            return self.value
         elif self.type == TYPE_GEQ:
             return '>='
         elif self.type == TYPE_GT:
@@ -195,7 +190,7 @@ class Token:
         elif self.type == TYPE_INT_BIN:
             return '&B' + bin(self.value)[2:]
         elif self.type == TYPE_INT_HEX:
-            return '&H' + hex(self.value)[2:]
+            return '&H%X' % self.value
         elif self.type == TYPE_KEYWORD:
             return self.value
         elif self.type == TYPE_LEQ:
@@ -210,6 +205,8 @@ class Token:
             return '<>'
         elif self.type == TYPE_PLUS:
             return '+'
+        elif self.type == TYPE_POWER:
+            return '^'
         elif self.type == TYPE_RPAREN:
             return ')'
         elif self.type == TYPE_SEMICOLON:
@@ -220,3 +217,88 @@ class Token:
             return '*'
         else:
             return None
+
+
+def Promote(type, value):
+    """Classifies the raw text of an ID token.
+
+    ID tokens that spell a keyword or a built-in function are promoted to
+    TYPE_KEYWORD or TYPE_FUNCTION, with an uppercase value.  Actual IDs are
+    forced into lowercase.
+
+    Args:
+        type (int): The raw token type (one of the TYPE_ID_* types).
+        value (str): The raw text of the ID.
+
+    Returns:
+        (int, str): The promoted token type and value.
+    """
+    if type in (TYPE_ID_FLOAT, TYPE_ID_STRING):
+        id = value.upper()
+
+        # Try keywords first.
+        if id in Token.KEYWORDS:
+            return TYPE_KEYWORD, intern(id)
+
+        # Try functions second.
+        if id in Token.FUNCTIONS:
+            return TYPE_FUNCTION, intern(id)
+
+    # IDs are interned so that environment lookups compare by identity.
+    return type, intern(value.lower())
+
+
+def AddWord(type, word):
+    """Adds a keyword or built-in function name to the language.
+
+    Args:
+        type (int): TYPE_KEYWORD or TYPE_FUNCTION.
+        word (str): The new word, in uppercase.
+    """
+    if type == TYPE_KEYWORD:
+        Token.KEYWORDS.add(word)
+    else:
+        Token.FUNCTIONS.add(word)
+
+    # IDs seen so far might spell the new word.
+    for id_type in (TYPE_ID_FLOAT, TYPE_ID_INT, TYPE_ID_STRING):
+        _WORDS[id_type].clear()
+
+
+# Shared instances of the tokens that never carry a value.
+_VALUELESS = dict((type, Token(type)) for type in (
+    TYPE_EOF, TYPE_COLON, TYPE_COMMA, TYPE_DIVIDE, TYPE_EQUAL, TYPE_GEQ,
+    TYPE_GT, TYPE_LEQ, TYPE_LPAREN, TYPE_LT, TYPE_MINUS, TYPE_NEQUAL,
+    TYPE_PLUS, TYPE_POWER, TYPE_RPAREN, TYPE_SEMICOLON, TYPE_TIMES))
+
+# Shared instances of ID, keyword and function tokens, indexed by type and then
+# by value.  ID tokens are found under their text as it appears in the source,
+# which saves classifying the same text over and over again.
+_WORDS = dict((type, {}) for type in (
+    TYPE_FUNCTION, TYPE_ID_FLOAT, TYPE_ID_INT, TYPE_ID_STRING, TYPE_KEYWORD))
+
+
+def Make(type, value=None):
+    """Returns a token with the given type and value.
+
+    This works just like the Token constructor, except that valueless tokens and
+    ID, keyword and function tokens are shared rather than being built anew.
+
+    Args:
+        type (int): The token type.
+        value: The token value, if any.
+
+    Returns:
+        Token: The token.
+    """
+    if value is None:
+        return _VALUELESS[type]
+
+    words = _WORDS.get(type)
+    if words is None:
+        return Token(type, value)
+
+    tok = words.get(value)
+    if tok is None:
+        tok = words[value] = Token(type, value)
+    return tok
@@ -0,0 +1,153 @@
+import array
+
+from .. import exception
+import line_scanner
+import token
+
+class TokenArray:
+    """A compact, array-based tokenization of an entire source text.
+
+    Rather than one parser.Token object per token, the tokens of every line of
+    the source are stored in parallel arrays that can be indexed directly:
+
+        types[i]    the token type (token.TYPE_*)
+        values[i]   the token value, or None for valueless tokens
+        rows[i]     the (zero-based) source line the token came from
+        columns[i]  the offset of the token within its source line, or -1 if
+                    the token did not come from source text
+
+    The tokens of source line r occupy the indices starts[r] up to (but not
+    including) starts[r + 1], and every line that scanned cleanly ends with an
+    EOF token.  A line that failed to scan holds the tokens before the error,
+    and the error itself is kept in errors[r].
+    """
+
+    # The scanner shared by all token arrays.
+    _scanner = line_scanner.LineScanner()
+
+    # The token types that need a space between them when adjacent.
+    _SPACED = set((
+        token.TYPE_COMMENT, token.TYPE_FLOAT, token.TYPE_FUNCTION,
+        token.TYPE_ID_FLOAT, token.TYPE_ID_INT, token.TYPE_ID_STRING,
+        token.TYPE_INT, token.TYPE_INT_BIN, token.TYPE_INT_HEX,
+        token.TYPE_KEYWORD, token.TYPE_STRING,
+    ))
+
+    # Pairs of adjacent token types that would run together as a different
+    # token if rendered without a space between them.
+    _MERGING = set((
+        (token.TYPE_LT, token.TYPE_GT),
+        (token.TYPE_LT, token.TYPE_EQUAL),
+        (token.TYPE_GT, token.TYPE_EQUAL),
+    ))
+
+    def __init__(self, source=None):
+        """Tokenizes the source text.
+
+        Args:
+            source (str): The text to tokenize, one BASIC line per text line,
+                or None to start out empty.
+        """
+        self.types = array.array('B')
+        self.values = []
+        self.rows = array.array('i')
+        self.columns = array.array('i')
+        self.starts = array.array('i', [0])
+        self.errors = {}
+
+        if source:
+            for line in source.splitlines():
+                self._ScanLine(line)
+
+    def __len__(self):
+        """Returns the total number of tokens in the array."""
+        return len(self.types)
+
+    def AddLine(self, types, values, columns=None, error=None):
+        """Appends the tokens of one more line to the arrays.
+
+        Args:
+            types (list of int): The token types.
+            values (list): The token values, already classified as by
+                token.Promote.
+            columns (list of int): The token offsets, or None if the tokens did
+                not come from source text.
+            error (exception.TokenException): The error that stopped the scan
+                of the line, if any.
+
+        Returns:
+            int: The row of the new line.
+        """
+        row = self.LineCount()
+        self.types.extend(types)
+        self.values.extend(values)
+        self.rows.extend([row] * len(types))
+        self.columns.extend(columns or [-1] * len(types))
+        self.starts.append(len(self.types))
+        if error:
+            self.errors[row] = error
+        return row
+
+    def LineCount(self):
+        """Returns the number of source lines that were tokenized."""
+        return len(self.starts) - 1
+
+    def LineText(self, row):
+        """Renders the tokens of a line back into source text.
+
+        The text is a canonical form of the line rather than the original, but
+        tokenizing it gives back exactly the same tokens.
+
+        Args:
+            row (int): The line to render.
+
+        Returns:
+            str: The text of the line.
+        """
+        parts = []
+        prev = None
+        for i in range(self.starts[row], self.starts[row + 1]):
+            tok = self.Token(i)
+            if tok.IsType(token.TYPE_EOF):
+                break
+
+            # Only words and numbers need spacing, except for pairs of
+            # punctuation that would otherwise run together.
+            if prev is not None:
+                if prev in self._SPACED and tok.type in self._SPACED:
+                    parts.append(' ')
+                elif (prev, tok.type) in self._MERGING:
+                    parts.append(' ')
+            parts.append(str(tok))
+            prev = tok.type
+        return ''.join(parts)
+
+    def Token(self, index):
+        """Returns a parser.Token for the token at the given index.
+
+        Args:
+            index (int): The index of the token.
+
+        Returns:
+            parser.Token: The token.
+        """
+        return token.Make(self.types[index], self.values[index])
+
+    def _ScanLine(self, line):
+        """Appends the tokens of a single source line to the arrays."""
+        types = []
+        values = []
+        columns = []
+        error = None
+        try:
+            self._scanner.ScanInto(line, types, values, columns)
+        except exception.TokenException as e:
+            error = e
+
+        # Classify the IDs now, so that nobody has to do it later.
+        for i, type in enumerate(types):
+            if type in (token.TYPE_ID_FLOAT, token.TYPE_ID_INT,
+                        token.TYPE_ID_STRING):
+                types[i], values[i] = token.Promote(type, values[i])
+
+        self.AddLine(types, values, columns, error)
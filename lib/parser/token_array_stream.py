@@ -0,0 +1,58 @@
+import token
+import token_stream
+
+class TokenArrayStream(token_stream.TokenStream):
+    """A token stream that reads one line of a token_array.TokenArray.
+
+    This lets the parser work directly from a bulk tokenization, without
+    rescanning the source text of the line.
+    """
+
+    def __init__(self, tokens, row):
+        """Initializes based on a line of a token array.
+
+        Args:
+            tokens (token_array.TokenArray): The tokenized source.
+            row (int): The (zero-based) source line to read.
+        """
+        token_stream.TokenStream.__init__(self, None)
+        self.array = tokens
+        self.SetRow(row)
+
+    def Eof(self):
+        """Checks if the stream is at its end."""
+        return self.index >= self.end - 1
+
+    def Reset(self):
+        """Resets the internal state so that subsequent reads start over."""
+        self.peek = None
+        self.index = self.start
+
+    def SetRow(self, row):
+        """Moves the stream to the start of another line of the array.
+
+        This lets a single stream (and parser) read every line in turn.
+
+        Args:
+            row (int): The (zero-based) source line to read.
+        """
+        self.row = row
+        self.start = self.array.starts[row]
+        self.end = self.array.starts[row + 1]
+        self.Reset()
+
+    def _ReadToken(self):
+        """Returns the next token of the line.
+
+        If the line failed to scan, the error is raised when the stream reaches
+        the offending token.
+
+        Returns:
+            parser.Token: The next token.
+        """
+        if self.index < self.end:
+            tok = self.array.Token(self.index)
+            if not tok.IsType(token.TYPE_EOF):
+                self.index += 1
+            return tok
+        raise self.array.errors[self.row]
@@ -0,0 +1,116 @@
+import bisect
+
+from .. import exception
+import line_scanner
+import token
+import token_stream
+
+class TokenLine:
+    """A line of text under edit, along with its tokens.
+
+    The full-screen editor keeps one of these for each line on the screen.
+    Whenever the text changes, only the tokens around the edit are scanned
+    again: rescanning starts with the token just before the edit, and stops as
+    soon as it reaches a token boundary in the unchanged text after the edit.
+    The rest of the tokens are reused as they are, just shifted over.
+
+    The tokens are stored in parallel lists, as in token_array.TokenArray:
+    types, values (as classified by token.Promote) and columns.
+    """
+
+    # The scanner shared by all token lines.
+    _scanner = line_scanner.LineScanner()
+
+    def __init__(self, text=''):
+        """Initializes with some initial text.
+
+        Args:
+            text (str): The initial text of the line.
+        """
+        self.text = ''
+        self.types = []
+        self.values = []
+        self.columns = []
+        self.error = None  # the error that stopped the scan, if any
+        self.rescanned = 0  # the number of tokens scanned by the last edit
+        self.Replace(0, 0, text)
+
+    def Delete(self, start, end):
+        """Deletes the text between two offsets."""
+        self.Replace(start, end, '')
+
+    def Insert(self, offset, text):
+        """Inserts text at the given offset."""
+        self.Replace(offset, offset, text)
+
+    def Replace(self, start, end, text):
+        """Replaces the text between two offsets, and rescans what it must.
+
+        Args:
+            start (int): The offset of the first character to replace.
+            end (int): The offset just past the last character to replace.
+            text (str): The replacement text.
+        """
+        self.text = self.text[:start] + text + self.text[end:]
+        delta = len(text) - (end - start)
+
+        # Tokens that start before the edit are kept, except for the last one,
+        # since the edit might extend it.
+        first = bisect.bisect_left(self.columns, start)
+        if first:
+            first -= 1
+            offset = self.columns[first]
+        else:
+            offset = 0
+
+        # Any token that started after the edit is a point where the old and new
+        # tokens are bound to agree again.
+        last = bisect.bisect_left(self.columns, end, first)
+        stops = dict((self.columns[i] + delta, i)
+                     for i in range(last, len(self.columns)))
+
+        types = []
+        values = []
+        columns = []
+        error = None
+        try:
+            stop = self._scanner.ScanInto(self.text, types, values, columns,
+                                          offset, stops)
+        except exception.TokenException as e:
+            error = e
+            stop = None
+
+        # Classify the IDs that were scanned.
+        for i, type in enumerate(types):
+            if type in (token.TYPE_ID_FLOAT, token.TYPE_ID_INT,
+                        token.TYPE_ID_STRING):
+                types[i], values[i] = token.Promote(type, values[i])
+        self.rescanned = len(types)
+
+        # Splice the new tokens in with the old ones that still hold.
+        if stop is None:
+            self.error = error
+            self.types[first:] = types
+            self.values[first:] = values
+            self.columns[first:] = columns
+        else:
+            resume = stops[stop]
+            self.types[first:resume] = types
+            self.values[first:resume] = values
+            self.columns[first:resume] = columns
+            if delta:
+                for i in range(first + len(columns), len(self.columns)):
+                    self.columns[i] += delta
+
+    def Stream(self):
+        """Returns a token stream over the line, without rescanning it.
+
+        Returns:
+            parser.TokenStream: The stream.
+        """
+        return token_stream.TokenStream.FromTokens(self.text, self.Tokens(),
+                                                   self.error)
+
+    def Tokens(self):
+        """Returns the tokens of the line as a list of parser.Token."""
+        return map(token.Make, self.types, self.values)
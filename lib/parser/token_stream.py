@@ -1,29 +1,74 @@
 from .. import exception
+import line_scanner
 import token
+import token_array
 
 class TokenStream:
     """Provides a stream abstraction for tokens in the BASIC language."""
 
-    def __init__(self, buffer):
-        """Initializes based on a string to tokenize."""
+    # The available tokenizing engines.  ENGINE_FSM is the original
+    # character-at-a-time state machine, and ENGINE_REGEX scans the whole line
+    # at once with a line_scanner.LineScanner.
+    ENGINE_FSM   = 'fsm'
+    ENGINE_REGEX = 'regex'
+
+    # The engine used when none is passed to the constructor.
+    default_engine = ENGINE_FSM
+
+    # The scanner shared by all streams using ENGINE_REGEX.
+    _scanner = line_scanner.LineScanner()
+
+    def __init__(self, buffer, engine=None):
+        """Initializes based on a string to tokenize.
+
+        Args:
+            buffer (str): The text to tokenize.
+            engine (str): The tokenizing engine (ENGINE_*), or None for the
+                default engine.
+        """
         self.buffer = buffer
+        self.engine = engine or self.default_engine
         self.offset = 0   # current offset within the buffer
         self.peek = None  # a single buffered token to peek at
 
+        # State used only by ENGINE_REGEX.
+        self.tokens = None  # the tokens scanned from the buffer
+        self.index = 0      # index of the next token to return
+        self.error = None   # the error that stopped the scan, if any
+
     def AtTerminator(self):
         """Checks if the stream is at a statement terminator.
         
         Statement terminators include EOF, ELSE, and a colon.
         """
-        token = self.Peek()
-        return (token.IsType(token.TYPE_EOF) or
-                token.IsType(token.TYPE_COLON) or
-                token.IsKeyword('ELSE'))
+        tok = self.Peek()
+        return (tok.IsType(token.TYPE_EOF) or
+                tok.IsType(token.TYPE_COLON) or
+                tok.IsKeyword('ELSE'))
 
     def Eof(self):
         """Checks if the stream is at its end."""
         return (self.offset >= len(self.buffer))
 
+    @classmethod
+    def FromTokens(cls, buffer, tokens, error=None):
+        """Builds a stream that replays tokens that were already scanned.
+
+        Args:
+            buffer (str): The text that the tokens were scanned from.
+            tokens (list of parser.Token): The tokens, ending with the EOF token
+                unless the scan stopped at an error.
+            error (exception.TokenException): The error that stopped the scan,
+                if any.
+
+        Returns:
+            TokenStream: The stream.
+        """
+        stream = cls(buffer, cls.ENGINE_REGEX)
+        stream.tokens = tokens
+        stream.error = error
+        return stream
+
     def Get(self):
         """Return the next token in the stream.
         
@@ -39,6 +84,21 @@ class TokenStream:
             return token
         return self._ReadToken()
 
+    @staticmethod
+    def TokenizeAll(source):
+        """Tokenizes an entire source text, with many lines, in one call.
+
+        The result stores the tokens of all of the lines in compact parallel
+        arrays; use a TokenArrayStream to parse a line from it.
+
+        Args:
+            source (str): The text to tokenize, one BASIC line per text line.
+
+        Returns:
+            parser.TokenArray: The tokens of the whole text.
+        """
+        return token_array.TokenArray(source)
+
     def Peek(self):
         """Returns the next token in the stream without advancing the pointer.
 
@@ -118,6 +178,7 @@ class TokenStream:
         """Resets the internal state so that subsequent reads start over."""
         self.offset = 0
         self.peek = None
+        self.index = 0
 
     # The states of the finite-state machine for reading tokens.
     STATE_INIT      = 1
@@ -169,6 +230,51 @@ class TokenStream:
         """Checks whether this character is whitespace."""
         return ch in (' ', '\t', '\n', '\r', '\f')
 
+    def _MakeFloat(self, acc):
+        """Makes a floating-point token from the characters just read.
+
+        Args:
+            acc (str): The characters of the number, which end at the current
+                offset.
+
+        Returns:
+            parser.Token: The token.
+
+        Raises:
+            exception.TokenException if the characters are not a number, such
+            as "." or "1E+".
+        """
+        try:
+            return token.Make(token.TYPE_FLOAT, float(acc))
+        except ValueError:
+            raise exception.TokenException(
+                'Malformed number "%s" at column %d' % (
+                    acc, self.offset - len(acc)))
+
+    def _ReadScannedToken(self):
+        """Returns the next token using the whole-line scanner.
+
+        The entire buffer is scanned the first time this is called.  If the
+        scan fails, the error is raised when the stream reaches the offending
+        token, just as with the state machine.
+
+        Returns:
+            parser.Token: The next token.
+        """
+        if self.tokens is None:
+            self.tokens = []
+            try:
+                self._scanner.Scan(self.buffer, self.tokens)
+            except exception.TokenException as e:
+                self.error = e
+
+        if self.index < len(self.tokens):
+            tok = self.tokens[self.index]
+            if not tok.IsType(token.TYPE_EOF):
+                self.index += 1
+            return tok
+        raise self.error
+
     def _ReadToken(self):
         """Reads the next token from the buffer and returns it.
     
@@ -177,6 +283,9 @@ class TokenStream:
         Returns:
             parser.Token: The next token.
         """
+        if self.engine == self.ENGINE_REGEX:
+            return self._ReadScannedToken()
+
         acc = ''
         state = self.STATE_INIT
         ch = None
@@ -188,7 +297,7 @@ class TokenStream:
       
             # Dispatch based on the current state.
             if state == self.STATE_INIT:
-                if ch == '0':
+                if ch == '\0':
                     state = self.STATE_EOF
                 elif ch == 'R' or ch == 'r':
                     acc += ch
@@ -259,6 +368,7 @@ class TokenStream:
                     state = self.STATE_TIMES
                 elif self._IsWhitespace(ch):
                     self.offset += 1
+                else:
                     state = self.STATE_ERROR
 
             elif state == self.STATE_ID:
@@ -268,13 +378,28 @@ class TokenStream:
                 elif ch == '%':
                     acc += ch
                     self.offset += 1
-                    return token.Token(token.TYPE_ID_INT, acc)
+                    return token.Make(token.TYPE_ID_INT, acc)
                 elif ch == '$':
                     acc += ch
                     self.offset += 1
-                    return token.Token(token.TYPE_ID_STRING, acc)
+                    return token.Make(token.TYPE_ID_STRING, acc)
+                else:
+                    return token.Make(token.TYPE_ID_FLOAT, acc)
+
+            elif state == self.STATE_INT:
+                if self._IsDigit(ch):
+                    acc += ch
+                    self.offset += 1
+                elif ch == '.':
+                    acc += ch
+                    self.offset += 1
+                    state = self.STATE_FLOAT1
+                elif ch == 'E' or ch == 'e':
+                    acc += ch
+                    self.offset += 1
+                    state = self.STATE_FLOAT2
                 else:
-                    return token.Token(token.TYPE_ID_FLOAT, acc)
+                    return token.Make(token.TYPE_INT, int(acc))
 
             elif state == self.STATE_BASE:
                 if ch == 'B' or ch == 'b':
@@ -290,15 +415,19 @@ class TokenStream:
                 if ch == '0' or ch == '1':
                     acc += ch
                     self.offset += 1
+                elif acc:
+                    return token.Make(token.TYPE_INT_BIN, int(acc, 2))
                 else:
-                    return token.Token(token.TYPE_INT_BIN, int(acc, 2))
+                    state = self.STATE_ERROR
 
             elif state == self.STATE_INT_HEX:
                 if self._IsHex(ch):
                     acc += ch
                     self.offset += 1
+                elif acc:
+                    return token.Make(token.TYPE_INT_HEX, int(acc, 16))
                 else:
-                    return token.Token(token.TYPE_INT_HEX, int(acc, 16))
+                    state = self.STATE_ERROR
 
             elif state == self.STATE_FLOAT1:
                 if self._IsDigit(ch):
@@ -309,7 +438,7 @@ class TokenStream:
                     self.offset += 1
                     state = self.STATE_FLOAT2
                 else:
-                    return token.Token(token.TYPE_FLOAT, float(acc))
+                    return self._MakeFloat(acc)
 
             elif state == self.STATE_FLOAT2:
                 if ch == '+' or ch == '-' or self._IsDigit(ch):
@@ -324,7 +453,7 @@ class TokenStream:
                     acc += ch
                     self.offset += 1
                 else:
-                    return token.Token(token.TYPE_FLOAT, float(acc))
+                    return self._MakeFloat(acc)
 
             elif state == self.STATE_REM1:
                 if ch == 'E' or ch == 'e':
@@ -344,7 +473,7 @@ class TokenStream:
 
             elif state == self.STATE_REM3:
                 if ch == '\0':
-                    return token.Token(token.TYPE_COMMENT, acc)
+                    return token.Make(token.TYPE_COMMENT, acc)
                 elif ch == ' ':
                     self.offset += 1
                     state = self.STATE_COMMENT
@@ -354,17 +483,17 @@ class TokenStream:
 
             elif state == self.STATE_COMMENT:
                 if ch == '\0':
-                    return token.Token(token.TYPE_COMMENT, acc)
+                    return token.Make(token.TYPE_COMMENT, acc)
                 else:
                     acc += ch
                     self.offset += 1
 
             elif state == self.STATE_STRING:
                 if ch == '\0':
-                    return token.Token(token.TYPE_STRING, acc)
+                    return token.Make(token.TYPE_STRING, acc)
                 elif ch == '"':
                     self.offset += 1
-                    return token.Token(token.TYPE_STRING, acc)
+                    return token.Make(token.TYPE_STRING, acc)
                 else:
                     acc += ch
                     self.offset += 1
@@ -372,58 +501,58 @@ class TokenStream:
             elif state == self.STATE_GT:
                 if ch == '=':
                     self.offset += 1
-                    return token.Token(token.TYPE_GEQ)
+                    return token.Make(token.TYPE_GEQ)
                 else:
-                    return token.Token(token.TYPE_GT)
+                    return token.Make(token.TYPE_GT)
 
             elif state == self.STATE_LT:
                 if ch == '=':
                     self.offset += 1
-                    return token.Token(token.TYPE_LEQ)
+                    return token.Make(token.TYPE_LEQ)
                 elif ch == '>':
                     self.offset += 1
-                    return token.Token(token.TYPE_NEQUAL)
+                    return token.Make(token.TYPE_NEQUAL)
                 else:
-                    return token.Token(token.TYPE_LT)
+                    return token.Make(token.TYPE_LT)
 
             elif state == self.STATE_COLON:
-                return token.Token(token.TYPE_COLON)
+                return token.Make(token.TYPE_COLON)
 
             elif state == self.STATE_COMMA:
-                return token.Token(token.TYPE_COMMA)
+                return token.Make(token.TYPE_COMMA)
 
             elif state == self.STATE_DIVIDE:
-                return token.Token(token.TYPE_DIVIDE)
+                return token.Make(token.TYPE_DIVIDE)
 
             elif state == self.STATE_EQUAL:
-                return token.Token(token.TYPE_EQUAL)
+                return token.Make(token.TYPE_EQUAL)
 
             elif state == self.STATE_LPAREN:
-                return token.Token(token.TYPE_LPAREN)
+                return token.Make(token.TYPE_LPAREN)
 
             elif state == self.STATE_MINUS:
-                return token.Token(token.TYPE_MINUS)
+                return token.Make(token.TYPE_MINUS)
 
             elif state == self.STATE_PLUS:
-                return token.Token(token.TYPE_PLUS)
+                return token.Make(token.TYPE_PLUS)
 
             elif state == self.STATE_POWER:
-                return token.Token(token.TYPE_POWER)
+                return token.Make(token.TYPE_POWER)
 
             elif state == self.STATE_QUESTION:
-                return token.Token(token.TYPE_KEYWORD, 'PRINT')
+                return token.Make(token.TYPE_KEYWORD, 'PRINT')
 
             elif state == self.STATE_RPAREN:
-                return token.Token(token.TYPE_RPAREN)
+                return token.Make(token.TYPE_RPAREN)
 
             elif state == self.STATE_SEMICOLON:
-                return token.Token(token.TYPE_SEMICOLON)
+                return token.Make(token.TYPE_SEMICOLON)
 
             elif state == self.STATE_TIMES:
-                return token.Token(token.TYPE_TIMES)
+                return token.Make(token.TYPE_TIMES)
 
             elif state == self.STATE_EOF:
-                return token.Token(token.TYPE_EOF)
+                return token.Make(token.TYPE_EOF)
         
             elif state == self.STATE_ERROR:
                 raise exception.TokenException(
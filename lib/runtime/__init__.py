@@ -1,3 +1,9 @@
+from bytecode import Bytecode
+from compiler import Compiler
 from environment import Environment
+from interpreter import Interpreter
+from line_range import LineRange
+from machine import Machine
 from program import Program
 from runtime import Runtime
+from transpiler import Transpiler
@@ -0,0 +1,88 @@
+# The operations of the virtual machine.  Each operation takes a single
+# argument, and works on a stack of plain Python values: int, float or str.
+OP_PUSH       = 1   # push the argument
+OP_LOAD       = 2   # push a variable: (name, value if unassigned, slot)
+OP_STORE      = 3   # pop a value into a variable: (slot, value.Value type)
+OP_EVAL       = 4   # push the value of an expression's closure
+OP_ADD        = 5   # pop b, pop a, push a + b
+OP_SUBTRACT   = 6   # pop b, pop a, push a - b
+OP_MULTIPLY   = 7   # pop b, pop a, push a * b
+OP_DIVIDE     = 8   # pop b, pop a, push a / b
+OP_MOD        = 9   # pop b, pop a, push a MOD b
+OP_POWER      = 10  # pop b, pop a, push a ^ b
+OP_AND        = 11  # pop b, pop a, push a AND b
+OP_OR         = 12  # pop b, pop a, push a OR b
+OP_NEGATE     = 13  # pop a, push -a
+OP_NOT        = 14  # pop a, push NOT a
+OP_COMPARE    = 15  # pop b, pop a, push the comparison: RELATION_TYPE_*
+OP_JUMP       = 16  # go to the argument
+OP_JUMP_FALSE = 17  # pop a number, and go to the argument if it is zero
+OP_JUMP_LINE  = 18  # pop a line number, and go to it
+OP_GOSUB      = 19  # go to the argument, to return to the next operation
+OP_GOSUB_LINE = 20  # pop a line number, and go to it as GOSUB does
+OP_RETURN     = 21  # go back to the operation after the last GOSUB
+OP_FOR        = 22  # pop the step, the end and the first value, store the
+                    # first value in the variable, and start a loop:
+                    #     [name, type, pc of the body,
+                    #      pc to go to if it never runs, slot]
+OP_NEXT       = 23  # step the innermost loop (or the loop on a variable)
+OP_PRINT      = 24  # pop a value and print it; arg is what follows it
+OP_CALL       = 25  # run a statement.Statement: (statement, position)
+OP_RAISE      = 26  # fail with the argument (exception.Error.ERR_*)
+OP_HALT       = 27  # end the program
+OP_ON         = 28  # pop an index, and go to the operation it picks, if any:
+                    #     (pc to return to, or None for GOTO, then the pc for
+                    #      each index from 1, or a closure for its line)
+OP_CLEAR      = 29  # remove every variable, and end the FOR loops (CLEAR)
+OP_WHILE      = 30  # pop a number, and if it is zero, go to the exit of the
+                    # loop; otherwise note the test for WEND to go back to:
+                    #     [pc of the test, pc of the exit]
+OP_WEND       = 31  # go back to the test of the last WHILE noted
+OP_TEST       = 32  # pop b, pop a, and go to the pc unless the comparison of
+                    # a and b holds: (function comparing them, pc)
+
+class Bytecode:
+    """A program compiled to operations for runtime.Machine.
+
+    The operations and their arguments are held in parallel lists, and are
+    addressed by their index (the "pc").  The line table maps each position in
+    the program (a line number, and the index of a statement in the line,
+    followed by the clause and index of a statement inside an IF; see
+    runtime.Runtime) to the pc of the first operation of that statement.
+    """
+
+    def __init__(self):
+        """Initializes an empty program."""
+        self.ops = []
+        self.args = []
+        self.positions = {}  # position->pc
+        self.lines = {}      # line number->pc
+
+    def __len__(self):
+        """Returns the number of operations."""
+        return len(self.ops)
+
+    def Add(self, op, arg=None):
+        """Appends an operation, returning its pc.
+
+        Args:
+            op (int): The operation (OP_*).
+            arg: The argument of the operation.
+        """
+        self.ops.append(op)
+        self.args.append(arg)
+        return len(self.ops) - 1
+
+    def Dump(self):
+        """Returns a human-readable listing of the operations."""
+        names = dict((number, name) for name, number in globals().items()
+                     if name.startswith('OP_'))
+        starts = dict((pc, position) for position, pc in
+                      self.positions.items() if len(position) == 2)
+        lines = []
+        for pc, (op, arg) in enumerate(zip(self.ops, self.args)):
+            if pc in starts:
+                lines.append('%d:%d' % starts[pc])
+            lines.append('%6d  %-14s %s' % (
+                pc, names[op], '' if arg is None else arg))
+        return '\n'.join(lines)
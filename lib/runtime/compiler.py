@@ -0,0 +1,278 @@
+from .. import exception
+from .. import expression
+from .. import statement
+import bytecode
+
+class Compiler:
+    """Compiles programs to operations for runtime.Machine.
+
+    The statements that control the flow of the program, assignments to scalar
+    variables, PRINT, CLEAR (which ends the FOR loops the machine keeps), and
+    the operators of expressions are compiled to operations.  Everything else
+    is compiled to an OP_CALL of the original statement or an OP_EVAL of the
+    closure of the original expression (see expression.Expression.Compile),
+    so that the machine can run any program the interpreter can.  The
+    compiler can also be told to compile every expression to a closure rather
+    than to operations.
+
+    FOR and WHILE loops are paired with their NEXT and WEND as the program is
+    compiled, in the order of the program, which is the same pairing that the
+    interpreter finds by searching forward; that pairing only gives the exit
+    of a loop.  As in the interpreter, NEXT steps the innermost running loop
+    and WEND goes back to the WHILE that ran last, whichever they are.
+    Expressions are simplified with expression.Optimizer first.
+
+    The statements inside an IF are compiled in line, and have positions of
+    their own (see runtime.Runtime), so that a GOSUB inside an IF returns to
+    the statement after it, in the same clause.
+    """
+
+    # The operations for the operators with two operands.
+    BINARY = {
+        expression.EAdd:      bytecode.OP_ADD,
+        expression.EAnd:      bytecode.OP_AND,
+        expression.EDivide:   bytecode.OP_DIVIDE,
+        expression.EMod:      bytecode.OP_MOD,
+        expression.EMultiply: bytecode.OP_MULTIPLY,
+        expression.EOr:       bytecode.OP_OR,
+        expression.EPower:    bytecode.OP_POWER,
+        expression.ESubtract: bytecode.OP_SUBTRACT,
+    }
+
+    # The operations for the operators with one operand.
+    UNARY = {
+        expression.ENegate: bytecode.OP_NEGATE,
+        expression.ENot:    bytecode.OP_NOT,
+    }
+
+    def __init__(self, closures=False):
+        """Initializes the compiler.
+
+        Args:
+            closures (bool): Whether to compile expressions to closures only.
+        """
+        self.closures = closures
+
+    def Compile(self, program):
+        """Compiles a whole program.
+
+        Args:
+            program (runtime.Program): The program.  Its linked statements
+                are compiled (see runtime.Program.Link), since theirs are the
+                variables with slots.
+
+        Returns:
+            runtime.Bytecode: The compiled program.
+        """
+        self.code = bytecode.Bytecode()
+        self.optimizer = expression.Optimizer()
+        self.fixups = []  # (pc, argument slot, position to resolve)
+        self.fors = []    # the open FOR loops: (variable name, pc of OP_FOR)
+        self.whiles = []  # the pcs of the OP_WHILE of the open WHILE loops
+
+        for line_number, statements in zip(program.LineNumbers(),
+                                           program.Link()):
+            self.code.lines[line_number] = len(self.code)
+            self._CompileStatements(statements, (line_number,))
+        self.code.Add(bytecode.OP_HALT)
+
+        # Loops that are never closed fail only if they skip their bodies.
+        for name, pc in self.fors:
+            self.code.args[pc][3] = self.code.Add(
+                bytecode.OP_RAISE, exception.Error.ERR_FOR)
+        for pc in self.whiles:
+            self.code.args[pc][1] = self.code.Add(
+                bytecode.OP_RAISE, exception.Error.ERR_WHILE)
+
+        # Turn positions into pcs, now that all of them are known.
+        for pc, slot, position in self.fixups:
+            target = self.code.positions.get(position)
+            if self.code.ops[pc] == bytecode.OP_RAISE:
+                pass  # another position of the operation is missing
+            elif target is None:
+                self.code.ops[pc] = bytecode.OP_RAISE
+                self.code.args[pc] = exception.Error.ERR_BADLINE
+            elif slot is None:
+                self.code.args[pc] = target
+            else:
+                self.code.args[pc][slot] = target
+        for pc, op in enumerate(self.code.ops):
+            if op in (bytecode.OP_FOR, bytecode.OP_GOSUB, bytecode.OP_ON):
+                self.code.args[pc] = tuple(self.code.args[pc])
+        return self.code
+
+    def _CompileExpression(self, exp):
+        """Compiles an expression that has been through the optimizer."""
+        cls = exp.Generic()
+        if self.closures:
+            self.code.Add(bytecode.OP_EVAL, exp.Compiled())
+        elif cls in self.BINARY:
+            self._CompileExpression(exp.exp_a)
+            self._CompileExpression(exp.exp_b)
+            self.code.Add(self.BINARY[cls])
+        elif cls is expression.ERelational:
+            self._CompileExpression(exp.exp_a)
+            self._CompileExpression(exp.exp_b)
+            self.code.Add(bytecode.OP_COMPARE, exp.relation)
+        elif cls in self.UNARY:
+            self._CompileExpression(exp.exp)
+            self.code.Add(self.UNARY[cls])
+        elif exp.IsConstant():
+            self.code.Add(bytecode.OP_PUSH, exp.value)
+        elif cls is expression.ELValue:
+            self.code.Add(bytecode.OP_LOAD,
+                          (exp.id, exp.DEFAULTS[exp.type].value, exp.slot))
+        else:
+            self.code.Add(bytecode.OP_EVAL, exp.Compiled())
+
+    def _CompileStatement(self, stmt):
+        """Compiles a single statement."""
+        cls = stmt.__class__
+        next = self.position[:-1] + (self.position[-1] + 1,)
+
+        if cls is statement.SAssignment and stmt.var.__class__ is (
+                expression.ELValue):
+            self._CompileValue(stmt.exp)
+            self.code.Add(bytecode.OP_STORE, (stmt.var.slot, stmt.var.type))
+
+        elif cls is statement.SClear:
+            self.code.Add(bytecode.OP_CLEAR)
+
+        elif cls is statement.SComment or cls is statement.SNull:
+            pass
+
+        elif cls is statement.SEnd:
+            self.code.Add(bytecode.OP_HALT)
+
+        elif cls is statement.SGoto or cls is statement.SGosub:
+            exp = self.optimizer.Optimize(stmt.exp)
+            static = exp.IsConstant() and isinstance(exp.value, int)
+            if not static:
+                self._CompileExpression(exp)
+            if cls is statement.SGoto and static:
+                self._Fixup(self.code.Add(bytecode.OP_JUMP), (exp.value, 0))
+            elif cls is statement.SGoto:
+                self.code.Add(bytecode.OP_JUMP_LINE)
+            elif static:
+                pc = self.code.Add(bytecode.OP_GOSUB, [None, None])
+                self._Fixup(pc, (exp.value, 0), 0)
+                self._Fixup(pc, next, 1)
+            else:
+                self._Fixup(self.code.Add(bytecode.OP_GOSUB_LINE), next)
+
+        elif cls is statement.SOnGoto or cls is statement.SOnGosub:
+            self._CompileValue(stmt.exp)
+            pc = self.code.Add(bytecode.OP_ON, [None])
+            if cls is statement.SOnGosub:
+                self._Fixup(pc, next, 0)
+            for exp in stmt.exps:
+                exp = self.optimizer.Optimize(exp)
+                if exp.IsConstant() and isinstance(exp.value, int):
+                    self._Fixup(pc, (exp.value, 0), len(self.code.args[pc]))
+                    self.code.args[pc].append(None)
+                else:
+                    self.code.args[pc].append(exp.Compiled())
+
+        elif cls is statement.SReturn:
+            self.code.Add(bytecode.OP_RETURN)
+
+        elif cls is statement.SIf:
+            position = self.position
+            self._CompileValue(stmt.test_exp)
+            test = len(self.code) - 1
+            if self.code.ops[test] == bytecode.OP_COMPARE:
+                # The comparison jumps itself, rather than pushing a result
+                # for OP_JUMP_FALSE to pop.
+                self.code.ops[test] = bytecode.OP_TEST
+                self.code.args[test] = [expression.ERelational.COMPARISONS[
+                    self.code.args[test]], None]
+            else:
+                test = self.code.Add(bytecode.OP_JUMP_FALSE)
+            self._CompileStatements(stmt.then_case.set,
+                                    position + ('then_case',))
+            if stmt.else_case:
+                done = self.code.Add(bytecode.OP_JUMP)
+                self._JumpHere(test)
+                self._CompileStatements(stmt.else_case.set,
+                                        position + ('else_case',))
+                self.code.args[done] = len(self.code)
+            else:
+                self._JumpHere(test)
+
+        elif cls is statement.SFor and stmt.var.__class__ is (
+                expression.ELValue):
+            self._CompileValue(stmt.exp_start)
+            self._CompileValue(stmt.exp_end)
+            if stmt.exp_step:
+                self._CompileValue(stmt.exp_step)
+            else:
+                self.code.Add(bytecode.OP_PUSH, 1.0)
+            pc = self.code.Add(bytecode.OP_FOR,
+                               [stmt.var.id, stmt.var.type, None, None,
+                                stmt.var.slot])
+            self._Fixup(pc, next, 2)
+            self.fors.append((stmt.var.id, pc))
+
+        elif cls is statement.SNext:
+            name = stmt.var.id if stmt.var else None
+            while self.fors:
+                for_name, pc = self.fors.pop()
+                self._Fixup(pc, next, 3)
+                if name is None or for_name == name:
+                    break
+            self.code.Add(bytecode.OP_NEXT, name)
+
+        elif cls is statement.SWhile:
+            test = len(self.code)
+            self._CompileValue(stmt.exp)
+            self.whiles.append(self.code.Add(bytecode.OP_WHILE, [test, None]))
+
+        elif cls is statement.SWend:
+            if self.whiles:
+                self._Fixup(self.whiles.pop(), next, 1)
+            self.code.Add(bytecode.OP_WEND)
+
+        elif cls is statement.SPrint:
+            for item in stmt.items:
+                self._CompileValue(item.exp)
+                self.code.Add(bytecode.OP_PRINT, item.type)
+            if not stmt.items:
+                self.code.Add(bytecode.OP_PUSH, '')
+                self.code.Add(bytecode.OP_PRINT, statement.SPrint.FINAL)
+
+        else:
+            self.code.Add(bytecode.OP_CALL, (stmt, self.position))
+
+    def _CompileStatements(self, statements, prefix):
+        """Compiles the statements of a line or of a clause of an IF.
+
+        The pc of each statement is recorded under its position (see
+        runtime.Runtime), and so is the pc after the last one: for a line,
+        that is the start of the next line, and for a clause, that is where
+        the program goes on after the IF.
+
+        Args:
+            statements (list of statement.Statement): The statements.
+            prefix (tuple): The position of the statements, without their
+                index.
+        """
+        for index, stmt in enumerate(statements):
+            self.position = prefix + (index,)
+            self.code.positions[self.position] = len(self.code)
+            self._CompileStatement(stmt)
+        self.code.positions[prefix + (len(statements),)] = len(self.code)
+
+    def _CompileValue(self, exp):
+        """Optimizes and compiles an expression."""
+        self._CompileExpression(self.optimizer.Optimize(exp))
+
+    def _Fixup(self, pc, position, slot=None):
+        """Notes an argument (or a slot of one) to be set to a position's pc."""
+        self.fixups.append((pc, slot, position))
+
+    def _JumpHere(self, pc):
+        """Points the jump of an IF at the next operation to be compiled."""
+        if self.code.ops[pc] == bytecode.OP_TEST:
+            self.code.args[pc] = (self.code.args[pc][0], len(self.code))
+        else:
+            self.code.args[pc] = len(self.code)
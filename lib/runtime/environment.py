@@ -1,14 +1,68 @@
 import math
 
+from .. import exception
+from .. import expression
 from .. import system
 from .. import value
 
+# The built-in variables, by name, and functions returning their values.  A
+# program can assign to them like any other variable, which hides them until
+# the next CLEAR or RUN.
+_BUILTINS = {
+    'pi':      lambda: _PI,
+    'folder$': lambda: value.VString(system.State.folder),
+}
+
+_PI = value.VFloat(math.pi)
+
+
+def _Find(values, slots, id):
+    """Returns the value of a name in a list of values by slot, or None.
+
+    Args:
+        values (list): The values, by slot.
+        slots (expression.SlotTable): The slots of the names.
+        id (str): The name.
+    """
+    slot = slots.Find(id)
+    if slot is not None and slot < len(values):
+        return values[slot]
+    return None
+
+
+def _Store(values, slots, id, val):
+    """Stores the value of a name in a list of values by slot.
+
+    Args:
+        values (list): The values, by slot, which is extended if need be.
+        slots (expression.SlotTable): The slots of the names.
+        id (str): The name.
+        val: The value.
+    """
+    slot = slots.Slot(id)
+    if slot >= len(values):
+        values.extend([None] * (len(slots) - len(values)))
+    values[slot] = val
+
+
 class Environment:
     """Implements a data environment for the interpreter.
     
     Since BASIC has a primitive data model, this is basically just a collection
-    of dictionaries from variable name to Value object: one for scalar
-    variables, one for arrays, and one for FN functions.
+    of variables by name: scalar variables, arrays, and FN functions.  Each
+    kind of variable is kept in a list indexed by the slot of its name (see
+    expression.SlotTable), with None for variables that are not set, so that
+    expressions can find their variables by slot.  The methods here find them
+    by name, and are what direct mode and everything else use.
+
+    The lists need not cover every slot: a variable beyond the end of a list
+    is simply not set, and the list is extended when it is.  This is what lets
+    Clear throw every variable away at once.  The built-in variables are not
+    kept in the lists at all, but looked up when a variable is not set.
+
+    The slot tables are those of the program the environment runs (see
+    UseSlots), or tables of its own until it is given one.  An environment
+    with a parent shares the tables of its parent.
     """
 
     def __init__(self, parent=None):
@@ -18,13 +72,33 @@ class Environment:
             parent (Environment): Parent environment, if any.
         """
         self.parent = parent
-        self.scalars = {}     # ID->value for scalar variables
-        self.arrays = {}      # ID->value for arrays
-        self.functions = {}   # ID->value for functions
+        self.scalars = []     # slot->value for scalar variables
+        self.arrays = []      # slot->value for arrays
+        self.functions = []   # slot->value for functions
+        if parent:
+            self.UseSlots(parent)
+        else:
+            self.scalar_slots = expression.SlotTable()
+            self.array_slots = expression.SlotTable()
+            self.function_slots = expression.SlotTable()
+        self.Reserve()
 
-        # Add the build-in variables.
-        self.Set("pi", value.VFloat(math.pi))
-        self.Set("folder$", system.State.folder)
+    def Clear(self):
+        """Removes every variable, array and function, as for CLEAR and RUN.
+
+        The lists of values are replaced by empty ones rather than emptied, so
+        this takes the same time however many variables there were and however
+        large the arrays.  Refilling the lists is deferred, not avoided: they
+        grow back as variables are stored, or all at once by Reserve, in time
+        proportional to the number of names in the slot tables.  Those belong
+        to the program (see runtime.Program), so the cost is bounded by the
+        names it uses, not by what was thrown away.  Whatever still holds the
+        old lists (such as a runtime.Machine in the middle of a run) must
+        fetch them again.
+        """
+        self.scalars = []
+        self.arrays = []
+        self.functions = []
 
     def Get(self, id):
         """Returns the value of this scalar variable, or None.
@@ -35,10 +109,14 @@ class Environment:
         Returns:
             value.Value: The value of the variable.
         """
-        if id in self.scalars:
-            return self.scalars[id]
+        val = _Find(self.scalars, self.scalar_slots, id)
+        if val is not None:
+            return val
         elif self.parent:
             return self.parent.Get(id)
+        builtin = _BUILTINS.get(id)
+        if builtin is not None:
+            return builtin()
         return None
         
     def GetArray(self, id, indices):
@@ -52,14 +130,15 @@ class Environment:
             value.Value: The value at this location.
             
         Raises:
-            runtime.EvalException if the array is undefined or the indices are
-            invalid.
+            exception.EvalException if the array is undefined or the indices
+            are invalid.
         """
-        if id in self.arrays:
-            return self.arrays[id].Get(indices)
+        array = _Find(self.arrays, self.array_slots, id)
+        if array is not None:
+            return array.Get(indices)
         elif self.parent:
             return self.parent.GetArray(id, indices)
-        raise runtime.EvalException(runtime.Error.ERR_BADVAR)
+        raise exception.EvalException(exception.Error.ERR_BADVAR)
 
     def GetFunction(self, id):
         """Returns the value of the given FN function, or None.
@@ -70,8 +149,9 @@ class Environment:
         Returns:
             value.VFunction: The function with this name.
         """
-        if id in self.functions:
-            return self.functions[id]
+        function = _Find(self.functions, self.function_slots, id)
+        if function is not None:
+            return function
         elif self.parent:
             return self.parent.GetFunction(id)
         return None
@@ -91,8 +171,20 @@ class Environment:
             lvalue (expression.LValue): The variable to create
             dims (list of int): The dimensions of the array.
         """
-        self.arrays[lvalue.id] = value.ArrayValue(lvalue.type, dims)
-        
+        _Store(self.arrays, self.array_slots, lvalue.id,
+               value.ArrayValue(lvalue.type, dims))
+
+    def Reserve(self):
+        """Makes room for every variable that has a slot so far.
+
+        Once this is done, every variable named so far can be stored by its
+        slot directly.
+        """
+        for values, slots in ((self.scalars, self.scalar_slots),
+                              (self.arrays, self.array_slots),
+                              (self.functions, self.function_slots)):
+            values.extend([None] * (len(slots) - len(values)))
+
     def Set(self, id, value):
         """Sets the value of the given scalar variable as specified.
 
@@ -103,7 +195,7 @@ class Environment:
             id (str): The name of the variable.
             value (value.Value): The new value for the variable.
         """
-        self.scalars[id] = value
+        _Store(self.scalars, self.scalar_slots, id, value)
 
     def SetArray(self, id, indices, value):
         """Sets the given location in this array as specified.
@@ -117,12 +209,16 @@ class Environment:
             value (value.Value): The value to store.
             
         Raises:
-            runtime.EvalException if the array does not exist or the indices are
-            invalid.
+            exception.EvalException if the array does not exist or the indices
+            are invalid.
         """
-        if id in self.arrays:
-            self.arrays[id].Set(indices, value)
-        raise runtime.EvalException(runtime.Error.ERR_BADVAR)
+        array = _Find(self.arrays, self.array_slots, id)
+        if array is not None:
+            array.Set(indices, value)
+        elif self.parent:
+            self.parent.SetArray(id, indices, value)
+        else:
+            raise exception.EvalException(exception.Error.ERR_BADVAR)
 
     def SetFunction(self, id, value):
         """Sets an FN function to the given function value.
@@ -134,4 +230,18 @@ class Environment:
             id (str): The name of the function.
             value (value.VFunction): The function value.
         """
-        self.functions[id] = value
+        _Store(self.functions, self.function_slots, id, value)
+
+    def UseSlots(self, owner):
+        """Makes the environment find its variables by the slot tables of a
+        program, or of another environment.
+
+        This must be done before anything is stored in the environment, since
+        the values already stored are not moved to their new slots.
+
+        Args:
+            owner (runtime.Program or Environment): What has the tables.
+        """
+        self.scalar_slots = owner.scalar_slots
+        self.array_slots = owner.array_slots
+        self.function_slots = owner.function_slots
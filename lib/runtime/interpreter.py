@@ -0,0 +1,64 @@
+from .. import exception
+
+class Interpreter:
+    """Runs programs by walking the trees built by the parser.
+
+    This is the reference engine: each statement runs its own Evaluate method,
+    which evaluates its expressions in turn.  It is the simplest engine, and
+    the one the others must agree with.  What it runs are the statements of
+    the linked program (see runtime.Program.Link), whose jumps to constant
+    lines are resolved already.
+    """
+
+    def Run(self, rt, line_number=None):
+        """Runs the program, until it ends or runs off the end.
+
+        Args:
+            rt (runtime.Runtime): The runtime holding the program.
+            line_number (int): The line to start at, or None for the first.
+
+        Raises:
+            exception.EvalException if the program fails.
+        """
+        linked = rt.program.Link()
+        numbers = rt.program.LineNumbers()
+        positions = rt.program.Positions()
+        i = 0
+        index = 0
+        nesting = ()
+        if line_number is not None:
+            rt.Goto(line_number)
+
+        while True:
+            # Go wherever the last statement said to.
+            if rt.jump is not None:
+                line_number, index = rt.jump[:2]
+                nesting = rt.jump[2:]
+                rt.jump = None
+                i = positions.get(line_number)
+                if i is None:
+                    raise exception.EvalException(exception.Error.ERR_BADLINE)
+            if rt.stopped or i == len(numbers):
+                break
+
+            # Run the statements of the line, until one transfers control.
+            rt.line_number = numbers[i]
+            statements = linked[i]
+            if nesting:
+                # Go back inside an IF, as RETURN does to a GOSUB in one.
+                rt.index = index
+                statements[index].Resume(rt, nesting)
+                nesting = ()
+                if rt.jump is not None or rt.stopped:
+                    continue
+                index += 1
+            while index < len(statements):
+                rt.index = index
+                statements[index].Evaluate(rt)
+                if rt.jump is not None or rt.stopped:
+                    break
+                index += 1
+            else:
+                i += 1
+                index = 0
+        rt.line_number = None
@@ -0,0 +1,25 @@
+import sys
+
+class LineRange(object):
+    """A range of line numbers, as given to LIST and DELETE."""
+
+    def __init__(self, start, end):
+        """Initializes the range.
+
+        Args:
+            start (int): The first line number in the range.
+            end (int): The last line number in the range (sys.maxint if the
+                range is open-ended).
+        """
+        self.start = start
+        self.end = end
+
+    def __str__(self):
+        if self.start == self.end:
+            return str(self.start)
+        text = str(self.start) if self.start else ''
+        if self.start or self.end != sys.maxint:
+            text += '-'
+        if self.end != sys.maxint:
+            text += str(self.end)
+        return text
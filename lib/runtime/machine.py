@@ -0,0 +1,336 @@
+from .. import exception
+from .. import expression
+from .. import statement
+from .. import value
+import bytecode
+import compiler
+
+class Machine:
+    """Runs programs compiled to operations by runtime.Compiler.
+
+    The machine is a single dispatch loop over a flat list of operations,
+    working on a stack of plain Python values rather than value.Value objects.
+    Values are only boxed when they are stored in a variable, so that the
+    variables in the runtime environment look the same as with the
+    interpreter, and statements that are not compiled can run as they are.
+    Variables are found in the environment by their slots.
+    """
+
+    def __init__(self, closures=False):
+        """Initializes the machine.
+
+        Args:
+            closures (bool): Whether expressions are run as closures, rather
+                than compiled to operations; see runtime.Compiler.
+        """
+        self.compiler = compiler.Compiler(closures)
+
+    def Run(self, rt, line_number=None):
+        """Compiles and runs the program, until it ends or runs off the end.
+
+        Args:
+            rt (runtime.Runtime): The runtime holding the program.
+            line_number (int): The line to start at, or None for the first.
+
+        Raises:
+            exception.EvalException if the program fails.
+        """
+        rt.program.Link()
+        code = self.compiler.Compile(rt.program)
+        pc = 0
+        if line_number is not None:
+            pc = code.lines.get(line_number)
+            if pc is None:
+                raise exception.EvalException(exception.Error.ERR_BADLINE)
+        try:
+            self._Execute(rt, code, pc)
+        finally:
+            rt.line_number = None
+
+    def _Box(self, val, type):
+        """Converts a plain value into a value.Value of the given type."""
+        if type == value.Value.STRING:
+            if isinstance(val, str):
+                return value.VString(val)
+        elif not isinstance(val, str):
+            if type == value.Value.INT:
+                return value.VInt(expression.ToInt(val))
+            return value.VFloat(float(val))
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+
+    def _Execute(self, rt, code, pc):
+        """The dispatch loop."""
+        ops = code.ops
+        args = code.args
+        env = rt.env
+        env.Reserve()
+        scalars = env.scalars
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        gosubs = []  # the pcs to return to
+        whiles = []  # the pcs of the tests of the running WHILE loops
+        loops = []   # (name, type, end, step, pc of the body, slot), innermost
+                     # last
+
+        ERR_TYPE = exception.Error.ERR_TYPE
+        EvalException = exception.EvalException
+        FLOAT = value.Value.FLOAT
+        Mod = expression.Mod
+        RequireNumber = expression.RequireNumber
+        ToInt = expression.ToInt
+        VFloat = value.VFloat
+
+        # Local names are faster to look up than the ones in bytecode.
+        OP_ADD = bytecode.OP_ADD
+        OP_AND = bytecode.OP_AND
+        OP_CALL = bytecode.OP_CALL
+        OP_CLEAR = bytecode.OP_CLEAR
+        OP_COMPARE = bytecode.OP_COMPARE
+        OP_DIVIDE = bytecode.OP_DIVIDE
+        OP_EVAL = bytecode.OP_EVAL
+        OP_FOR = bytecode.OP_FOR
+        OP_GOSUB = bytecode.OP_GOSUB
+        OP_GOSUB_LINE = bytecode.OP_GOSUB_LINE
+        OP_JUMP = bytecode.OP_JUMP
+        OP_JUMP_FALSE = bytecode.OP_JUMP_FALSE
+        OP_JUMP_LINE = bytecode.OP_JUMP_LINE
+        OP_LOAD = bytecode.OP_LOAD
+        OP_MOD = bytecode.OP_MOD
+        OP_MULTIPLY = bytecode.OP_MULTIPLY
+        OP_NEGATE = bytecode.OP_NEGATE
+        OP_NEXT = bytecode.OP_NEXT
+        OP_NOT = bytecode.OP_NOT
+        OP_ON = bytecode.OP_ON
+        OP_OR = bytecode.OP_OR
+        OP_POWER = bytecode.OP_POWER
+        OP_PRINT = bytecode.OP_PRINT
+        OP_PUSH = bytecode.OP_PUSH
+        OP_RAISE = bytecode.OP_RAISE
+        OP_RETURN = bytecode.OP_RETURN
+        OP_STORE = bytecode.OP_STORE
+        OP_SUBTRACT = bytecode.OP_SUBTRACT
+        OP_TEST = bytecode.OP_TEST
+        OP_WEND = bytecode.OP_WEND
+        OP_WHILE = bytecode.OP_WHILE
+
+        # The operations are tested for roughly in order of how often they
+        # run, since each test that fails costs as much as a cheap operation.
+        while True:
+            op = ops[pc]
+            arg = args[pc]
+            pc += 1
+
+            if op == OP_LOAD:
+                val = scalars[arg[2]]
+                if val is None:
+                    val = env.Get(arg[0])  # the default, or a parent's
+                push(arg[1] if val is None else val.value)
+            elif op == OP_PUSH:
+                push(arg)
+            elif op == OP_STORE:
+                val = pop()
+                type = arg[1]
+                if type == FLOAT and not isinstance(val, str):
+                    scalars[arg[0]] = VFloat(float(val))
+                else:
+                    scalars[arg[0]] = self._Box(val, type)
+            elif op == OP_ADD:
+                b = pop()
+                a = pop()
+                if isinstance(a, str) != isinstance(b, str):
+                    raise EvalException(ERR_TYPE)
+                push(a + b)
+            elif op == OP_MULTIPLY:
+                b = pop()
+                a = pop()
+                if isinstance(a, str) or isinstance(b, str):
+                    raise EvalException(ERR_TYPE)
+                push(a * b)
+            elif op == OP_COMPARE:
+                b = pop()
+                a = pop()
+                if isinstance(a, str) != isinstance(b, str):
+                    raise EvalException(ERR_TYPE)
+                if arg == expression.RELATION_TYPE_EQ:
+                    push(-1 if a == b else 0)
+                elif arg == expression.RELATION_TYPE_NEQ:
+                    push(-1 if a != b else 0)
+                elif arg == expression.RELATION_TYPE_LT:
+                    push(-1 if a < b else 0)
+                elif arg == expression.RELATION_TYPE_LEQ:
+                    push(-1 if a <= b else 0)
+                elif arg == expression.RELATION_TYPE_GT:
+                    push(-1 if a > b else 0)
+                else:
+                    push(-1 if a >= b else 0)
+            elif op == OP_TEST:
+                b = pop()
+                a = pop()
+                if isinstance(a, str) != isinstance(b, str):
+                    raise EvalException(ERR_TYPE)
+                if not arg[0](a, b):
+                    pc = arg[1]
+            elif op == OP_JUMP_FALSE:
+                a = pop()
+                if isinstance(a, str):
+                    raise EvalException(ERR_TYPE)
+                if a == 0:
+                    pc = arg
+            elif op == OP_NEXT:
+                while loops:
+                    name, type, end, step, body, slot = loops[-1]
+                    if arg is None or name == arg:
+                        break
+                    loops.pop()
+                else:
+                    raise exception.EvalException(exception.Error.ERR_NEXT)
+                val = scalars[slot]
+                if val is None:
+                    val = env.Get(name) or expression.ELValue.DEFAULTS[type]
+                count = float(val.value) + step
+                if type == FLOAT:
+                    scalars[slot] = VFloat(count)
+                else:
+                    scalars[slot] = self._Box(count, type)
+                if (step >= 0 and count <= end) or (step < 0 and count >= end):
+                    pc = body
+                else:
+                    loops.pop()
+            elif op == OP_MOD:
+                b = pop()
+                a = pop()
+                push(Mod(a, b))
+            elif op == OP_SUBTRACT:
+                b = RequireNumber(pop())
+                push(RequireNumber(pop()) - b)
+            elif op == OP_JUMP:
+                pc = arg
+            elif op == OP_EVAL:
+                push(arg(rt).value)
+            elif op == OP_GOSUB:
+                gosubs.append(arg[1])
+                pc = arg[0]
+            elif op == OP_RETURN:
+                if not gosubs:
+                    raise exception.EvalException(exception.Error.ERR_RETURN)
+                pc = gosubs.pop()
+            elif op == OP_CALL:
+                stmt, position = arg
+                rt.line_number, rt.index = position[:2]
+                rt.nesting = list(position[2:])
+                stmt.Evaluate(rt)
+                env = rt.env
+                env.Reserve()
+                scalars = env.scalars
+                if rt.stopped:
+                    return
+                if rt.jump is not None:
+                    pc = code.positions.get(rt.jump)
+                    rt.jump = None
+                    if pc is None:
+                        raise exception.EvalException(
+                            exception.Error.ERR_BADLINE)
+            elif op == OP_WHILE:
+                a = pop()
+                if isinstance(a, str):
+                    raise EvalException(ERR_TYPE)
+                if a == 0:
+                    pc = arg[1]
+                else:
+                    whiles.append(arg[0])
+            elif op == OP_WEND:
+                if not whiles:
+                    raise exception.EvalException(exception.Error.ERR_WEND)
+                pc = whiles.pop()
+            elif op == OP_FOR:
+                name, type, body, exit, slot = arg
+                step = pop()
+                end = pop()
+                start = pop()
+                if (isinstance(start, str) or isinstance(step, str) or
+                    isinstance(end, str)):
+                    raise EvalException(ERR_TYPE)
+                step = float(step)
+                end = float(end)
+                scalars[slot] = self._Box(start, type)
+                loops = [loop for loop in loops if loop[0] != name]
+                start = scalars[slot].value
+                if (step >= 0 and start <= end) or (step < 0 and start >= end):
+                    loops.append((name, type, end, step, body, slot))
+                    pc = body
+                else:
+                    pc = exit
+            elif op == OP_DIVIDE:
+                b = pop()
+                a = pop()
+                if isinstance(a, str) or isinstance(b, str):
+                    raise EvalException(ERR_TYPE)
+                if b == 0:
+                    raise EvalException(exception.Error.ERR_DIVZERO)
+                push(float(a) / b)
+            elif op == OP_POWER:
+                b = pop()
+                a = pop()
+                if isinstance(a, str) or isinstance(b, str):
+                    raise EvalException(ERR_TYPE)
+                if isinstance(a, int) and isinstance(b, int) and b >= 0:
+                    push(a ** b)
+                else:
+                    try:
+                        push(float(a) ** float(b))
+                    except (OverflowError, ValueError, ZeroDivisionError):
+                        raise exception.EvalException(
+                            exception.Error.ERR_RANGE)
+            elif op == OP_NEGATE:
+                push(-RequireNumber(pop()))
+            elif op == OP_AND:
+                b = pop()
+                a = pop()
+                push(ToInt(a) & ToInt(b))
+            elif op == OP_OR:
+                b = pop()
+                a = pop()
+                push(ToInt(a) | ToInt(b))
+            elif op == OP_NOT:
+                a = pop()
+                push(~ToInt(a))
+            elif op == OP_PRINT:
+                statement.SPrint.PrintValue(pop(), arg)
+            elif op == OP_ON:
+                index = pop()
+                if isinstance(index, str):
+                    raise EvalException(ERR_TYPE)
+                index = int(index)
+                if not 0 <= index <= 255:
+                    raise exception.EvalException(exception.Error.ERR_RANGE)
+                if 0 < index < len(arg):
+                    target = arg[index]
+                    if not isinstance(target, int):
+                        target = code.lines.get(int(expression.RequireNumber(
+                            target(rt).value)))
+                        if target is None:
+                            raise exception.EvalException(
+                                exception.Error.ERR_BADLINE)
+                    if arg[0] is not None:
+                        gosubs.append(arg[0])
+                    pc = target
+            elif op == OP_JUMP_LINE or op == OP_GOSUB_LINE:
+                line_number = pop()
+                if isinstance(line_number, str):
+                    raise EvalException(ERR_TYPE)
+                target = code.lines.get(int(line_number))
+                if target is None:
+                    raise exception.EvalException(exception.Error.ERR_BADLINE)
+                if op == OP_GOSUB_LINE:
+                    gosubs.append(arg)
+                pc = target
+            elif op == OP_RAISE:
+                raise exception.EvalException(arg)
+            elif op == OP_CLEAR:
+                env.Clear()
+                env.Reserve()
+                scalars = env.scalars
+                loops = []
+            else:
+                return
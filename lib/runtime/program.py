@@ -1,5 +1,282 @@
+import bisect
+import copy
+import hashlib
+
+from .. import exception
+from .. import expression
+from .. import statement
+
 class Program:
-    """Data type encapsulating an executable BASIC program."""
+    """Data type encapsulating an executable BASIC program.
+
+    The lines are indexed two ways: by line number, in a dict, so that a line
+    can be found (as by GOTO) in constant time; and as a list of the line
+    numbers kept in order with bisect, for stepping from one line to the next
+    and for the ranges of LIST and DELETE.  The position of each line number
+    in the list is also kept in a dict, which is rebuilt on first use after
+    lines are added or removed.
+
+    Before the program runs, it is linked (see Link): the expressions are
+    simplified by expression.Optimizer, which also gives the variables their
+    slots in the tables of the program, the jumps to constant line numbers are
+    checked and resolved once, each FOR and WHILE is paired with the NEXT or
+    WEND that closes it, and the result is kept until the program is next
+    changed.  The lines themselves are left as they were read, for LIST.
+
+    The slot tables belong to the program, and are shared with the
+    environment it runs in (see runtime.Runtime), so they only ever hold the
+    names the program and that environment have used.
+    """
 
     def __init__(self):
-        pass
+        self.lines = {}         # line number->statement.StatementSet
+        self.numbers = []       # the line numbers, in order
+        self.positions = None   # line number->index in numbers, if up to date
+        self.linked = None      # the linked statements, by index, if up to date
+        self.hash = None        # the hash of the listing, if up to date
+
+        # The slots of the names of each kind of variable.
+        self.scalar_slots = expression.SlotTable()
+        self.array_slots = expression.SlotTable()
+        self.function_slots = expression.SlotTable()
+
+    def Add(self, line_number, statement_set):
+        """Adds a line to the program, replacing any line with that number.
+
+        Args:
+            line_number (int): The line number.
+            statement_set (statement.StatementSet): The statements of the line.
+        """
+        if line_number not in self.lines:
+            bisect.insort(self.numbers, line_number)
+            self.positions = None
+        self.lines[line_number] = statement_set
+        self.linked = None
+        self.hash = None
+
+    def AddAll(self, lines):
+        """Adds many lines to the program at once, as for LOAD.
+
+        The new line numbers are put in order with a single sort, which takes
+        linear time when they come in order, as they do from a saved program.
+
+        Args:
+            lines (iterable of (int, statement.StatementSet)): The line numbers
+                and statements of the lines.
+        """
+        added = []
+        for line_number, statement_set in lines:
+            if line_number not in self.lines:
+                added.append(line_number)
+            self.lines[line_number] = statement_set
+        if added:
+            self.numbers.extend(added)
+            self.numbers.sort()
+            self.positions = None
+        self.linked = None
+        self.hash = None
+
+    def Delete(self, line_range):
+        """Removes the lines in a range from the program, as for DELETE.
+
+        Args:
+            line_range (runtime.LineRange): The line numbers to remove.
+        """
+        start, end = self._Slice(line_range)
+        for line_number in self.numbers[start:end]:
+            del self.lines[line_number]
+        del self.numbers[start:end]
+        self.positions = None
+        self.linked = None
+        self.hash = None
+
+    def Hash(self):
+        """Returns a hash of the listing of the program.
+
+        The hash is kept until the program is next changed, as the linked
+        statements are, so that running the program again does not list it.
+        """
+        if self.hash is None:
+            digest = hashlib.sha1()
+            for line_number in self.numbers:
+                digest.update('%d %s\n' % (line_number,
+                                            self.lines[line_number]))
+            self.hash = digest.hexdigest()
+        return self.hash
+
+    def LineNumbers(self):
+        """Returns the line numbers of the program, in order.
+
+        This is the list kept by the program itself, which must not be changed.
+        """
+        return self.numbers
+
+    def Link(self):
+        """Returns the statements of the program, linked, ready to be run.
+
+        Every statement is simplified (see statement.Statement.Optimize), and
+        given the chance to resolve its jumps to constant line numbers (see
+        statement.Statement.Link), so that a jump to a line that is not in the
+        program is reported before the program starts.  Then the loops are
+        paired with the statements that close them (see _Pair).
+
+        Returns:
+            list of list of statement.Statement: The statements of each line,
+            in the order of LineNumbers().
+
+        Raises:
+            exception.EvalException if a statement goes to a line that is not
+            in the program.
+        """
+        if self.linked is None:
+            optimizer = expression.Optimizer(self)
+            linked = [self.lines[line_number].Optimize(optimizer).Link(self).set
+                      for line_number in self.numbers]
+            self._Pair(linked, statement.SFor, statement.SNext)
+            self._Pair(linked, statement.SWhile, statement.SWend)
+            self.linked = linked
+        return self.linked
+
+    def Position(self, line_number):
+        """Returns the index of a line in LineNumbers(), or None if it is not
+        in the program.
+
+        Args:
+            line_number (int): The line number.
+        """
+        return self.Positions().get(line_number)
+
+    def Positions(self):
+        """Returns the index of each line in LineNumbers(), by line number.
+
+        This is the dict kept by the program itself, which must not be changed.
+        """
+        if self.positions is None:
+            self.positions = dict(
+                (number, i) for i, number in enumerate(self.numbers))
+        return self.positions
+
+    def Range(self, line_range):
+        """Returns the lines in a range, in order, as for LIST.
+
+        Args:
+            line_range (runtime.LineRange): The line numbers wanted.
+
+        Returns:
+            list of (int, statement.StatementSet): The line numbers and
+            statements of the lines.
+        """
+        start, end = self._Slice(line_range)
+        return [(line_number, self.lines[line_number])
+                for line_number in self.numbers[start:end]]
+
+    def Target(self, exp):
+        """Checks the line number a statement jumps to, if it is constant.
+
+        Args:
+            exp (expression.Expression): The line number.
+
+        Returns:
+            int: The line number, or None if it is not constant.
+
+        Raises:
+            exception.EvalException if the line is not in the program.
+        """
+        if not exp.IsConstant() or not isinstance(exp.value, (int, long)):
+            return None
+        if exp.value not in self.lines:
+            raise exception.EvalException(exception.Error.ERR_BADLINE)
+        return exp.value
+
+    @staticmethod
+    def Walk(statements, prefix):
+        """Yields the statements of a line or a clause of an IF, with those
+        inside them, in the order they run.
+
+        Args:
+            statements (list of statement.Statement): The statements.
+            prefix (tuple): Their position (see runtime.Runtime), without their
+                index.
+
+        Yields:
+            (tuple, statement.Statement): The position of each statement, and
+            the statement.
+        """
+        for index, stmt in enumerate(statements):
+            position = prefix + (index,)
+            yield position, stmt
+            if isinstance(stmt, statement.SIf):
+                for clause in ('then_case', 'else_case'):
+                    case = getattr(stmt, clause)
+                    if case:
+                        for found in Program.Walk(case.set,
+                                                  position + (clause,)):
+                            yield found
+
+    def _Pair(self, linked, opening, closing):
+        """Pairs the loops of a linked program with the statements closing them.
+
+        Each loop is paired with the statement that runtime.Runtime.Skip would
+        find for it, scanning forward through the statements inside IF
+        statements too (each closing statement closes the innermost loop still
+        open), and is replaced by a copy whose exit is the position after that
+        statement, so that skipping the loop is a single jump.  Loops that are
+        never closed are left alone, and fail when they are skipped, as
+        before.
+
+        Args:
+            linked (list of list of statement.Statement): The statements of
+                each line, which are changed in place (the lists of the lines
+                themselves are copied before they are changed).
+            opening (class): The class of statement opening a loop.
+            closing (class): The class of statement closing it.
+        """
+        loops = []  # the line index and position of the loops still open
+        exits = {}  # line index->{position of a loop: position of its exit}
+        for i, statements in enumerate(linked):
+            for position, stmt in self.Walk(statements, (self.numbers[i],)):
+                if isinstance(stmt, opening):
+                    loops.append((i, position))
+                elif isinstance(stmt, closing) and loops:
+                    j, loop = loops.pop()
+                    exits.setdefault(j, {})[loop] = (
+                        position[:-1] + (position[-1] + 1,))
+
+        for i, line_exits in exits.iteritems():
+            linked[i] = self._Exits(linked[i], (self.numbers[i],), line_exits)
+
+    def _Exits(self, statements, prefix, exits):
+        """Gives loops their exits, in a line or a clause of an IF.
+
+        Args:
+            statements (list of statement.Statement): The statements.
+            prefix (tuple): Their position, without their index.
+            exits (dict): The position of each loop->the position of its exit.
+
+        Returns:
+            list of statement.Statement: The statements, with the loops among
+            them, and the IF statements holding loops, replaced by copies.
+        """
+        statements = list(statements)
+        for index, stmt in enumerate(statements):
+            position = prefix + (index,)
+            if position in exits:
+                stmt = statements[index] = copy.copy(stmt)
+                stmt.exit = exits[position]
+            elif isinstance(stmt, statement.SIf):
+                clauses = [clause for clause in ('then_case', 'else_case')
+                           if any(loop[:len(position) + 1] ==
+                                  position + (clause,) for loop in exits)]
+                if clauses:
+                    stmt = statements[index] = copy.copy(stmt)
+                for clause in clauses:
+                    case = copy.copy(getattr(stmt, clause))
+                    case.set = self._Exits(case.set, position + (clause,),
+                                           exits)
+                    setattr(stmt, clause, case)
+        return statements
+
+    def _Slice(self, line_range):
+        """Returns the start and end in LineNumbers() of a range of lines."""
+        return (bisect.bisect_left(self.numbers, line_range.start),
+                bisect.bisect_right(self.numbers, line_range.end))
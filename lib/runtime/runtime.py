@@ -1,6 +1,107 @@
+from .. import exception
+import interpreter
+
 class Runtime:
     """Encapsulates the runtime state of execution itself, excluding I/O."""
 
     def __init__(self, program, env):
         self.program = program
         self.env = env
+        if program is not None:
+            env.UseSlots(program)  # see Program
+        self.engine = interpreter.Interpreter()  # what RUN runs programs with
+        self.files = None  # what LOAD and SAVE read and write programs with
+
+        # The state of the running program.  A position in the program is a
+        # line number and the index of a statement within that line, followed,
+        # for a statement inside an IF, by the clause ('then_case' or
+        # 'else_case') and the index of the statement within it, for each IF
+        # that it is inside, outermost first.
+        self.line_number = None  # the line running, or None in direct mode
+        self.index = 0           # the index of the statement running
+        self.nesting = []        # the clauses and indices inside the IFs
+                                 # running, as in a position
+        self.jump = None         # the position to go to next, if not the next
+        self.stopped = False     # set by END and STOP
+        self.gosubs = []         # the positions for RETURN to go back to
+        self.loops = []          # the active FOR loops, innermost last
+        self.whiles = []         # the positions of the active WHILE loops
+
+    def Goto(self, line_number, index=0, *nesting):
+        """Makes the program continue at the given position.
+
+        Args:
+            line_number (int): The line to go to.
+            index (int): The index of the statement within that line.
+            nesting (str and int): The clauses and indices of the position
+                inside IF statements, if it is inside any.
+        """
+        self.jump = (line_number, index) + nesting
+
+    def Here(self):
+        """Returns the position of the statement running."""
+        return (self.line_number, self.index) + tuple(self.nesting)
+
+    def Next(self):
+        """Returns the position of the statement after the one running.
+
+        For a statement inside an IF, this is the next statement of the same
+        clause, or the end of the clause, from where the program goes on after
+        the IF.
+        """
+        nesting = self.nesting
+        if nesting:
+            return ((self.line_number, self.index) + tuple(nesting[:-1]) +
+                    (nesting[-1] + 1,))
+        return (self.line_number, self.index + 1)
+
+    def Reset(self):
+        """Clears the variables and the state of the program, as for RUN."""
+        self.env.Clear()
+        self.line_number = None
+        self.index = 0
+        self.nesting = []
+        self.jump = None
+        self.stopped = False
+        self.gosubs = []
+        self.loops = []
+        self.whiles = []
+
+    def Skip(self, opening, closing, error):
+        """Goes to the statement after the one closing the running block.
+
+        This is how FOR and WHILE skip their bodies: the program is searched
+        forward for the statement that matches the running one, allowing for
+        any blocks of the same kind nested inside.  The search goes through
+        the statements inside IF statements too, in the order they run.
+
+        Args:
+            opening (class): The class of statement opening the block.
+            closing (class): The class of statement closing it.
+            error (int): The error to raise if there is none
+                (exception.Error.ERR_*).
+
+        Raises:
+            exception.EvalException if there is no matching statement.
+        """
+        if self.line_number is None:
+            raise exception.EvalException(error)
+
+        here = self.Here()
+        numbers = self.program.LineNumbers()
+        i = self.program.Position(self.line_number)
+        found = False
+        depth = 0
+        for line_number in numbers[i:]:
+            for position, stmt in self.program.Walk(
+                    self.program.lines[line_number].set, (line_number,)):
+                if not found:
+                    found = position == here
+                elif isinstance(stmt, opening):
+                    depth += 1
+                elif isinstance(stmt, closing):
+                    if depth == 0:
+                        self.Goto(*(position[:-1] + (position[-1] + 1,)))
+                        return
+                    depth -= 1
+        raise exception.EvalException(error)
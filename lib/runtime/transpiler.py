@@ -0,0 +1,816 @@
+import ast
+import collections
+import math
+
+from .. import exception
+from .. import expression
+from .. import statement
+from .. import value
+
+# The functions that translated programs call, for the operations that need
+# more than a Python operator, or that need their operands checked.
+
+def _Fail(error):
+    """Raises an EvalException with the given error code."""
+    raise exception.EvalException(error)
+
+
+def _Number(val):
+    """Makes sure that a raw value is a number."""
+    if isinstance(val, str):
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+    return val
+
+
+def _String(val):
+    """Makes sure that a raw value is a string."""
+    if not isinstance(val, str):
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+    return val
+
+
+def _Add(a, b):
+    """Adds two numbers or concatenates two strings."""
+    if isinstance(a, str) != isinstance(b, str):
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+    return a + b
+
+
+def _Divide(a, b):
+    """Divides two numbers, as expression.EDivide does."""
+    if b == 0:
+        raise exception.EvalException(exception.Error.ERR_DIVZERO)
+    return float(a) / b
+
+
+def _Power(a, b):
+    """Raises a number to a power, as expression.EPower does."""
+    if isinstance(a, int) and isinstance(b, int) and b >= 0:
+        return a ** b
+    try:
+        return float(a) ** float(b)
+    except (OverflowError, ValueError, ZeroDivisionError):
+        raise exception.EvalException(exception.Error.ERR_RANGE)
+
+
+def _Compare(relation, a, b):
+    """Compares two numbers or two strings, as expression.ERelational does."""
+    if isinstance(a, str) != isinstance(b, str):
+        raise exception.EvalException(exception.Error.ERR_TYPE)
+    return -1 if expression.ERelational.COMPARISONS[relation](a, b) else 0
+
+
+def _Line(blocks, line_number):
+    """Returns the block that starts a line, for a computed GOTO or GOSUB."""
+    block = blocks.get((int(_Number(line_number)), 0))
+    if block is None:
+        raise exception.EvalException(exception.Error.ERR_BADLINE)
+    return block
+
+
+def _On(index, count):
+    """Returns the index, from 1, of the line an ON GOTO or ON GOSUB picks from
+    a list of the given length, or 0 to carry on."""
+    index = int(_Number(index))
+    if not 0 <= index <= 255:
+        raise exception.EvalException(exception.Error.ERR_RANGE)
+    return index if index <= count else 0
+
+
+def _Jump(rt, blocks):
+    """Returns the block for the position a statement told the runtime to go
+    to, and clears the jump."""
+    block = blocks.get(rt.jump)
+    rt.jump = None
+    if block is None:
+        raise exception.EvalException(exception.Error.ERR_BADLINE)
+    return block
+
+
+def _Load(rt, variables):
+    """Returns the raw values of the given variables from the environment."""
+    values = []
+    for id, type in variables:
+        val = rt.env.Get(id)
+        if val is None:
+            val = expression.ELValue.DEFAULTS[type]
+        values.append(val.value)
+    return values
+
+
+def _Store(rt, variables, values):
+    """Stores raw values into the first of the given variables in the
+    environment, as many as there are values."""
+    for (id, type), val in zip(variables, values):
+        if type == value.Value.STRING:
+            rt.env.Set(id, value.VString(val))
+        elif type == value.Value.INT:
+            rt.env.Set(id, value.VInt(val))
+        else:
+            rt.env.Set(id, value.VFloat(val))
+
+
+class Transpiler:
+    """Runs programs by translating them into Python code.
+
+    The whole program is translated into the source of a single Python
+    function, which is parsed with the ast module and compiled to a code
+    object.  The function is a state machine: each line, and each position
+    within a line that control can come back to (after a GOSUB, the body of a
+    FOR, and so on, inside an IF or not), starts a basic block, and the blocks
+    are dispatched by a binary tree of comparisons on the number of the block.
+    Variables are Python locals holding raw int, float and str values; GOSUB
+    and FOR keep their stacks in locals too.
+
+    Statements that cannot be translated, such as those with arrays or
+    functions, are run by their own Evaluate method, with the variables that
+    the code assigns written back to the environment first, and all of them
+    read again afterward.  As with runtime.Compiler, FOR and WHILE loops are
+    paired with their NEXT and WEND in the order of the program only to find
+    their exits: NEXT and WEND go back to the loops that are running.
+
+    The code is cached by the hash of the listing of the program (see
+    runtime.Program.Hash), so that running the same program again does not
+    translate it again.
+    """
+
+    # The number of translated programs to keep.
+    DEFAULT_SIZE = 8
+
+    # The names that translated programs can refer to.
+    NAMESPACE = {
+        'Add': _Add,
+        'Compare': _Compare,
+        'Divide': _Divide,
+        'Fail': _Fail,
+        'Int': expression.ToInt,
+        'Jump': _Jump,
+        'Line': _Line,
+        'Load': _Load,
+        'Mod': expression.Mod,
+        'Number': _Number,
+        'On': _On,
+        'Power': _Power,
+        'Print': statement.SPrint.PrintValue,
+        'Store': _Store,
+        'String': _String,
+    }
+
+    # The Python operators for the expressions that have them.
+    OPERATORS = {
+        expression.EAdd:      '+',
+        expression.EMultiply: '*',
+        expression.ESubtract: '-',
+    }
+
+    # A static type for numbers that may be either integers or floats.
+    NUMBER = 0
+
+    # Placeholders for the lines that load all the variables from the
+    # environment and store them back, which can only be written once all the
+    # variables are known.  Neither is a line of valid Python.
+    LOAD = '@load'
+    STORE = '@store'
+
+    # A placeholder for the lines that step the variable of a NEXT without
+    # one, which can only be written once all the FOR variables are known.
+    NEXT = '@next'
+
+    def __init__(self, size=DEFAULT_SIZE):
+        """Initializes the transpiler with an empty cache.
+
+        Args:
+            size (int): The maximum number of translated programs to keep.
+        """
+        self.size = size
+        self.cache = collections.OrderedDict()  # hash->translation
+        self.hits = 0    # number of runs that reused a translation
+        self.misses = 0  # number of runs that had to translate
+
+    def Run(self, rt, line_number=None):
+        """Translates and runs the program, until it ends or runs off the end.
+
+        Args:
+            rt (runtime.Runtime): The runtime holding the program.
+            line_number (int): The line to start at, or None for the first.
+
+        Raises:
+            exception.EvalException if the program fails.
+        """
+        rt.program.Link()
+        key = rt.program.Hash()
+        translation = self.cache.pop(key, None)
+        if translation is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            source, variables, blocks, paths = self.Translate(rt.program)
+            tree = ast.parse(source, '<program>')
+            code = compile(tree, '<program>', 'exec')
+            translation = (code, variables, blocks, paths)
+            if len(self.cache) >= self.size:
+                self.cache.popitem(last=False)
+        self.cache[key] = translation
+
+        code, variables, blocks, paths = translation
+        pc = 0
+        if line_number is not None:
+            pc = blocks.get((line_number, 0))
+            if pc is None:
+                raise exception.EvalException(exception.Error.ERR_BADLINE)
+
+        # The statements that were not translated are found again in the
+        # program being run, since the translation may be a cached one.
+        statements = [self._Resolve(rt.program, path) for path in paths]
+        namespace = dict(self.NAMESPACE)
+        exec code in namespace
+        try:
+            namespace['Program'](rt, pc, statements, variables, blocks)
+        finally:
+            rt.line_number = None
+
+    def Stats(self):
+        """Returns a human-readable summary of the cache counters."""
+        return '%d/%d programs, %d hits, %d misses' % (
+            len(self.cache), self.size, self.hits, self.misses)
+
+    def Translate(self, program):
+        """Translates a program into the source of a Python function.
+
+        The function is called Program, and takes the runtime, the number of
+        the block to start at, and the last three results of this method.
+
+        Args:
+            program (runtime.Program): The program.
+
+        Returns:
+            (str, list of (str, int), dict, list of tuple): The source of the
+            function; the names and types of the variables, in the order of
+            its locals, those it assigns first; the number of the block at
+            each position that starts one; and the path to each statement that
+            is not translated (see _Resolve), in the order they are passed to
+            the function.
+        """
+        self.optimizer = expression.Optimizer()
+        self.variables = collections.OrderedDict()  # ID->(local name, type)
+        self.assigned = set()  # the IDs of the variables the code assigns
+        self.paths = []
+        self.counters = collections.OrderedDict()  # local->FOR variable
+        self._Pair(program)
+
+        # Number the blocks in the order of the program.  The end of a line is
+        # the same as the start of the next one, so it only needs a block of
+        # its own at the end of the program.  The blocks inside IF statements
+        # come after all the others.
+        self.blocks = {}
+        count = 0
+        end = None
+        line_numbers = program.LineNumbers()
+        for line_number in line_numbers:
+            statements = program.lines[line_number].set
+            for index in range(len(statements)):
+                if index == 0 or (line_number, index) in self.entries:
+                    self.blocks[(line_number, index)] = count
+                    count += 1
+            if end:
+                self.blocks[end] = self.blocks[(line_number, 0)]
+            end = (line_number, len(statements))
+        if end in self.entries:
+            self.blocks[end] = count
+            count += 1
+        for position in sorted(self.entries):
+            if len(position) > 2:
+                self.blocks[position] = count
+                count += 1
+
+        # Translate the statements, starting a new block at each position
+        # that has one.  Each block goes on to the next one when it is done.
+        # The rest of a clause from a block inside it is translated after the
+        # statement holding the clause (see _Statements).
+        self.bodies = {}    # number of a block->its lines
+        self.rests = []     # (path, index, statement set) of rests of clauses
+        for line_number in line_numbers:
+            statements = program.lines[line_number].set
+            for index in range(len(statements) + 1):
+                block = self.blocks.get((line_number, index))
+                if block is not None and block not in self.bodies:
+                    if self.bodies and self.lines[-1] not in ('continue',
+                                                              'return'):
+                        self._Emit('pc = %d' % block)
+                    self.lines = self.bodies[block] = ['# %d' % line_number]
+                if index < len(statements):
+                    self._Statement(statements[index], (line_number, index))
+                    lines = self.lines
+                    self._Rests()
+                    self.lines = lines
+        if self.bodies and self.lines[-1] != 'return':
+            self._Emit('return')
+        bodies = [self.bodies[block] for block in range(len(self.bodies))]
+
+        # Put the function together, now that the variables are known.
+        self.lines = ['def Program(rt, pc, statements, variables, blocks):']
+        self._Emit('gosubs = []  # the blocks for RETURN to go back to', 1)
+        self._Emit('loops = []   # (variable, end, step, block of the body)', 1)
+        self._Emit('whiles = []  # the blocks of the running WHILE loops', 1)
+        self._Emit(self.LOAD, 1)
+        self._Emit('try:', 1)
+        self._Dispatch(bodies, 0, len(bodies), 2)
+        self._Emit('finally:', 1)
+        self._Emit(self.STORE, 2)
+
+        # The variables that the code assigns come first, so that only they
+        # are written back to the environment: the others are as they were.
+        ids = sorted(self.variables, key=lambda id: id not in self.assigned)
+        names = [self.variables[id][0] for id in ids]
+        code = {
+            self.LOAD: '[%s] = Load(rt, variables)' % ', '.join(names),
+            self.STORE: 'Store(rt, variables, [%s])' % ', '.join(
+                names[:len(self.assigned)]),
+        }
+        lines = self.lines
+        self.lines = []
+        for text in lines:
+            placeholder = text.lstrip()
+            indent = text[:-len(placeholder)]
+            if placeholder in code:
+                self.lines.append(indent + code[placeholder])
+            elif placeholder == self.NEXT:
+                self._Counters(len(indent) // 4)
+            else:
+                self.lines.append(text)
+        source = '\n'.join(self.lines) + '\n'
+        variables = [(id, self.variables[id][1]) for id in ids]
+        return source, variables, self.blocks, self.paths
+
+    def _Counters(self, indent):
+        """Emits the lines that step the variable of the loop named by the
+        local name, for a NEXT without a variable."""
+        if not self.counters:
+            self._Emit('pass', indent)
+        for i, (name, var) in enumerate(self.counters.iteritems()):
+            self._Emit('%s name == %r:' % ('if' if i == 0 else 'elif', name),
+                       indent)
+            self._Step(var, indent + 1)
+
+    def _Dispatch(self, bodies, start, end, indent):
+        """Emits the loop that runs the blocks, for the blocks in a range."""
+        if start == end:
+            self._Emit('return', indent)
+            return
+        if start == 0 and end == len(bodies):
+            self._Emit('while True:', indent)
+            indent += 1
+        if end - start == 1:
+            for text in bodies[start]:
+                self._Emit(text, indent)
+            return
+        middle = (start + end) // 2
+        self._Emit('if pc < %d:' % middle, indent)
+        self._Dispatch(bodies, start, middle, indent + 1)
+        self._Emit('else:', indent)
+        self._Dispatch(bodies, middle, end, indent + 1)
+
+    def _Emit(self, text, indent=0):
+        """Adds a line of source to the block being translated."""
+        self.lines.append('    ' * indent + text)
+
+    def _Expression(self, exp):
+        """Translates an expression that has been through the optimizer.
+
+        Returns:
+            (str, int): The source of the Python expression, and the static
+            type of its value: value.Value.INT, FLOAT or STRING, NUMBER, or
+            None if it is not known.
+
+        Raises:
+            _Untranslatable if the expression cannot be translated.
+        """
+        cls = exp.Generic()
+        INT = value.Value.INT
+        FLOAT = value.Value.FLOAT
+        STRING = value.Value.STRING
+
+        if cls is expression.EInt:
+            return '(%d)' % exp.value, INT
+        elif cls is expression.EFloat:
+            if math.isinf(exp.value) or math.isnan(exp.value):
+                raise _Untranslatable()
+            return '(%r)' % exp.value, FLOAT
+        elif cls is expression.EString:
+            return repr(exp.value), STRING
+        elif cls is expression.ELValue:
+            return self._Variable(exp), exp.type
+
+        elif cls in self.OPERATORS:
+            a, type_a = self._Expression(exp.exp_a)
+            b, type_b = self._Expression(exp.exp_b)
+            operator = self.OPERATORS[cls]
+            if cls is expression.EAdd and (type_a == type_b == STRING):
+                return '(%s + %s)' % (a, b), STRING
+            elif cls is expression.EAdd and not (self._IsNumber(type_a) and
+                                                 self._IsNumber(type_b)):
+                return 'Add(%s, %s)' % (a, b), None
+            a, type_a = self._Numeric(a, type_a)
+            b, type_b = self._Numeric(b, type_b)
+            if type_a == type_b == INT:
+                type = INT
+            elif FLOAT in (type_a, type_b):
+                type = FLOAT
+            else:
+                type = self.NUMBER
+            return '(%s %s %s)' % (a, operator, b), type
+
+        elif cls is expression.EDivide:
+            a, type_a = self._Numeric(*self._Expression(exp.exp_a))
+            b, type_b = self._Numeric(*self._Expression(exp.exp_b))
+            return 'Divide(%s, %s)' % (a, b), FLOAT
+        elif cls is expression.EMod:
+            a, type_a = self._Numeric(*self._Expression(exp.exp_a))
+            b, type_b = self._Numeric(*self._Expression(exp.exp_b))
+            return 'Mod(%s, %s)' % (a, b), INT
+        elif cls is expression.EPower:
+            a, type_a = self._Numeric(*self._Expression(exp.exp_a))
+            b, type_b = self._Numeric(*self._Expression(exp.exp_b))
+            if FLOAT in (type_a, type_b):
+                return 'Power(%s, %s)' % (a, b), FLOAT
+            return 'Power(%s, %s)' % (a, b), self.NUMBER
+        elif cls is expression.EAnd or cls is expression.EOr:
+            a, type_a = self._Numeric(*self._Expression(exp.exp_a))
+            b, type_b = self._Numeric(*self._Expression(exp.exp_b))
+            operator = '&' if cls is expression.EAnd else '|'
+            return '(Int(%s) %s Int(%s))' % (a, operator, b), INT
+        elif cls is expression.ENegate:
+            a, type_a = self._Numeric(*self._Expression(exp.exp))
+            return '(-%s)' % a, type_a
+        elif cls is expression.ENot:
+            a, type_a = self._Numeric(*self._Expression(exp.exp))
+            return '(~Int(%s))' % a, INT
+
+        elif cls is expression.ERelational:
+            a, type_a = self._Expression(exp.exp_a)
+            b, type_b = self._Expression(exp.exp_b)
+            if ((self._IsNumber(type_a) and self._IsNumber(type_b)) or
+                type_a == type_b == STRING):
+                operator = str(expression.ERelational.OPERATORS[exp.relation])
+                operator = {'=': '==', '<>': '!='}.get(operator, operator)
+                return '(-1 if %s %s %s else 0)' % (a, operator, b), INT
+            return 'Compare(%d, %s, %s)' % (exp.relation, a, b), INT
+
+        raise _Untranslatable()
+
+    def _IsNumber(self, type):
+        """Checks if a static type is known to be numeric."""
+        return type in (value.Value.INT, value.Value.FLOAT, self.NUMBER)
+
+    def _Numeric(self, source, type):
+        """Makes sure that an expression is numeric, checking if need be."""
+        if self._IsNumber(type):
+            return source, type
+        return 'Number(%s)' % source, self.NUMBER
+
+    def _Pair(self, program):
+        """Pairs the loops of a program, and finds where its blocks start.
+
+        Every position that control can go to, other than the start of a line,
+        starts a block: the position after a GOSUB (to return to), a FOR (for
+        the body), a NEXT or a WEND (for the loop to exit to), and the position
+        of a WHILE (to test again).  Those may be inside IF statements, and a
+        block inside a clause goes on after the IF when the clause is done, so
+        the position after each IF around one starts a block too.
+        """
+        self.entries = set()
+        self.exits = {}     # id of FOR or WHILE->position to exit to
+        fors = []
+        whiles = []
+        for line_number in program.LineNumbers():
+            for here, stmt in program.Walk(program.lines[line_number].set,
+                                           (line_number,)):
+                next = here[:-1] + (here[-1] + 1,)
+                cls = stmt.__class__
+                if cls is statement.SGosub or cls is statement.SOnGosub:
+                    self.entries.add(next)
+                elif cls is statement.SFor:
+                    self.entries.add(next)
+                    fors.append(stmt)
+                elif cls is statement.SNext:
+                    self.entries.add(next)
+                    while fors:
+                        loop = fors.pop()
+                        self.exits[id(loop)] = next
+                        if stmt.var is None or loop.var.id == stmt.var.id:
+                            break
+                elif cls is statement.SWhile:
+                    self.entries.add(here)
+                    whiles.append((stmt, here))
+                elif cls is statement.SWend:
+                    self.entries.add(next)
+                    if whiles:
+                        loop, start = whiles.pop()
+                        self.exits[id(loop)] = next
+        for position in list(self.entries):
+            for i in range(2, len(position) - 1, 2):
+                self.entries.add(position[:i - 1] + (position[i - 1] + 1,))
+
+    def _Resolve(self, program, path):
+        """Finds a linked statement of a program by its path (see
+        runtime.Program.Link), since those are the ones with slots.
+
+        A path is a line number and an index into the statements of the line,
+        followed by ('then_case' or 'else_case', index) for each IF the
+        statement is inside.
+        """
+        stmt = program.Link()[program.Position(path[0])][path[1]]
+        for i in range(2, len(path), 2):
+            stmt = getattr(stmt, path[i]).set[path[i + 1]]
+        return stmt
+
+    def _Statement(self, stmt, path, indent=0):
+        """Translates a statement, or has it run as it is if it cannot be.
+
+        Args:
+            stmt (statement.Statement): The statement.
+            path (tuple): The path to the statement (see _Resolve).
+            indent (int): The depth of the statement within IF statements.
+        """
+        lines = self.lines
+        self.lines = []
+        try:
+            self._Translate(stmt, path, indent)
+            lines.extend(self.lines)
+        except _Untranslatable:
+            self.lines = lines
+            self._Fallback(stmt, path, indent)
+        self.lines = lines
+
+    def _Translate(self, stmt, path, indent):
+        """Translates a statement that can be, or raises _Untranslatable."""
+        cls = stmt.__class__
+        optimize = self.optimizer.Optimize
+        next = path[:-1] + (path[-1] + 1,)
+
+        if cls is statement.SAssignment and stmt.var.__class__ is (
+                expression.ELValue):
+            source = self._Convert(stmt.var,
+                                   *self._Expression(optimize(stmt.exp)))
+            self._Emit('%s = %s' % (self._Variable(stmt.var, True), source),
+                       indent)
+
+        elif cls is statement.SClear:
+            self._Emit('rt.env.Clear()', indent)
+            self._Emit('loops = []', indent)
+            self._Emit(self.LOAD, indent)
+
+        elif cls is statement.SComment or cls is statement.SNull:
+            self._Emit('pass', indent)
+
+        elif cls is statement.SEnd:
+            self._Emit('return', indent)
+
+        elif cls is statement.SGoto or cls is statement.SGosub:
+            exp = optimize(stmt.exp)
+            if cls is statement.SGosub:
+                self._Emit('gosubs.append(%d)' % self.blocks[next], indent)
+            if exp.IsConstant() and isinstance(exp.value, int):
+                self._Goto((exp.value, 0), indent)
+            else:
+                self._Emit('pc = Line(blocks, %s)' % self._Expression(exp)[0],
+                           indent)
+                self._Emit('continue', indent)
+
+        elif cls is statement.SOnGoto or cls is statement.SOnGosub:
+            exps = [optimize(exp) for exp in stmt.exps]
+            self._Emit('choice = On(%s, %d)' % (
+                self._Expression(optimize(stmt.exp))[0], len(exps)), indent)
+            self._Emit('if choice:', indent)
+            if cls is statement.SOnGosub:
+                self._Emit('gosubs.append(%d)' % self.blocks[next], indent + 1)
+            targets = [self.blocks.get((exp.value, 0))
+                       if exp.IsConstant() and isinstance(exp.value, int)
+                       else None for exp in exps]
+            if None not in targets:
+                # Every line is known, so the blocks make a jump table.
+                self._Emit('pc = (%s,)[choice - 1]' % ', '.join(
+                    str(block) for block in targets), indent + 1)
+                self._Emit('continue', indent + 1)
+            else:
+                for i, exp in enumerate(exps):
+                    self._Emit('%s choice == %d:' % (
+                        'if' if i == 0 else 'elif', i + 1), indent + 1)
+                    if exp.IsConstant() and isinstance(exp.value, int):
+                        self._Goto((exp.value, 0), indent + 2)
+                    else:
+                        self._Emit('pc = Line(blocks, %s)' %
+                                   self._Expression(exp)[0], indent + 2)
+                        self._Emit('continue', indent + 2)
+
+        elif cls is statement.SReturn:
+            self._Emit('if not gosubs:', indent)
+            self._Emit('Fail(%d)' % exception.Error.ERR_RETURN, indent + 1)
+            self._Emit('pc = gosubs.pop()', indent)
+            self._Emit('continue', indent)
+
+        elif cls is statement.SIf:
+            test = self._Test(stmt, 'test_exp', path, indent)
+            self._Emit('if %s != 0:' % test, indent)
+            self._Statements(stmt.then_case, path + ('then_case',), indent + 1)
+            if stmt.else_case:
+                self._Emit('else:', indent)
+                self._Statements(stmt.else_case, path + ('else_case',),
+                                 indent + 1)
+
+        elif cls is statement.SFor and stmt.var.__class__ is (
+                expression.ELValue):
+            start = self._Numeric(*self._Expression(optimize(stmt.exp_start)))
+            end = self._Numeric(*self._Expression(optimize(stmt.exp_end)))[0]
+            step = '1.0'
+            if stmt.exp_step:
+                step = self._Numeric(
+                    *self._Expression(optimize(stmt.exp_step)))[0]
+            name = self._Variable(stmt.var, True)
+            self.counters[name] = stmt.var
+            self._Emit('start = %s' % start[0], indent)
+            self._Emit('end = float(%s)' % end, indent)
+            self._Emit('step = float(%s)' % step, indent)
+            self._Emit('%s = %s' % (name, self._Convert(stmt.var, 'start',
+                                                        start[1])), indent)
+            self._Emit('loops = [loop for loop in loops if loop[0] != %r]' %
+                       name, indent)
+            self._Emit('if (step >= 0 and %s <= end) or '
+                       '(step < 0 and %s >= end):' % (name, name), indent)
+            self._Emit('loops.append((%r, end, step, %d))' % (
+                name, self.blocks[next]), indent + 1)
+            self._Emit('pc = %d' % self.blocks[next], indent + 1)
+            self._Emit('continue', indent + 1)
+            exit = self.exits.get(id(stmt))
+            if exit is None:
+                self._Emit('Fail(%d)' % exception.Error.ERR_FOR, indent)
+            else:
+                self._Goto(exit, indent)
+
+        elif cls is statement.SNext:
+            if stmt.var is None:
+                # The loop is the innermost one running, whichever it is, so
+                # its variable is picked when the program runs (see NEXT).
+                self._Emit('if not loops:', indent)
+                self._Emit('Fail(%d)' % exception.Error.ERR_NEXT, indent + 1)
+                self._Emit('name, end, step = loops[-1][:3]', indent)
+                self._Emit(self.NEXT, indent)
+            elif stmt.var.__class__ is not expression.ELValue:
+                raise _Untranslatable()
+            else:
+                name = self._Variable(stmt.var, True)
+                self._Emit('while loops and loops[-1][0] != %r:' % name,
+                           indent)
+                self._Emit('loops.pop()', indent + 1)
+                self._Emit('if not loops:', indent)
+                self._Emit('Fail(%d)' % exception.Error.ERR_NEXT, indent + 1)
+                self._Emit('end, step = loops[-1][1:3]', indent)
+                self._Step(stmt.var, indent)
+            self._Emit('if (step >= 0 and count <= end) or '
+                       '(step < 0 and count >= end):', indent)
+            self._Emit('pc = loops[-1][3]', indent + 1)
+            self._Emit('continue', indent + 1)
+            self._Emit('loops.pop()', indent)
+
+        elif cls is statement.SWhile:
+            test = self._Test(stmt, 'exp', path, indent)
+            self._Emit('if %s == 0:' % test, indent)
+            exit = self.exits.get(id(stmt))
+            if exit is None:
+                self._Emit('Fail(%d)' % exception.Error.ERR_WHILE, indent + 1)
+            else:
+                self._Goto(exit, indent + 1)
+            self._Emit('whiles.append(%d)' % self.blocks[path], indent)
+
+        elif cls is statement.SWend:
+            self._Emit('if not whiles:', indent)
+            self._Emit('Fail(%d)' % exception.Error.ERR_WEND, indent + 1)
+            self._Emit('pc = whiles.pop()', indent)
+            self._Emit('continue', indent)
+
+        elif cls is statement.SPrint:
+            for item in stmt.items:
+                self._Emit('Print(%s, %d)' % (
+                    self._Expression(optimize(item.exp))[0], item.type),
+                    indent)
+            if not stmt.items:
+                self._Emit("Print('', %d)" % statement.SPrint.FINAL, indent)
+
+        else:
+            raise _Untranslatable()
+
+    def _Convert(self, var, source, type):
+        """Returns the source converting a value to the type of a variable."""
+        if type == var.type:
+            return source
+        elif var.type == value.Value.STRING:
+            return 'String(%s)' % source
+        elif var.type == value.Value.INT:
+            return 'Int(%s)' % self._Numeric(source, type)[0]
+        return 'float(%s)' % self._Numeric(source, type)[0]
+
+    def _Fallback(self, stmt, path, indent):
+        """Has a statement run by its own Evaluate method."""
+        self._Emit('# %s' % stmt, indent)
+        self._Emit(self.STORE, indent)
+        self._Emit('rt.line_number, rt.index = %d, %d' % path[:2], indent)
+        self._Emit('rt.nesting = %r' % list(path[2:]), indent)
+        self._Emit('statements[%d].Evaluate(rt)' % len(self.paths), indent)
+        self.paths.append(path)
+        self._Emit(self.LOAD, indent)
+        self._Emit('if rt.stopped:', indent)
+        self._Emit('return', indent + 1)
+        self._Emit('if rt.jump is not None:', indent)
+        self._Emit('pc = Jump(rt, blocks)', indent + 1)
+        self._Emit('continue', indent + 1)
+
+    def _Goto(self, position, indent):
+        """Emits a jump to a position, which must start a block."""
+        block = self.blocks.get(position)
+        if block is None:
+            self._Emit('Fail(%d)' % exception.Error.ERR_BADLINE, indent)
+        else:
+            self._Emit('pc = %d' % block, indent)
+            self._Emit('continue', indent)
+
+    def _Statements(self, statement_set, path, indent, start=0):
+        """Translates the statements of a clause of an IF, from an index.
+
+        At the first position from there that starts a block, a jump to the
+        block is emitted instead, and the rest of the clause is left for
+        _Rests.
+
+        Returns:
+            bool: Whether the clause jumped to a block.
+        """
+        statements = statement_set.set
+        for i in range(start, len(statements) + 1):
+            if path + (i,) in self.blocks:
+                self._Goto(path + (i,), indent)
+                self.rests.append((path, i, statement_set))
+                return True
+            if i < len(statements):
+                self._Statement(statements[i], path + (i,), indent)
+        return False
+
+    def _Rests(self):
+        """Translates the rests of the clauses that _Statements left, each
+        from the block it jumped to, going on after the IF at the end."""
+        while self.rests:
+            path, index, statement_set = self.rests.pop(0)
+            position = path + (index,)
+            self.lines = self.bodies[self.blocks[position]] = [
+                '# %d' % position[0]]
+            statements = statement_set.set
+            if index < len(statements):
+                self._Statement(statements[index], position)
+            if not self._Statements(statement_set, path, 0, index + 1):
+                self._Goto(path[:-2] + (path[-2] + 1,), 0)
+
+    def _Step(self, var, indent):
+        """Emits the lines that add the step to the variable of a loop."""
+        name = self._Variable(var, True)
+        self._Emit('count = float(%s) + step' % self._Numeric(
+            name, var.type)[0], indent)
+        self._Emit('%s = %s' % (name, self._Convert(
+            var, 'count', value.Value.FLOAT)), indent)
+
+    def _Test(self, stmt, name, path, indent):
+        """Returns the source of the condition of an IF or a WHILE.
+
+        A condition that cannot be translated is evaluated as it is, rather
+        than the whole statement, so that the jumps of the statement stay in
+        the translated code.
+
+        Args:
+            stmt (statement.Statement): The statement.
+            name (str): The attribute of the statement holding the condition.
+            path (tuple): The path to the statement (see _Resolve).
+            indent (int): The depth of the statement within IF statements.
+        """
+        try:
+            return self._Numeric(*self._Expression(
+                self.optimizer.Optimize(getattr(stmt, name))))[0]
+        except _Untranslatable:
+            self._Emit(self.STORE, indent)
+            self._Emit('test = Number(statements[%d].%s.EvaluateRaw(rt))' % (
+                len(self.paths), name), indent)
+            self.paths.append(path)
+            return 'test'
+
+    def _Variable(self, var, assigned=False):
+        """Returns the name of the local for a variable.
+
+        Args:
+            var (expression.ELValue): The variable.
+            assigned (bool): Whether the code being translated assigns it.
+        """
+        if var.id not in self.variables:
+            self.variables[var.id] = ('v%d' % len(self.variables), var.type)
+        if assigned:
+            self.assigned.add(var.id)
+        return self.variables[var.id][0]
+
+
+class _Untranslatable(Exception):
+    """Raised for statements and expressions that cannot be translated."""
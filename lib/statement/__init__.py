@@ -0,0 +1,26 @@
+from sassignment import SAssignment
+from sclear import SClear
+from scomment import SComment
+from sdeffn import SDefFn
+from sdelete import SDelete
+from sdim import SDim
+from send import SEnd
+from sfor import SFor
+from sgosub import SGosub
+from sgoto import SGoto
+from sif import SIf
+from slist import SList
+from sload import SLoad
+from snext import SNext
+from snull import SNull
+from songosub import SOnGosub
+from songoto import SOnGoto
+from sprint import SPrint
+from sreturn import SReturn
+from srun import SRun
+from ssave import SSave
+from sstop import SStop
+from statement import Statement
+from statementset import StatementSet
+from swend import SWend
+from swhile import SWhile
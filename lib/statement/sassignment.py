@@ -0,0 +1,24 @@
+import statement
+
+class SAssignment(statement.Statement):
+    """An assignment statement, with or without LET."""
+
+    def __init__(self, var, exp):
+        """Initializes the statement.
+
+        Args:
+            var (expression.ELValue): The variable assigned to.
+            exp (expression.Expression): The value to assign.
+        """
+        super(SAssignment, self).__init__()
+        self.var = var
+        self.exp = exp
+
+    def Evaluate(self, rt):
+        self.var.Assign(rt, self.exp.Evaluate(rt))
+
+    def Optimize(self, optimizer):
+        return self._Optimized(optimizer, 'var', 'exp')
+
+    def __str__(self):
+        return str(self.var) + ' = ' + str(self.exp)
@@ -0,0 +1,15 @@
+import statement
+
+class SClear(statement.Statement):
+    """A CLEAR statement, which removes every variable, array and function.
+
+    The FOR loops that are running end too, since their variables are gone,
+    so a NEXT after CLEAR fails as if there were no FOR.
+    """
+
+    def Evaluate(self, rt):
+        rt.env.Clear()
+        rt.loops = []
+
+    def __str__(self):
+        return 'CLEAR'
@@ -0,0 +1,19 @@
+import statement
+
+class SComment(statement.Statement):
+    """A comment (REM) statement, which does nothing."""
+
+    def __init__(self, text):
+        """Initializes the statement.
+
+        Args:
+            text (str): The text of the comment, after the REM.
+        """
+        super(SComment, self).__init__()
+        self.text = text
+
+    def Evaluate(self, rt):
+        pass
+
+    def __str__(self):
+        return 'REM ' + self.text
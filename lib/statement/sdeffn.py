@@ -0,0 +1,47 @@
+import copy
+
+from .. import expression
+from .. import value
+import statement
+
+class SDefFn(statement.Statement):
+    """A DEF FN statement, which defines an FN function."""
+
+    def __init__(self, var, formals, exp):
+        """Initializes the statement.
+
+        Args:
+            var (expression.ELValue): The name of the function.
+            formals (list of expression.ELValue): The formals.
+            exp (expression.Expression): The body of the function.
+        """
+        super(SDefFn, self).__init__()
+        self.var = var
+        self.formals = formals
+        self.exp = exp
+
+    def Evaluate(self, rt):
+        # The formals are bound by slot (see value.VFunction), so those of a
+        # function defined in direct mode, which has not been linked, are
+        # given theirs here, in copies, as Optimize would.
+        formals = self.formals
+        if any(formal.slot == expression.SlotTable.NONE for formal in formals):
+            optimizer = expression.Optimizer(rt.env)
+            formals = [optimizer.Optimize(formal) for formal in formals]
+        rt.env.SetFunction(self.var.id, value.VFunction(
+            self.var, formals, self.exp))
+
+    def Optimize(self, optimizer):
+        optimized = self._Optimized(optimizer, 'exp')
+        formals = [optimizer.Optimize(formal) for formal in self.formals]
+        if all(new is formal for new, formal in zip(formals, self.formals)):
+            return optimized
+        if optimized is self:
+            optimized = copy.copy(self)
+        optimized.formals = formals
+        return optimized
+
+    def __str__(self):
+        return 'DEF %s(%s) = %s' % (
+            self.var, ', '.join(str(formal) for formal in self.formals),
+            self.exp)
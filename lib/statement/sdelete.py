@@ -0,0 +1,19 @@
+import statement
+
+class SDelete(statement.Statement):
+    """A DELETE statement, which removes lines from the program."""
+
+    def __init__(self, line_range):
+        """Initializes the statement.
+
+        Args:
+            line_range (runtime.LineRange): The lines to remove.
+        """
+        super(SDelete, self).__init__()
+        self.line_range = line_range
+
+    def Evaluate(self, rt):
+        rt.program.Delete(self.line_range)
+
+    def __str__(self):
+        return ('DELETE ' + str(self.line_range)).rstrip()
@@ -0,0 +1,26 @@
+from .. import expression
+import statement
+
+class SDim(statement.Statement):
+    """A DIM statement, which makes arrays."""
+
+    def __init__(self, vars):
+        """Initializes the statement.
+
+        Args:
+            vars (list of expression.ELValueArray): The arrays, each with its
+                maximum subscripts.
+        """
+        super(SDim, self).__init__()
+        self.vars = vars
+
+    def Evaluate(self, rt):
+        # Subscripts start at 0, so each dimension has one more element than
+        # its maximum subscript.
+        for var in self.vars:
+            dims = [int(expression.RequireNumber(exp.EvaluateRaw(rt))) + 1
+                    for exp in var.exps]
+            rt.env.MakeArray(var, dims)
+
+    def __str__(self):
+        return 'DIM ' + ', '.join(str(var) for var in self.vars)
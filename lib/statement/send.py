@@ -0,0 +1,10 @@
+import statement
+
+class SEnd(statement.Statement):
+    """An END statement, which ends the program."""
+
+    def Evaluate(self, rt):
+        rt.stopped = True
+
+    def __str__(self):
+        return 'END'
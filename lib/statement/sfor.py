@@ -0,0 +1,74 @@
+from .. import exception
+from .. import expression
+import snext
+import statement
+
+class SFor(statement.Statement):
+    """A FOR statement, which starts a counted loop."""
+
+    # The position after the end of the loop, once linked (see
+    # runtime.Program.Link), or None if it must be searched for.
+    exit = None
+
+    def __init__(self, var, exp_start, exp_end, exp_step=None):
+        """Initializes the statement.
+
+        Args:
+            var (expression.ELValue): The loop variable.
+            exp_start (expression.Expression): The first value.
+            exp_end (expression.Expression): The last value.
+            exp_step (expression.Expression): The increment, if not 1.
+        """
+        super(SFor, self).__init__()
+        self.var = var
+        self.exp_start = exp_start
+        self.exp_end = exp_end
+        self.exp_step = exp_step
+
+    def Evaluate(self, rt):
+        start = self.exp_start.EvaluateToNumeric(rt)
+        end = float(expression.RequireNumber(self.exp_end.EvaluateRaw(rt)))
+        if self.exp_step:
+            step = float(expression.RequireNumber(
+                self.exp_step.EvaluateRaw(rt)))
+        else:
+            step = 1.0
+        start = self.var.Convert(start)
+        self.var.Assign(rt, start)
+
+        # Starting a loop on a variable ends any loop already running on it.
+        rt.loops = [loop for loop in rt.loops if loop[0].id != self.var.id]
+
+        # The body runs only if the first value, as stored in the variable, is
+        # in range.  Every engine tests the stored value, so that FOR I%=1.7
+        # TO 1 tests 1 against 1 whichever engine runs it.
+        start = start.AsFloat()
+        if (step >= 0 and start <= end) or (step < 0 and start >= end):
+            rt.loops.append((self.var, end, step, rt.Next()))
+        else:
+            self.Skip(rt)
+
+    def Optimize(self, optimizer):
+        return self._Optimized(optimizer, 'var', 'exp_start', 'exp_end',
+                               'exp_step')
+
+    def Skip(self, rt):
+        """Goes to the statement after the end of the loop.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Raises:
+            exception.EvalException if the loop has no end.
+        """
+        if self.exit is not None:
+            rt.Goto(*self.exit)
+        else:
+            rt.Skip(SFor, snext.SNext, exception.Error.ERR_FOR)
+
+    def __str__(self):
+        text = ('FOR ' + str(self.var) + ' = ' + str(self.exp_start) + ' TO ' +
+                str(self.exp_end))
+        if self.exp_step:
+            text += ' STEP ' + str(self.exp_step)
+        return text
@@ -0,0 +1,12 @@
+import sgoto
+
+class SGosub(sgoto.SGoto):
+    """A GOSUB statement, which calls a subroutine."""
+
+    def Evaluate(self, rt):
+        line_number = self.Target(rt)
+        rt.gosubs.append(rt.Next())
+        rt.Goto(line_number)
+
+    def __str__(self):
+        return 'GOSUB ' + str(self.exp)
@@ -0,0 +1,49 @@
+import copy
+
+from .. import expression
+import statement
+
+class SGoto(statement.Statement):
+    """A GOTO statement."""
+
+    # The line to go to, once linked, if it is constant.
+    target = None
+
+    def __init__(self, exp):
+        """Initializes the statement.
+
+        Args:
+            exp (expression.Expression): The line number to go to.
+        """
+        super(SGoto, self).__init__()
+        self.exp = exp
+
+    def Evaluate(self, rt):
+        rt.Goto(self.Target(rt))
+
+    def Link(self, program):
+        target = program.Target(self.exp)
+        if target is None:
+            return self
+        linked = copy.copy(self)
+        linked.target = target
+        return linked
+
+    def Optimize(self, optimizer):
+        return self._Optimized(optimizer, 'exp')
+
+    def Target(self, rt):
+        """Returns the line to go to.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Raises:
+            exception.EvalException if the line number is not numeric.
+        """
+        if self.target is not None:
+            return self.target
+        return int(expression.RequireNumber(self.exp.EvaluateRaw(rt)))
+
+    def __str__(self):
+        return 'GOTO ' + str(self.exp)
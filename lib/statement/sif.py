@@ -0,0 +1,90 @@
+import copy
+
+from .. import expression
+import statement
+
+class SIf(statement.Statement):
+    """An IF statement, with an optional ELSE."""
+
+    def __init__(self, test_exp, then_case, else_case=None):
+        """Initializes the statement.
+
+        Args:
+            test_exp (expression.Expression): The condition.
+            then_case (statement.StatementSet): What to run if it holds.
+            else_case (statement.StatementSet): What to run if not, if anything.
+        """
+        super(SIf, self).__init__()
+        self.test_exp = test_exp
+        self.then_case = then_case
+        self.else_case = else_case
+
+    def Evaluate(self, rt):
+        if expression.RequireNumber(self.test_exp.EvaluateRaw(rt)) != 0:
+            self._Run(rt, 'then_case', 0)
+        elif self.else_case:
+            self._Run(rt, 'else_case', 0)
+
+    def Link(self, program):
+        then_case = self.then_case.Link(program)
+        else_case = self.else_case and self.else_case.Link(program)
+        if then_case is self.then_case and else_case is self.else_case:
+            return self
+        linked = copy.copy(self)
+        linked.then_case = then_case
+        linked.else_case = else_case
+        return linked
+
+    def Optimize(self, optimizer):
+        optimized = self._Optimized(optimizer, 'test_exp')
+        then_case = self.then_case.Optimize(optimizer)
+        else_case = self.else_case and self.else_case.Optimize(optimizer)
+        if then_case is self.then_case and else_case is self.else_case:
+            return optimized
+        if optimized is self:
+            optimized = copy.copy(self)
+        optimized.then_case = then_case
+        optimized.else_case = else_case
+        return optimized
+
+    def Resume(self, rt, nesting):
+        self._Run(rt, nesting[0], nesting[1], nesting[2:])
+
+    def _Run(self, rt, clause, index, nesting=()):
+        """Runs the statements of a clause, until one transfers control.
+
+        While each statement runs, its clause and index are added to
+        rt.nesting, so that the positions it finds with rt.Next (as GOSUB
+        does) are inside the clause.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+            clause (str): The clause, 'then_case' or 'else_case'.
+            index (int): The index of the statement to start at.
+            nesting (tuple): The rest of the position to start at, inside the
+                statement at the index, if it is inside one.
+        """
+        statements = getattr(self, clause).set
+        running = rt.nesting
+        running.append(clause)
+        running.append(index)
+        try:
+            if nesting:
+                statements[index].Resume(rt, nesting)
+                if rt.jump is not None or rt.stopped:
+                    return
+                index += 1
+            while index < len(statements):
+                running[-1] = index
+                statements[index].Evaluate(rt)
+                if rt.jump is not None or rt.stopped:
+                    return
+                index += 1
+        finally:
+            del running[-2:]
+
+    def __str__(self):
+        text = 'IF ' + str(self.test_exp) + ' THEN ' + str(self.then_case)
+        if self.else_case:
+            text += ' ELSE ' + str(self.else_case)
+        return text
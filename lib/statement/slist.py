@@ -0,0 +1,22 @@
+import sys
+
+import statement
+
+class SList(statement.Statement):
+    """A LIST statement, which shows the lines of the program."""
+
+    def __init__(self, line_range):
+        """Initializes the statement.
+
+        Args:
+            line_range (runtime.LineRange): The lines to show.
+        """
+        super(SList, self).__init__()
+        self.line_range = line_range
+
+    def Evaluate(self, rt):
+        for line_number, statement_set in rt.program.Range(self.line_range):
+            sys.stdout.write('%d %s\n' % (line_number, statement_set))
+
+    def __str__(self):
+        return ('LIST ' + str(self.line_range)).rstrip()
@@ -0,0 +1,33 @@
+from .. import exception
+import statement
+
+class SLoad(statement.Statement):
+    """A LOAD statement, which reads a program from a file in place of the one
+    in memory.
+
+    The file can be a text or a crunched program (see parser.Cruncher); which
+    one it is is found from its first bytes.
+    """
+
+    def __init__(self, exp):
+        """Initializes the statement.
+
+        Args:
+            exp (expression.Expression): The name of the file.
+        """
+        super(SLoad, self).__init__()
+        self.exp = exp
+
+    def Evaluate(self, rt):
+        name = self.exp.Evaluate(rt)
+        if not name.IsString():
+            raise exception.EvalException(exception.Error.ERR_TYPE)
+        if rt.files is None or not name.IsValidFilename():
+            raise exception.EvalException(exception.Error.ERR_FILE)
+        rt.files.Load(name.value)
+
+        # Loading a program from inside the program ends the run.
+        rt.stopped = True
+
+    def __str__(self):
+        return 'LOAD ' + str(self.exp)
@@ -0,0 +1,40 @@
+from .. import exception
+from .. import value
+import statement
+
+class SNext(statement.Statement):
+    """A NEXT statement, which ends the body of a FOR loop."""
+
+    def __init__(self, var=None):
+        """Initializes the statement.
+
+        Args:
+            var (expression.ELValue): The loop variable, if given.
+        """
+        super(SNext, self).__init__()
+        self.var = var
+
+    def Evaluate(self, rt):
+        # Find the loop, ending any loops inside it.
+        while rt.loops:
+            var, end, step, position = rt.loops[-1]
+            if self.var is None or var.id == self.var.id:
+                break
+            rt.loops.pop()
+        else:
+            raise exception.EvalException(exception.Error.ERR_NEXT)
+
+        count = float(var.EvaluateRaw(rt)) + step
+        var.Assign(rt, value.VFloat(count))
+        if (step >= 0 and count <= end) or (step < 0 and count >= end):
+            rt.Goto(*position)
+        else:
+            rt.loops.pop()
+
+    def Optimize(self, optimizer):
+        return self._Optimized(optimizer, 'var')
+
+    def __str__(self):
+        if self.var:
+            return 'NEXT ' + str(self.var)
+        return 'NEXT'
@@ -0,0 +1,10 @@
+import statement
+
+class SNull(statement.Statement):
+    """The empty statement, as on a blank line or after a trailing colon."""
+
+    def Evaluate(self, rt):
+        pass
+
+    def __str__(self):
+        return ''
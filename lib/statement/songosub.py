@@ -0,0 +1,14 @@
+import songoto
+
+class SOnGosub(songoto.SOnGoto):
+    """An ON GOSUB statement, which calls the subroutine picked by an index."""
+
+    def Evaluate(self, rt):
+        line_number = self.Target(rt)
+        if line_number is not None:
+            rt.gosubs.append(rt.Next())
+            rt.Goto(line_number)
+
+    def __str__(self):
+        return ('ON ' + str(self.exp) + ' GOSUB ' +
+                ', '.join(str(exp) for exp in self.exps))
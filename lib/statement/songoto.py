@@ -0,0 +1,76 @@
+import copy
+
+from .. import exception
+from .. import expression
+import statement
+
+class SOnGoto(statement.Statement):
+    """An ON GOTO statement, which goes to the line picked by an index."""
+
+    # The lines to go to, once linked, if they are all constant.
+    targets = None
+
+    def __init__(self, exp, exps):
+        """Initializes the statement.
+
+        Args:
+            exp (expression.Expression): The index, from 1, of the line to go
+                to.
+            exps (list of expression.Expression): The line numbers.
+        """
+        super(SOnGoto, self).__init__()
+        self.exp = exp
+        self.exps = exps
+
+    def Evaluate(self, rt):
+        line_number = self.Target(rt)
+        if line_number is not None:
+            rt.Goto(line_number)
+
+    def Link(self, program):
+        targets = [program.Target(exp) for exp in self.exps]
+        if None in targets:
+            return self
+        linked = copy.copy(self)
+        linked.targets = targets
+        return linked
+
+    def Optimize(self, optimizer):
+        optimized = self._Optimized(optimizer, 'exp')
+        exps = [optimizer.Optimize(exp) for exp in self.exps]
+        if all(new is exp for new, exp in zip(exps, self.exps)):
+            return optimized
+        if optimized is self:
+            optimized = copy.copy(self)
+        optimized.exps = exps
+        return optimized
+
+    def Target(self, rt):
+        """Returns the line picked by the index.
+
+        An index of 0, or past the end of the list, picks no line, and the
+        program carries on with the next statement.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Returns:
+            int: The line number, or None if no line is picked.
+
+        Raises:
+            exception.EvalException if the index is negative or over 255, or a
+            value is not numeric.
+        """
+        index = int(expression.RequireNumber(self.exp.EvaluateRaw(rt)))
+        if not 0 <= index <= 255:
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+        if not 0 < index <= len(self.exps):
+            return None
+        if self.targets is not None:
+            return self.targets[index - 1]
+        return int(expression.RequireNumber(
+            self.exps[index - 1].EvaluateRaw(rt)))
+
+    def __str__(self):
+        return ('ON ' + str(self.exp) + ' GOTO ' +
+                ', '.join(str(exp) for exp in self.exps))
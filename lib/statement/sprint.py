@@ -0,0 +1,108 @@
+import copy
+import sys
+
+from .. import exception
+import statement
+
+_INF = float('inf')
+
+class SPrint(statement.Statement):
+    """A PRINT statement."""
+
+    # What can follow each item: nothing, so that the line ends; a semicolon,
+    # so that the next item follows directly; or a comma, so that the next
+    # item starts in the next print zone.  See parser.print_item.
+    FINAL = 1
+    SEMICOLON = 2
+    COMMA = 3
+
+    # The width of each print zone, for items separated by commas.
+    ZONE_WIDTH = 14
+
+    # The column of the cursor, as far as PRINT knows.
+    column = 0
+
+    def __init__(self, items):
+        """Initializes the statement.
+
+        Args:
+            items (list of parser.PrintItem): The items to print.
+        """
+        super(SPrint, self).__init__()
+        self.items = items
+
+    def Evaluate(self, rt):
+        if not self.items:
+            self.PrintValue('', self.FINAL)
+        for item in self.items:
+            self.PrintValue(item.exp.EvaluateRaw(rt), item.type)
+
+    @classmethod
+    def Format(cls, val):
+        """Formats a value the way PRINT shows it.
+
+        Numbers are followed by a space, and preceded by one unless they are
+        negative; whole floating-point numbers are shown without a fraction.
+
+        Args:
+            val (int, float or str): The value to format.
+
+        Returns:
+            str: The text to print.
+
+        Raises:
+            exception.EvalException if the number is infinite or not a number.
+        """
+        if isinstance(val, str):
+            return val
+        elif val is None:
+            return ''
+        if isinstance(val, float):
+            if val != val or val in (_INF, -_INF):
+                raise exception.EvalException(exception.Error.ERR_OVERFLOW)
+            if abs(val) < 1e15 and val == int(val):
+                val = int(val)
+        text = str(val)
+        if val >= 0:
+            return ' ' + text + ' '
+        return text + ' '
+
+    def Optimize(self, optimizer):
+        items = []
+        for item in self.items:
+            exp = optimizer.Optimize(item.exp)
+            if exp is not item.exp:
+                item = copy.copy(item)
+                item.exp = exp
+            items.append(item)
+        if all(new is item for new, item in zip(items, self.items)):
+            return self
+        optimized = copy.copy(self)
+        optimized.items = items
+        return optimized
+
+    @classmethod
+    def PrintValue(cls, val, type):
+        """Prints a single item.
+
+        Args:
+            val (int, float or str): The value of the item.
+            type (int): What follows the item (FINAL, SEMICOLON or COMMA).
+        """
+        text = cls.Format(val)
+        if type == cls.FINAL:
+            sys.stdout.write(text + '\n')
+            cls.column = 0
+            return
+
+        cls.column += len(text)
+        if type == cls.COMMA:
+            pad = cls.ZONE_WIDTH - cls.column % cls.ZONE_WIDTH
+            text += ' ' * pad
+            cls.column += pad
+        sys.stdout.write(text)
+
+    def __str__(self):
+        if not self.items:
+            return 'PRINT'
+        return 'PRINT ' + ' '.join(str(item) for item in self.items)
@@ -0,0 +1,13 @@
+from .. import exception
+import statement
+
+class SReturn(statement.Statement):
+    """A RETURN statement, which returns from a subroutine."""
+
+    def Evaluate(self, rt):
+        if not rt.gosubs:
+            raise exception.EvalException(exception.Error.ERR_RETURN)
+        rt.Goto(*rt.gosubs.pop())
+
+    def __str__(self):
+        return 'RETURN'
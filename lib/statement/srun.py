@@ -0,0 +1,30 @@
+from .. import expression
+import statement
+
+class SRun(statement.Statement):
+    """A RUN statement, which runs the program from the start or a line."""
+
+    def __init__(self, exp=None):
+        """Initializes the statement.
+
+        Args:
+            exp (expression.Expression): The line number to start at, if any.
+        """
+        super(SRun, self).__init__()
+        self.exp = exp
+
+    def Evaluate(self, rt):
+        line_number = None
+        if self.exp:
+            line_number = int(expression.RequireNumber(
+                self.exp.EvaluateRaw(rt)))
+        rt.Reset()
+        rt.engine.Run(rt, line_number)
+
+        # Running the program from inside the program ends the outer run.
+        rt.stopped = True
+
+    def __str__(self):
+        if self.exp:
+            return 'RUN ' + str(self.exp)
+        return 'RUN'
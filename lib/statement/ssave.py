@@ -0,0 +1,33 @@
+from .. import exception
+import statement
+
+class SSave(statement.Statement):
+    """A SAVE statement, which writes the program to a file.
+
+    As with GW-BASIC, the program is saved crunched (see parser.Cruncher),
+    unless it is asked for as text, with SAVE "NAME",A.
+    """
+
+    def __init__(self, exp, text=False):
+        """Initializes the statement.
+
+        Args:
+            exp (expression.Expression): The name of the file.
+            text (bool): Whether to save the program as text.
+        """
+        super(SSave, self).__init__()
+        self.exp = exp
+        self.text = text
+
+    def Evaluate(self, rt):
+        name = self.exp.Evaluate(rt)
+        if not name.IsString():
+            raise exception.EvalException(exception.Error.ERR_TYPE)
+        if rt.files is None or not name.IsValidFilename():
+            raise exception.EvalException(exception.Error.ERR_FILE)
+        rt.files.Save(name.value, self.text)
+
+    def __str__(self):
+        if self.text:
+            return 'SAVE %s,A' % self.exp
+        return 'SAVE ' + str(self.exp)
@@ -0,0 +1,14 @@
+import sys
+
+import statement
+
+class SStop(statement.Statement):
+    """A STOP statement, which ends the program with a message."""
+
+    def Evaluate(self, rt):
+        if rt.line_number is not None:
+            sys.stdout.write('Break in %d\n' % rt.line_number)
+        rt.stopped = True
+
+    def __str__(self):
+        return 'STOP'
@@ -0,0 +1,115 @@
+import copy
+
+from .. import exception
+
+class Statement(object):
+    """The base class for all statements."""
+
+    def __init__(self):
+        pass
+
+    def Evaluate(self, rt):
+        """Executes the statement in the given runtime environment.
+
+        Statements that transfer control do so through the runtime (see
+        runtime.Runtime.Goto), rather than running anything themselves.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Raises:
+            exception.EvalException if the statement fails.
+        """
+        raise exception.EvalException(exception.Error.ERR_INTERNAL)
+
+    def Link(self, program):
+        """Resolves what the statement can of the program before it runs.
+
+        This is done once for each version of the program (see
+        runtime.Program.Link).  Statements that jump to constant line numbers
+        look them up here rather than each time they run.
+
+        Args:
+            program (runtime.Program): The program the statement is part of.
+
+        Returns:
+            statement.Statement: The statement itself, or a linked copy of it.
+
+        Raises:
+            exception.EvalException if the statement goes to a line that is not
+            in the program.
+        """
+        return self
+
+    def Optimize(self, optimizer):
+        """Simplifies the expressions of the statement before it runs.
+
+        This is done along with Link, once for each version of the program, so
+        that the program keeps the statements as they were read, for LIST.
+        The optimizer also gives the variables it is passed their slots (see
+        expression.Optimizer), so every variable that the engines find by slot
+        must be passed to it, even one that cannot be simplified.
+
+        Args:
+            optimizer (expression.Optimizer): The optimizer.
+
+        Returns:
+            statement.Statement: The statement itself, or a simplified copy of
+            it.
+        """
+        return self
+
+    def Resume(self, rt, nesting):
+        """Continues running the statement from a position inside it.
+
+        Only IF has statements inside it, so only IF has such positions (see
+        runtime.Runtime); the program goes back to one when RETURN returns to
+        a GOSUB inside an IF, for example.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+            nesting (tuple): The rest of the position, after the line number
+                and the index of the statement.
+        """
+        raise exception.EvalException(exception.Error.ERR_INTERNAL)
+
+    def Validate(self, rt):
+        """Checks that the statement can be run in the given environment.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Returns:
+            statement.Statement: The statement itself, ready to be evaluated.
+        """
+        return self
+
+    def _Optimized(self, optimizer, *names):
+        """Optimizes the expressions in some attributes of the statement.
+
+        Args:
+            optimizer (expression.Optimizer): The optimizer.
+            names (str): The names of the attributes.  Those that are None
+                are skipped.
+
+        Returns:
+            statement.Statement: The statement itself, if none of the
+            expressions changed, or a copy of it with the simplified ones.
+        """
+        changed = []
+        for name in names:
+            exp = getattr(self, name)
+            if exp is not None:
+                optimized = optimizer.Optimize(exp)
+                if optimized is not exp:
+                    changed.append((name, optimized))
+        if not changed:
+            return self
+        optimized = copy.copy(self)
+        for name, exp in changed:
+            setattr(optimized, name, exp)
+        return optimized
+
+    def __str__(self):
+        """Constructs a string representation of the statement."""
+        raise exception.EvalException(exception.Error.ERR_INTERNAL)
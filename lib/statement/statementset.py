@@ -0,0 +1,59 @@
+class StatementSet(object):
+    """The statements of a single line, separated by colons."""
+
+    def __init__(self, statements):
+        """Initializes the set.
+
+        Args:
+            statements (list of statement.Statement): The statements.
+        """
+        self.set = statements
+
+    def Evaluate(self, rt):
+        """Executes the statements in order, until one transfers control.
+
+        This is used for the statements of IF and for direct mode; the lines
+        of a running program are stepped through by the engine itself.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+        """
+        for statement in self.set:
+            statement.Evaluate(rt)
+            if rt.jump is not None or rt.stopped:
+                return
+
+    def Link(self, program):
+        """Links the statements of the set (see statement.Statement.Link).
+
+        Args:
+            program (runtime.Program): The program the set is part of.
+
+        Returns:
+            statement.StatementSet: The set itself, or a linked copy of it if
+            any of its statements were linked.
+        """
+        statements = [stmt.Link(program) for stmt in self.set]
+        if all(linked is stmt for linked, stmt in zip(statements, self.set)):
+            return self
+        return StatementSet(statements)
+
+    def Optimize(self, optimizer):
+        """Optimizes the statements of the set (see
+        statement.Statement.Optimize).
+
+        Args:
+            optimizer (expression.Optimizer): The optimizer.
+
+        Returns:
+            statement.StatementSet: The set itself, or a copy of it if any of
+            its statements were simplified.
+        """
+        statements = [stmt.Optimize(optimizer) for stmt in self.set]
+        if all(optimized is stmt
+               for optimized, stmt in zip(statements, self.set)):
+            return self
+        return StatementSet(statements)
+
+    def __str__(self):
+        return ' : '.join(str(statement) for statement in self.set)
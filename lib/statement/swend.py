@@ -0,0 +1,13 @@
+from .. import exception
+import statement
+
+class SWend(statement.Statement):
+    """A WEND statement, which goes back to test the condition of its WHILE."""
+
+    def Evaluate(self, rt):
+        if not rt.whiles:
+            raise exception.EvalException(exception.Error.ERR_WEND)
+        rt.Goto(*rt.whiles.pop())
+
+    def __str__(self):
+        return 'WEND'
@@ -0,0 +1,46 @@
+from .. import exception
+from .. import expression
+import statement
+import swend
+
+class SWhile(statement.Statement):
+    """A WHILE statement, which starts a conditional loop."""
+
+    # The position after the end of the loop, once linked (see
+    # runtime.Program.Link), or None if it must be searched for.
+    exit = None
+
+    def __init__(self, exp):
+        """Initializes the statement.
+
+        Args:
+            exp (expression.Expression): The condition.
+        """
+        super(SWhile, self).__init__()
+        self.exp = exp
+
+    def Evaluate(self, rt):
+        if expression.RequireNumber(self.exp.EvaluateRaw(rt)) != 0:
+            rt.whiles.append(rt.Here())
+        else:
+            self.Skip(rt)
+
+    def Optimize(self, optimizer):
+        return self._Optimized(optimizer, 'exp')
+
+    def Skip(self, rt):
+        """Goes to the statement after the end of the loop.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+
+        Raises:
+            exception.EvalException if the loop has no end.
+        """
+        if self.exit is not None:
+            rt.Goto(*self.exit)
+        else:
+            rt.Skip(SWhile, swend.SWend, exception.Error.ERR_WHILE)
+
+    def __str__(self):
+        return 'WHILE ' + str(self.exp)
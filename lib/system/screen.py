@@ -3,8 +3,52 @@ import sys
 class Screen:
     """Abstracts over the notion of a terminal-based output display."""
 
-    def __init__(self):
-        pass
+    def __init__(self, line_class):
+        """Initializes an empty screen.
+
+        Args:
+            line_class (class): The class holding each line of the screen,
+                normally parser.TokenLine.  Each line keeps its tokens up to
+                date as it is edited, so that finishing a line never has to
+                tokenize it from scratch.
+        """
+        self.line_class = line_class
+        self.lines = [line_class()]
+        self.row = 0     # the row of the cursor
+        self.column = 0  # the column of the cursor
+
+    def Send(self, ch):
+        """Handles a single keystroke typed at the screen.
+
+        Args:
+            ch (str): The key pressed.
+
+        Returns:
+            parser.TokenLine: The line just completed, or None.
+        """
+        line = self.lines[self.row]
+
+        if ch == '\r' or ch == '\n':
+            sys.stdout.write('\n')
+            self.row += 1
+            self.column = 0
+            if self.row == len(self.lines):
+                self.lines.append(self.line_class())
+            return line
+
+        elif ch == '\b' or ch == '\x7f':
+            if self.column > 0:
+                sys.stdout.write('\b \b')
+                line.Delete(self.column - 1, self.column)
+                self.column -= 1
+
+        elif ch >= ' ':
+            sys.stdout.write(ch)
+            line.Insert(self.column, ch)
+            self.column += 1
+
+        sys.stdout.flush()
+        return None
 
     def WriteLn(self, *args):
         for arg in args:
@@ -1,5 +1,8 @@
+from arrayvalue import ArrayValue
 from value import Value
 from vfloat import VFloat
+from vfunction import VFunction
 from vint import VInt
 from vnull import VNull
+from vstring import VRope
 from vstring import VString
@@ -0,0 +1,112 @@
+import array
+
+from .. import exception
+import value
+import vfloat
+import vint
+import vstring
+
+class ArrayValue(object):
+    """The elements of an array variable, as made by DIM.
+
+    The elements are kept in a single flat sequence, in row-major order, and
+    the subscripts are turned into a position in it with strides worked out
+    when the array is made.  Numeric arrays are typed arrays of plain numbers
+    ('l' for integers, 'd' for floating-point), at 8 bytes an element, and are
+    only wrapped in value.Value objects as elements are read; string arrays
+    are lists of the value.VString objects themselves.
+    """
+
+    __slots__ = ('type', 'dims', 'strides', 'data')
+
+    # The typecodes of the typed arrays for the numeric types.
+    TYPECODES = {
+        value.Value.INT:   'l',
+        value.Value.FLOAT: 'd',
+    }
+
+    # The class of the elements of each type.
+    CLASSES = {
+        value.Value.INT:   vint.VInt,
+        value.Value.FLOAT: vfloat.VFloat,
+    }
+
+    def __init__(self, type, dims):
+        """Initializes the array, with every element zero or empty.
+
+        Args:
+            type (int): The type of the elements (value.Value.INT, etc.).
+            dims (list of int): The number of elements along each dimension.
+
+        Raises:
+            exception.EvalException if a dimension is not positive.
+        """
+        if not dims or min(dims) < 1:
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+        self.type = type
+        self.dims = tuple(dims)
+
+        # The stride of the last subscript is 1, and of each one before it,
+        # the number of elements spanned by one step of it.
+        strides = [1] * len(dims)
+        for i in range(len(dims) - 1, 0, -1):
+            strides[i - 1] = strides[i] * dims[i]
+        self.strides = tuple(strides)
+
+        size = strides[0] * dims[0]
+        if type == value.Value.STRING:
+            self.data = [vstring.VString('')] * size
+        else:
+            self.data = array.array(self.TYPECODES[type], [0]) * size
+
+    def Get(self, indices):
+        """Returns the element at the given subscripts.
+
+        Args:
+            indices (list of int): The subscripts.
+
+        Returns:
+            value.Value: The element.
+
+        Raises:
+            exception.EvalException if the subscripts are out of range.
+        """
+        val = self.data[self._Offset(indices)]
+        if self.type == value.Value.STRING:
+            return val
+        return self.CLASSES[self.type](val)
+
+    def Set(self, indices, val):
+        """Stores an element at the given subscripts.
+
+        Args:
+            indices (list of int): The subscripts.
+            val (value.Value): The value, already of the type of the array.
+
+        Raises:
+            exception.EvalException if the subscripts are out of range, or the
+            value does not fit in an integer array.
+        """
+        offset = self._Offset(indices)
+        if self.type == value.Value.STRING:
+            self.data[offset] = val
+        else:
+            try:
+                self.data[offset] = val.value
+            except OverflowError:
+                raise exception.EvalException(exception.Error.ERR_RANGE)
+
+    def _Offset(self, indices):
+        """Returns the position in the data of the element at some subscripts.
+
+        Raises:
+            exception.EvalException if the subscripts are out of range.
+        """
+        if len(indices) != len(self.dims):
+            raise exception.EvalException(exception.Error.ERR_RANGE)
+        offset = 0
+        for index, dim, stride in zip(indices, self.dims, self.strides):
+            if not 0 <= index < dim:
+                raise exception.EvalException(exception.Error.ERR_RANGE)
+            offset += index * stride
+        return offset
@@ -5,8 +5,15 @@ class Value(object):
     
     These values are generated by the evaluation of expression.Expression
     objects.
+
+    Values are immutable once built, which lets them be shared freely: the
+    subclasses hand out shared instances for the most common values (small
+    integers, the empty string and the null value) instead of building new
+    ones.
     """
 
+    __slots__ = ('value',)
+
     # These type constants are used by statement.StatementAssignment and
     # expression.EFn.
     INT    = 1
@@ -14,9 +21,17 @@ class Value(object):
     STRING = 3
     NULL   = 4
 
-    def __init__(self, value):
-        """Initializes with some arbitrary bit of data."""
-        self.value = value
+    def __new__(cls, value=None):
+        """Builds a value holding some arbitrary bit of data."""
+        self = object.__new__(cls)
+        object.__setattr__(self, 'value', value)
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError('values are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('values are immutable')
     
     def Type(self):
         """Returns the type of this value (INT, etc.)."""
@@ -1,10 +1,10 @@
+from .. import exception
 import value
 
 class VFloat(value.Value):
     """The type of value that represents a float."""
 
-    def __init__(self, value):
-        super(VFloat, self).__init__(value)
+    __slots__ = ()
 
     def Type(self):
         return value.Value.FLOAT
@@ -13,7 +13,10 @@ class VFloat(value.Value):
         return True
 
     def AsInt(self):
-        return int(self.value)
+        try:
+            return int(self.value)
+        except (OverflowError, ValueError):
+            raise exception.EvalException(exception.Error.ERR_OVERFLOW)
 
     def AsFloat(self):
         return self.value
@@ -0,0 +1,68 @@
+from .. import exception
+import value
+
+class VFunction(value.Value):
+    """The value of an FN function, as defined by DEF FN.
+
+    A call does not get an environment of its own.  Instead, the arguments
+    are stored in the slots of the formals in the calling environment for the
+    length of the call, and whatever those slots held is put back afterwards,
+    so that the formals shadow the variables of the same name and nothing
+    else.  The body sees every other variable as the caller does, and the
+    only thing allocated for a call is the list of the values put aside.
+    """
+
+    __slots__ = ('var', 'formals', 'top')
+
+    def __new__(cls, var, formals, exp):
+        """Builds a function value.
+
+        Args:
+            var (expression.ELValue): The name of the function, which gives
+                the type of its result.
+            formals (list of expression.ELValue): The formals.
+            exp (expression.Expression): The body of the function.
+        """
+        self = value.Value.__new__(cls, exp)
+        object.__setattr__(self, 'var', var)
+        object.__setattr__(self, 'formals', tuple(formals))
+        object.__setattr__(self, 'top', max(
+            [formal.slot for formal in formals] or [-1]))
+        return self
+
+    def Call(self, rt, args):
+        """Calls the function.
+
+        Args:
+            rt (runtime.Runtime): The current runtime environment.
+            args (list of value.Value): The arguments.
+
+        Returns:
+            value.Value: The result, converted to the type of the function.
+
+        Raises:
+            exception.EvalException if the number or types of the arguments
+            are wrong.
+        """
+        formals = self.formals
+        if len(args) != len(formals):
+            raise exception.EvalException(exception.Error.ERR_ARGS)
+        scalars = rt.env.scalars
+        if self.top >= len(scalars):
+            rt.env.Reserve()
+
+        # Convert every argument before binding any, so that a bad one leaves
+        # the slots untouched.
+        bound = [(formal.slot, formal.Convert(arg))
+                 for formal, arg in zip(formals, args)]
+        saved = [(slot, scalars[slot]) for slot, _ in bound]
+        for slot, arg in bound:
+            scalars[slot] = arg
+        try:
+            return self.var.Convert(self.value.Evaluate(rt))
+        finally:
+            for slot, val in saved:
+                scalars[slot] = val
+
+    def __str__(self):
+        return 'FN'
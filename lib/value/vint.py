@@ -1,10 +1,22 @@
 import value
 
 class VInt(value.Value):
-    """The type of value that represents an integer."""
+    """The type of value that represents an integer.
 
-    def __init__(self, value):
-        super(VInt, self).__init__(value)
+    The integers from SMALL_MIN to SMALL_MAX are built once, and shared: these
+    cover the truth values (-1 and 0) and most loop counters and subscripts.
+    """
+
+    __slots__ = ()
+
+    # The range of integers that are shared.
+    SMALL_MIN = -128
+    SMALL_MAX = 1023
+
+    def __new__(cls, val):
+        if type(val) is int and VInt.SMALL_MIN <= val <= VInt.SMALL_MAX:
+            return _SMALL[val - VInt.SMALL_MIN]
+        return value.Value.__new__(cls, val)
 
     def Type(self):
         return value.Value.INT
@@ -17,3 +29,8 @@ class VInt(value.Value):
 
     def AsFloat(self):
         return float(self.value)
+
+
+# The shared small integers.
+_SMALL = tuple(value.Value.__new__(VInt, i)
+               for i in range(VInt.SMALL_MIN, VInt.SMALL_MAX + 1))
@@ -4,10 +4,13 @@ class VNull(value.Value):
     """The null value, generated only for empty items in DATA statements.
     
     For the convenience of the user, a null value is both numeric and a string.
+    There is only one null value, which every VNull() returns.
     """
 
-    def __init__(self):
-        super(VNull, self).__init__(None)
+    __slots__ = ()
+
+    def __new__(cls):
+        return _NULL
 
     def Type(self):
         return value.Value.NULL
@@ -32,3 +35,7 @@ class VNull(value.Value):
 
     def AsString(self):
         return ""
+
+
+# The null value.
+_NULL = value.Value.__new__(VNull, None)
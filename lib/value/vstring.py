@@ -4,10 +4,21 @@ from .. import exception
 import value
 
 class VString(value.Value):
-    """The type of value that represents a string."""
+    """The type of value that represents a string.
 
-    def __init__(self, value):
-        super(VString, self).__init__(value)
+    The empty string is built once, and shared.
+    """
+
+    __slots__ = ()
+
+    # The shortest result of Concat that is built as a VRope rather than
+    # copied; shorter strings are cheaper to copy than to keep in pieces.
+    ROPE_MIN = 256
+
+    def __new__(cls, val):
+        if val == '':
+            return _EMPTY
+        return value.Value.__new__(cls, val)
 
     def Type(self):
         return value.Value.STRING
@@ -32,6 +43,24 @@ class VString(value.Value):
     def AsString(self):
         return self.value
 
+    def Concat(self, text):
+        """Returns this string followed by another.
+
+        Long results are built as VRope objects, so that appending to a string
+        over and over again costs time in proportion to the final length,
+        rather than to its square.
+
+        Args:
+            text (str): The string to append.
+
+        Returns:
+            VString: The result.
+        """
+        val = self.value
+        if len(val) + len(text) < self.ROPE_MIN:
+            return VString(val + text)
+        return VRope([val, text], 2)
+
     def IsValidFilename(self):
         """Checks whether this string represents a valid filename."""
         # Check the length first.
@@ -48,3 +77,55 @@ class VString(value.Value):
 
         # It must be okay!
         return True
+
+
+class VRope(VString):
+    """A string built by appending, kept in pieces until it is needed whole.
+
+    The pieces are in a list that can be shared with other VRope objects, each
+    of which is the string made by joining some number of the pieces at the
+    start of the list.  Appending to the VRope that covers the whole list just
+    adds to the list, and makes a new VRope covering one more piece; the old
+    one still covers the same pieces, so it never changes.  Appending to any
+    other VRope starts a new list.
+
+    The pieces are joined when the value is first read, and the result kept
+    as the only piece of a new list, so that reading the string after every
+    append joins the pieces added since the last read, not all of them.
+    """
+
+    __slots__ = ('_pieces', '_count', '_joined')
+
+    def __new__(cls, pieces, count):
+        """Builds the string made of the first pieces of a list.
+
+        Args:
+            pieces (list of str): The pieces.
+            count (int): How many of them make up the string.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, '_pieces', pieces)
+        object.__setattr__(self, '_count', count)
+        object.__setattr__(self, '_joined', None)
+        return self
+
+    @property
+    def value(self):
+        joined = self._joined
+        if joined is None:
+            joined = ''.join(self._pieces[:self._count])
+            object.__setattr__(self, '_joined', joined)
+            object.__setattr__(self, '_pieces', [joined])
+            object.__setattr__(self, '_count', 1)
+        return joined
+
+    def Concat(self, text):
+        pieces = self._pieces
+        if len(pieces) != self._count:
+            pieces = [self.value]
+        pieces.append(text)
+        return VRope(pieces, len(pieces))
+
+
+# The shared empty string.
+_EMPTY = value.Value.__new__(VString, '')